@@ -15,6 +15,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from app.config import settings
 from app.db.base import Base
+from app.db.session import MIGRATION_CONNECT_ARGS
 
 # Import all models to ensure they're registered with Base
 from app.models import user, product, campaign, content, workflow, analytics, bonus, team
@@ -22,8 +23,8 @@ from app.models import user, product, campaign, content, workflow, analytics, bo
 # this is the Alembic Config object
 config = context.config
 
-# Interpret the config file for Python logging
-if config.config_file_name is not None:
+# Interpret the config file for Python logging (skipped when run from the app)
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
     fileConfig(config.config_file_name)
 
 # Set SQLAlchemy URL from settings
@@ -57,12 +58,13 @@ def do_run_migrations(connection: Connection) -> None:
 async def run_async_migrations() -> None:
     """Run migrations in 'online' mode with async support."""
     configuration = config.get_section(config.config_ini_section)
-    configuration["sqlalchemy.url"] = settings.DATABASE_URL.replace("+asyncpg", "")
+    configuration["sqlalchemy.url"] = settings.DATABASE_URL
 
     connectable = async_engine_from_config(
         configuration,
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
+        connect_args=MIGRATION_CONNECT_ARGS,
     )
 
     async with connectable.connect() as connection:
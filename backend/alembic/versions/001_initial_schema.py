@@ -10,6 +10,7 @@ from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
 from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateTable
 
 # revision identifiers, used by Alembic.
 revision: str = '001'
@@ -17,197 +18,215 @@ down_revision: Union[str, None] = None
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# CREATE INDEX CONCURRENTLY cannot run inside a transaction block, so these
+# are executed in an autocommit block after the tables have been created
+SECONDARY_INDEXES = (
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_email ON users (email)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_status ON users (status)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_tier ON users (tier)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_products_category ON products (category)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_products_gravity ON products (gravity)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_campaigns_user_id ON campaigns (user_id)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_campaigns_product_id ON campaigns (product_id)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_campaigns_status ON campaigns (status)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_content_user_id ON content (user_id)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_content_campaign_id ON content (campaign_id)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_content_type ON content (type)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_content_status ON content (status)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_workflows_user_id ON workflows (user_id)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_workflows_status ON workflows (status)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_analytics_user_id ON analytics_events (user_id)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_analytics_campaign_id ON analytics_events (campaign_id)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_analytics_event_type ON analytics_events (event_type)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_analytics_created_at ON analytics_events (created_at)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_bonuses_campaign_id ON bonuses (campaign_id)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_teams_owner_id ON teams (owner_id)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_team_members_team_id ON team_members (team_id)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_team_members_user_id ON team_members (user_id)",
+)
+
+# Table definitions are compiled to DDL and sent in a single round-trip
+metadata = sa.MetaData()
+
+# users table
+sa.Table('users', metadata,
+    sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('email', sa.String(length=255), nullable=False),
+    sa.Column('password_hash', sa.String(length=255), nullable=False),
+    sa.Column('full_name', sa.String(length=255), nullable=True),
+    sa.Column('tier', sa.String(length=50), nullable=False),
+    sa.Column('stripe_customer_id', sa.String(length=255), nullable=True),
+    sa.Column('stripe_subscription_id', sa.String(length=255), nullable=True),
+    sa.Column('status', sa.String(length=50), nullable=False),
+    sa.Column('trial_ends_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('is_email_verified', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('email')
+)
+
+# products table
+sa.Table('products', metadata,
+    sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('clickbank_id', sa.String(length=100), nullable=False),
+    sa.Column('title', sa.String(length=500), nullable=False),
+    sa.Column('vendor', sa.String(length=255), nullable=False),
+    sa.Column('category', sa.String(length=255), nullable=True),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('commission_rate', sa.Numeric(precision=5, scale=2), nullable=True),
+    sa.Column('commission_amount', sa.Numeric(precision=10, scale=2), nullable=True),
+    sa.Column('initial_sale_amount', sa.Numeric(precision=10, scale=2), nullable=True),
+    sa.Column('gravity', sa.Numeric(precision=10, scale=2), nullable=True),
+    sa.Column('refund_rate', sa.Numeric(precision=5, scale=2), nullable=True),
+    sa.Column('rebill', sa.Boolean(), nullable=True),
+    sa.Column('popularity_rank', sa.Integer(), nullable=True),
+    sa.Column('data_snapshot', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('last_updated', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('clickbank_id')
+)
+
+# campaigns table
+sa.Table('campaigns', metadata,
+    sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('product_id', postgresql.UUID(as_uuid=True), nullable=True),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('status', sa.String(length=50), nullable=False),
+    sa.Column('funnel_type', sa.String(length=100), nullable=True),
+    sa.Column('affiliate_link', sa.Text(), nullable=True),
+    sa.Column('tracking_id', sa.String(length=50), nullable=True),
+    sa.Column('settings', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['product_id'], ['products.id'], ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('tracking_id')
+)
+
+# content table
+sa.Table('content', metadata,
+    sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('campaign_id', postgresql.UUID(as_uuid=True), nullable=True),
+    sa.Column('type', sa.String(length=50), nullable=False),
+    sa.Column('title', sa.String(length=500), nullable=True),
+    sa.Column('body', sa.Text(), nullable=False),
+    sa.Column('metadata', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('status', sa.String(length=50), nullable=False),
+    sa.Column('published_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('scheduled_for', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['campaign_id'], ['campaigns.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+)
+
+# workflows table
+sa.Table('workflows', metadata,
+    sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('trigger_type', sa.String(length=100), nullable=False),
+    sa.Column('trigger_config', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('actions', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('conditions', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('status', sa.String(length=50), nullable=False),
+    sa.Column('last_run_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('next_run_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+)
+
+# analytics_events table
+sa.Table('analytics_events', metadata,
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('campaign_id', postgresql.UUID(as_uuid=True), nullable=True),
+    sa.Column('event_type', sa.String(length=50), nullable=False),
+    sa.Column('source', sa.String(length=255), nullable=True),
+    sa.Column('metadata', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('revenue', sa.Numeric(precision=10, scale=2), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['campaign_id'], ['campaigns.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+)
+
+# bonuses table
+sa.Table('bonuses', metadata,
+    sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('campaign_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('file_url', sa.String(length=500), nullable=True),
+    sa.Column('delivery_method', sa.String(length=50), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('metadata', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('delivered_count', sa.Integer(), nullable=True),
+    sa.Column('last_delivered_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['campaign_id'], ['campaigns.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+)
+
+# teams table
+sa.Table('teams', metadata,
+    sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('owner_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('settings', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['owner_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+)
+
+# team_members table
+sa.Table('team_members', metadata,
+    sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('team_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('role', sa.String(length=50), nullable=False),
+    sa.Column('permissions', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['team_id'], ['teams.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('team_id', 'user_id', name='uq_team_user')
+)
+
 
 def upgrade() -> None:
-    # Create users table
-    op.create_table('users',
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('email', sa.String(length=255), nullable=False),
-        sa.Column('password_hash', sa.String(length=255), nullable=False),
-        sa.Column('full_name', sa.String(length=255), nullable=True),
-        sa.Column('tier', sa.String(length=50), nullable=False),
-        sa.Column('stripe_customer_id', sa.String(length=255), nullable=True),
-        sa.Column('stripe_subscription_id', sa.String(length=255), nullable=True),
-        sa.Column('status', sa.String(length=50), nullable=False),
-        sa.Column('trial_ends_at', sa.DateTime(timezone=True), nullable=True),
-        sa.Column('is_email_verified', sa.Boolean(), nullable=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.PrimaryKeyConstraint('id'),
-        sa.UniqueConstraint('email')
-    )
-    op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=False)
-    op.create_index(op.f('ix_users_status'), 'users', ['status'], unique=False)
-    op.create_index(op.f('ix_users_tier'), 'users', ['tier'], unique=False)
-
-    # Create products table
-    op.create_table('products',
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('clickbank_id', sa.String(length=100), nullable=False),
-        sa.Column('title', sa.String(length=500), nullable=False),
-        sa.Column('vendor', sa.String(length=255), nullable=False),
-        sa.Column('category', sa.String(length=255), nullable=True),
-        sa.Column('description', sa.Text(), nullable=True),
-        sa.Column('commission_rate', sa.Numeric(precision=5, scale=2), nullable=True),
-        sa.Column('commission_amount', sa.Numeric(precision=10, scale=2), nullable=True),
-        sa.Column('initial_sale_amount', sa.Numeric(precision=10, scale=2), nullable=True),
-        sa.Column('gravity', sa.Numeric(precision=10, scale=2), nullable=True),
-        sa.Column('refund_rate', sa.Numeric(precision=5, scale=2), nullable=True),
-        sa.Column('rebill', sa.Boolean(), nullable=True),
-        sa.Column('popularity_rank', sa.Integer(), nullable=True),
-        sa.Column('data_snapshot', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
-        sa.Column('last_updated', sa.DateTime(timezone=True), nullable=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.PrimaryKeyConstraint('id'),
-        sa.UniqueConstraint('clickbank_id')
-    )
-    op.create_index(op.f('ix_products_category'), 'products', ['category'], unique=False)
-    op.create_index(op.f('ix_products_gravity'), 'products', ['gravity'], unique=False)
-
-    # Create campaigns table
-    op.create_table('campaigns',
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('product_id', postgresql.UUID(as_uuid=True), nullable=True),
-        sa.Column('name', sa.String(length=255), nullable=False),
-        sa.Column('status', sa.String(length=50), nullable=False),
-        sa.Column('funnel_type', sa.String(length=100), nullable=True),
-        sa.Column('affiliate_link', sa.Text(), nullable=True),
-        sa.Column('tracking_id', sa.String(length=50), nullable=True),
-        sa.Column('settings', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.ForeignKeyConstraint(['product_id'], ['products.id'], ondelete='SET NULL'),
-        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
-        sa.PrimaryKeyConstraint('id'),
-        sa.UniqueConstraint('tracking_id')
-    )
-    op.create_index(op.f('ix_campaigns_user_id'), 'campaigns', ['user_id'], unique=False)
-    op.create_index(op.f('ix_campaigns_product_id'), 'campaigns', ['product_id'], unique=False)
-    op.create_index(op.f('ix_campaigns_status'), 'campaigns', ['status'], unique=False)
-
-    # Create content table
-    op.create_table('content',
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('campaign_id', postgresql.UUID(as_uuid=True), nullable=True),
-        sa.Column('type', sa.String(length=50), nullable=False),
-        sa.Column('title', sa.String(length=500), nullable=True),
-        sa.Column('body', sa.Text(), nullable=False),
-        sa.Column('metadata', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
-        sa.Column('status', sa.String(length=50), nullable=False),
-        sa.Column('published_at', sa.DateTime(timezone=True), nullable=True),
-        sa.Column('scheduled_for', sa.DateTime(timezone=True), nullable=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.ForeignKeyConstraint(['campaign_id'], ['campaigns.id'], ondelete='CASCADE'),
-        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
-        sa.PrimaryKeyConstraint('id')
-    )
-    op.create_index(op.f('ix_content_user_id'), 'content', ['user_id'], unique=False)
-    op.create_index(op.f('ix_content_campaign_id'), 'content', ['campaign_id'], unique=False)
-    op.create_index(op.f('ix_content_type'), 'content', ['type'], unique=False)
-    op.create_index(op.f('ix_content_status'), 'content', ['status'], unique=False)
-
-    # Create workflows table
-    op.create_table('workflows',
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('name', sa.String(length=255), nullable=False),
-        sa.Column('trigger_type', sa.String(length=100), nullable=False),
-        sa.Column('trigger_config', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
-        sa.Column('actions', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
-        sa.Column('conditions', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
-        sa.Column('status', sa.String(length=50), nullable=False),
-        sa.Column('last_run_at', sa.DateTime(timezone=True), nullable=True),
-        sa.Column('next_run_at', sa.DateTime(timezone=True), nullable=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
-        sa.PrimaryKeyConstraint('id')
-    )
-    op.create_index(op.f('ix_workflows_user_id'), 'workflows', ['user_id'], unique=False)
-    op.create_index(op.f('ix_workflows_status'), 'workflows', ['status'], unique=False)
-
-    # Create analytics_events table
-    op.create_table('analytics_events',
-        sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
-        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('campaign_id', postgresql.UUID(as_uuid=True), nullable=True),
-        sa.Column('event_type', sa.String(length=50), nullable=False),
-        sa.Column('source', sa.String(length=255), nullable=True),
-        sa.Column('metadata', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
-        sa.Column('revenue', sa.Numeric(precision=10, scale=2), nullable=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.ForeignKeyConstraint(['campaign_id'], ['campaigns.id'], ondelete='CASCADE'),
-        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
-        sa.PrimaryKeyConstraint('id')
+    # One DO block executes all CREATE TABLE statements as a single statement
+    dialect = op.get_context().dialect
+    ddl = ";\n".join(
+        str(CreateTable(table).compile(dialect=dialect)).strip()
+        for table in metadata.sorted_tables
     )
-    op.create_index(op.f('ix_analytics_user_id'), 'analytics_events', ['user_id'], unique=False)
-    op.create_index(op.f('ix_analytics_campaign_id'), 'analytics_events', ['campaign_id'], unique=False)
-    op.create_index(op.f('ix_analytics_event_type'), 'analytics_events', ['event_type'], unique=False)
-    op.create_index(op.f('ix_analytics_created_at'), 'analytics_events', ['created_at'], unique=False)
-
-    # Create bonuses table
-    op.create_table('bonuses',
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('campaign_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('name', sa.String(length=255), nullable=False),
-        sa.Column('description', sa.Text(), nullable=True),
-        sa.Column('file_url', sa.String(length=500), nullable=True),
-        sa.Column('delivery_method', sa.String(length=50), nullable=True),
-        sa.Column('is_active', sa.Boolean(), nullable=True),
-        sa.Column('metadata', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
-        sa.Column('delivered_count', sa.Integer(), nullable=True),
-        sa.Column('last_delivered_at', sa.DateTime(timezone=True), nullable=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.ForeignKeyConstraint(['campaign_id'], ['campaigns.id'], ondelete='CASCADE'),
-        sa.PrimaryKeyConstraint('id')
-    )
-    op.create_index(op.f('ix_bonuses_campaign_id'), 'bonuses', ['campaign_id'], unique=False)
-
-    # Create teams table
-    op.create_table('teams',
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('owner_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('name', sa.String(length=255), nullable=False),
-        sa.Column('settings', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
-        sa.Column('is_active', sa.Boolean(), nullable=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.ForeignKeyConstraint(['owner_id'], ['users.id'], ondelete='CASCADE'),
-        sa.PrimaryKeyConstraint('id')
-    )
-    op.create_index(op.f('ix_teams_owner_id'), 'teams', ['owner_id'], unique=False)
-
-    # Create team_members table
-    op.create_table('team_members',
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('team_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('role', sa.String(length=50), nullable=False),
-        sa.Column('permissions', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
-        sa.Column('is_active', sa.Boolean(), nullable=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.ForeignKeyConstraint(['team_id'], ['teams.id'], ondelete='CASCADE'),
-        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
-        sa.PrimaryKeyConstraint('id'),
-        sa.UniqueConstraint('team_id', 'user_id', name='uq_team_user')
-    )
-    op.create_index(op.f('ix_team_members_team_id'), 'team_members', ['team_id'], unique=False)
-    op.create_index(op.f('ix_team_members_user_id'), 'team_members', ['user_id'], unique=False)
+    op.execute(f"DO $$\nBEGIN\n{ddl};\nEND\n$$")
+
+    # Secondary indexes are built outside the migration transaction so that
+    # CREATE INDEX CONCURRENTLY does not block writers during online redeploys
+    with op.get_context().autocommit_block():
+        for statement in SECONDARY_INDEXES:
+            op.execute(statement)
 
 
 def downgrade() -> None:
-    op.drop_table('team_members')
-    op.drop_table('teams')
-    op.drop_table('bonuses')
-    op.drop_table('analytics_events')
-    op.drop_table('workflows')
-    op.drop_table('content')
-    op.drop_table('campaigns')
-    op.drop_table('products')
-    op.drop_table('users')
+    op.execute(
+        "DROP TABLE " + ", ".join(
+            table.name for table in reversed(metadata.sorted_tables)
+        )
+    )
@@ -0,0 +1,46 @@
+"""Dashboard metrics indexes
+
+Revision ID: 002
+Revises: 001
+Create Date: 2025-02-03 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # Covering index so the dashboard click/conversion counts and revenue
+        # sum are answered with index-only scans
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_analytics_user_event_rev "
+            "ON analytics_events (user_id, event_type) INCLUDE (revenue)"
+        )
+        # Leading user_id column of the covering index makes this redundant
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_analytics_user_id")
+
+        # Partial index for the active campaigns count; the enum column
+        # stores member names, so the predicate must match 'ACTIVE'
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_campaigns_user_status "
+            "ON campaigns (user_id, status) WHERE status = 'ACTIVE'"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_campaigns_user_status")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_analytics_user_id "
+            "ON analytics_events (user_id)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_analytics_user_event_rev")
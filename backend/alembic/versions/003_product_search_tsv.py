@@ -0,0 +1,45 @@
+"""Product full-text search
+
+Revision ID: 003
+Revises: 002
+Create Date: 2025-02-05 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "ALTER TABLE products ADD COLUMN search_tsv tsvector "
+        "GENERATED ALWAYS AS (to_tsvector('english', "
+        "coalesce(title, '') || ' ' || coalesce(description, ''))) STORED"
+    )
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_products_search_tsv "
+            "ON products USING GIN (search_tsv)"
+        )
+        # Substring matches on title fall back to a trigram index
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_products_title_trgm "
+            "ON products USING GIN (title gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_products_title_trgm")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_products_search_tsv")
+
+    op.execute("ALTER TABLE products DROP COLUMN IF EXISTS search_tsv")
@@ -0,0 +1,36 @@
+"""Product filter and sort indexes
+
+Revision ID: 004
+Revises: 003
+Create Date: 2025-02-05 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Serve filter + ORDER BY gravity DESC + keyset pagination from one range scan
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_products_cat_gravity "
+            "ON products (category, gravity DESC NULLS LAST, id DESC) WHERE gravity IS NOT NULL"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_products_rebill_gravity "
+            "ON products (rebill, gravity DESC NULLS LAST, id DESC) WHERE gravity IS NOT NULL"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_products_rebill_gravity")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_products_cat_gravity")
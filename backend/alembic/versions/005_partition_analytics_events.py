@@ -0,0 +1,111 @@
+"""Partition analytics_events by month
+
+Requires a maintenance window: the existing rows are copied into the new
+partitioned table with a single INSERT ... SELECT inside the migration
+transaction, which holds locks on analytics_events for the whole copy and
+writes every row again. Stop event ingest before upgrading large tables.
+
+Revision ID: 005
+Revises: 004
+Create Date: 2025-02-10 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Creates one analytics_events partition per month in [from_month, to_month];
+# called here to backfill and by the scheduled partition maintenance task
+CREATE_PARTITIONS_FUNCTION = """
+CREATE OR REPLACE FUNCTION create_analytics_partitions(from_month date, to_month date)
+RETURNS void AS $$
+DECLARE
+    month_start date := date_trunc('month', from_month)::date;
+BEGIN
+    WHILE month_start <= to_month LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF analytics_events FOR VALUES FROM (%L) TO (%L)',
+            'analytics_events_' || to_char(month_start, 'YYYY_MM'),
+            month_start,
+            (month_start + interval '1 month')::date
+        );
+        month_start := (month_start + interval '1 month')::date;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    # Move the existing heap out of the way
+    op.execute("ALTER TABLE analytics_events RENAME TO analytics_events_old")
+    op.execute("ALTER TABLE analytics_events_old RENAME CONSTRAINT analytics_events_pkey TO analytics_events_old_pkey")
+
+    # Partition key must be part of the primary key
+    op.execute("""
+        CREATE TABLE analytics_events (
+            id BIGINT NOT NULL DEFAULT nextval('analytics_events_id_seq'),
+            user_id UUID NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+            campaign_id UUID REFERENCES campaigns (id) ON DELETE CASCADE,
+            event_type VARCHAR(50) NOT NULL,
+            source VARCHAR(255),
+            metadata JSONB,
+            revenue NUMERIC(10, 2),
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+    """)
+    op.execute("CREATE TABLE analytics_events_default PARTITION OF analytics_events DEFAULT")
+
+    op.execute(CREATE_PARTITIONS_FUNCTION)
+    op.execute("""
+        SELECT create_analytics_partitions(
+            coalesce((SELECT min(created_at) FROM analytics_events_old), now())::date,
+            (now() + interval '3 months')::date
+        )
+    """)
+
+    # One-shot copy; see the maintenance window note in the module docstring
+    op.execute("INSERT INTO analytics_events SELECT * FROM analytics_events_old")
+    op.execute("ALTER SEQUENCE analytics_events_id_seq OWNED BY analytics_events.id")
+    op.execute("DROP TABLE analytics_events_old")
+
+    # Indexes on the parent are created as local indexes on every partition
+    op.execute("CREATE INDEX ix_analytics_user_event_rev ON analytics_events (user_id, event_type) INCLUDE (revenue)")
+    op.execute("CREATE INDEX ix_analytics_campaign_id ON analytics_events (campaign_id)")
+    op.execute("CREATE INDEX ix_analytics_event_type ON analytics_events (event_type)")
+    op.execute("CREATE INDEX ix_analytics_created_at ON analytics_events (created_at)")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE analytics_events RENAME TO analytics_events_partitioned")
+    op.execute("""
+        CREATE TABLE analytics_events (
+            id BIGINT NOT NULL DEFAULT nextval('analytics_events_id_seq'),
+            user_id UUID NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+            campaign_id UUID REFERENCES campaigns (id) ON DELETE CASCADE,
+            event_type VARCHAR(50) NOT NULL,
+            source VARCHAR(255),
+            metadata JSONB,
+            revenue NUMERIC(10, 2),
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            CONSTRAINT analytics_events_pkey PRIMARY KEY (id)
+        )
+    """)
+    op.execute("INSERT INTO analytics_events SELECT * FROM analytics_events_partitioned")
+    op.execute("ALTER SEQUENCE analytics_events_id_seq OWNED BY analytics_events.id")
+    op.execute("DROP TABLE analytics_events_partitioned CASCADE")
+    op.execute("DROP FUNCTION IF EXISTS create_analytics_partitions(date, date)")
+
+    op.execute("CREATE INDEX ix_analytics_user_event_rev ON analytics_events (user_id, event_type) INCLUDE (revenue)")
+    op.execute("CREATE INDEX ix_analytics_campaign_id ON analytics_events (campaign_id)")
+    op.execute("CREATE INDEX ix_analytics_event_type ON analytics_events (event_type)")
+    op.execute("CREATE INDEX ix_analytics_created_at ON analytics_events (created_at)")
@@ -0,0 +1,35 @@
+"""Keyset pagination indexes for campaign and content lists
+
+Revision ID: 007
+Revises: 006
+Create Date: 2025-02-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_campaigns_user_created "
+            "ON campaigns (user_id, created_at DESC)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_content_user_created "
+            "ON content (user_id, created_at DESC)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_content_user_created")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_campaigns_user_created")
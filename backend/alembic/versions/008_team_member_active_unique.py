@@ -0,0 +1,35 @@
+"""Unique active team membership
+
+Revision ID: 008
+Revises: 007
+Create Date: 2025-02-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # Only active memberships must be unique, so users can leave and re-join
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_team_user_active "
+            "ON team_members (team_id, user_id) WHERE is_active"
+        )
+        op.execute("ALTER TABLE team_members DROP CONSTRAINT IF EXISTS uq_team_user")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "ALTER TABLE team_members ADD CONSTRAINT uq_team_user UNIQUE (team_id, user_id)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS uq_team_user_active")
@@ -0,0 +1,25 @@
+"""Server-side default for users.trial_ends_at
+
+Revision ID: 009
+Revises: 008
+Create Date: 2025-02-24 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '009'
+down_revision: Union[str, None] = '008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE users ALTER COLUMN trial_ends_at SET DEFAULT now() + interval '14 days'")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE users ALTER COLUMN trial_ends_at DROP DEFAULT")
@@ -0,0 +1,33 @@
+"""Rebuild the active campaigns partial index with the stored enum label
+
+Revision ID: 011
+Revises: 010
+Create Date: 2025-02-25 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '011'
+down_revision: Union[str, None] = '010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Databases that ran 002 before its fix have the index with
+    # WHERE status = 'active', which matches no rows
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_campaigns_user_status")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_campaigns_user_status "
+            "ON campaigns (user_id, status) WHERE status = 'ACTIVE'"
+        )
+
+
+def downgrade() -> None:
+    # 002 now creates the same index, so there is nothing to restore
+    pass
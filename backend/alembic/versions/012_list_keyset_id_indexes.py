@@ -0,0 +1,46 @@
+"""Add id to the campaign and content keyset pagination indexes
+
+Revision ID: 012
+Revises: 011
+Create Date: 2025-02-26 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '012'
+down_revision: Union[str, None] = '011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Lists page on (created_at, id), so the tie-breaker belongs in the index
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_campaigns_user_created_id "
+            "ON campaigns (user_id, created_at DESC, id DESC)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_content_user_created_id "
+            "ON content (user_id, created_at DESC, id DESC)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_campaigns_user_created")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_content_user_created")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_content_user_created "
+            "ON content (user_id, created_at DESC)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_campaigns_user_created "
+            "ON campaigns (user_id, created_at DESC)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_content_user_created_id")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_campaigns_user_created_id")
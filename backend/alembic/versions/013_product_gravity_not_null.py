@@ -0,0 +1,56 @@
+"""Make products.gravity NOT NULL and rebuild the gravity indexes in full
+
+Revision ID: 013
+Revises: 012
+Create Date: 2025-02-27 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '013'
+down_revision: Union[str, None] = '012'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keyset pagination compares (gravity, id) rows, which is NULL for a
+    # NULL gravity; products without a gravity score rank as 0
+    op.execute("UPDATE products SET gravity = 0 WHERE gravity IS NULL")
+    op.execute("ALTER TABLE products ALTER COLUMN gravity SET DEFAULT 0")
+    op.execute("ALTER TABLE products ALTER COLUMN gravity SET NOT NULL")
+
+    # The search query has no gravity IS NOT NULL predicate, so the partial
+    # indexes from 004 were never usable
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_products_cat_gravity")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_products_rebill_gravity")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_products_cat_gravity "
+            "ON products (category, gravity DESC, id DESC)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_products_rebill_gravity "
+            "ON products (rebill, gravity DESC, id DESC)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_products_rebill_gravity")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_products_cat_gravity")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_products_cat_gravity "
+            "ON products (category, gravity DESC NULLS LAST, id DESC) WHERE gravity IS NOT NULL"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_products_rebill_gravity "
+            "ON products (rebill, gravity DESC NULLS LAST, id DESC) WHERE gravity IS NOT NULL"
+        )
+
+    op.execute("ALTER TABLE products ALTER COLUMN gravity DROP NOT NULL")
+    op.execute("ALTER TABLE products ALTER COLUMN gravity DROP DEFAULT")
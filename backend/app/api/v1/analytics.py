@@ -7,54 +7,40 @@ from sqlalchemy import select, func
 from decimal import Decimal
 
 from app.db.session import get_db
-from app.models.user import User
 from app.models.analytics import AnalyticsEvent, EventType
 from app.models.campaign import Campaign
 from app.schemas.analytics import DashboardMetrics
-from app.dependencies import get_current_user
+from app.dependencies import CurrentUser, get_current_user
+from app.core.cache import get_dashboard, set_dashboard
 
 router = APIRouter()
 
 
 @router.get("/dashboard", response_model=DashboardMetrics)
 async def get_dashboard_metrics(
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Get dashboard metrics for current user
     """
-    # Total clicks
-    total_clicks = await db.scalar(
-        select(func.count(AnalyticsEvent.id)).where(
-            AnalyticsEvent.user_id == current_user.id,
-            AnalyticsEvent.event_type == EventType.CLICK
-        )
-    ) or 0
-
-    # Total conversions
-    total_conversions = await db.scalar(
-        select(func.count(AnalyticsEvent.id)).where(
-            AnalyticsEvent.user_id == current_user.id,
-            AnalyticsEvent.event_type == EventType.CONVERSION
-        )
-    ) or 0
-
-    # Total revenue
-    total_revenue = await db.scalar(
-        select(func.sum(AnalyticsEvent.revenue)).where(
-            AnalyticsEvent.user_id == current_user.id,
-            AnalyticsEvent.event_type == EventType.CONVERSION
-        )
-    ) or Decimal("0.00")
+    cached, generation = await get_dashboard(current_user.id)
 
-    # Active campaigns
-    active_campaigns = await db.scalar(
-        select(func.count(Campaign.id)).where(
-            Campaign.user_id == current_user.id,
-            Campaign.status == "active"
+    if cached:
+        total_clicks = int(cached["total_clicks"])
+        total_conversions = int(cached["total_conversions"])
+        total_revenue = Decimal(cached["total_revenue"]).quantize(Decimal("0.01"))
+        active_campaigns = int(cached["active_campaigns"])
+    else:
+        total_clicks, total_conversions, total_revenue, active_campaigns = (
+            await _compute_dashboard_counters(current_user, db)
         )
-    ) or 0
+        await set_dashboard(current_user.id, {
+            "total_clicks": total_clicks,
+            "total_conversions": total_conversions,
+            "total_revenue": total_revenue,
+            "active_campaigns": active_campaigns
+        }, generation)
 
     # Conversion rate
     conversion_rate = (total_conversions / total_clicks * 100) if total_clicks > 0 else 0.0
@@ -70,3 +56,37 @@ async def get_dashboard_metrics(
         "average_commission": average_commission,
         "active_campaigns": active_campaigns
     }
+
+
+async def _compute_dashboard_counters(user: CurrentUser, db: AsyncSession):
+    """
+    Compute raw dashboard counters from the database
+    """
+    # Active campaigns, folded into the aggregate query as a scalar subquery
+    active_campaigns_subq = (
+        select(func.count(Campaign.id))
+        .where(
+            Campaign.user_id == user.id,
+            Campaign.status == "active"
+        )
+        .scalar_subquery()
+    )
+
+    # Clicks, conversions and revenue in a single round-trip
+    is_conversion = AnalyticsEvent.event_type == EventType.CONVERSION
+    result = await db.execute(
+        select(
+            func.count().filter(AnalyticsEvent.event_type == EventType.CLICK).label("total_clicks"),
+            func.count().filter(is_conversion).label("total_conversions"),
+            func.sum(AnalyticsEvent.revenue).filter(is_conversion).label("total_revenue"),
+            active_campaigns_subq.label("active_campaigns")
+        ).where(AnalyticsEvent.user_id == user.id)
+    )
+    row = result.one()
+
+    total_clicks = row.total_clicks or 0
+    total_conversions = row.total_conversions or 0
+    total_revenue = row.total_revenue or Decimal("0.00")
+    active_campaigns = row.active_campaigns or 0
+
+    return total_clicks, total_conversions, total_revenue, active_campaigns
@@ -1,25 +1,28 @@
 """
 Authentication endpoints
 """
-from datetime import datetime, timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, bindparam
+from sqlalchemy.dialects.postgresql import insert
 
 from app.db.session import get_db
 from app.models.user import User, UserStatus
 from app.schemas.user import UserCreate, UserLogin, Token, TokenRefresh, UserResponse
 from app.core.security import (
-    verify_password,
-    get_password_hash,
+    verify_and_update_password_async,
+    get_password_hash_async,
     create_access_token,
     create_refresh_token,
     decode_refresh_token
 )
 from app.core.exceptions import UnauthorizedException, ConflictException
+from app.dependencies import USER_BY_ID
 
 router = APIRouter()
 
+USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+
 
 @router.post("/signup", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def signup(
@@ -29,27 +32,25 @@ async def signup(
     """
     Create new user account
     """
-    # Check if user already exists
+    # Create new user; the unique email index rejects duplicates atomically
+    # and trial_ends_at comes from the column's server default
     result = await db.execute(
-        select(User).where(User.email == user_data.email)
+        insert(User)
+        .values(
+            email=user_data.email,
+            password_hash=await get_password_hash_async(user_data.password),
+            full_name=user_data.full_name,
+            status=UserStatus.TRIAL
+        )
+        .on_conflict_do_nothing(index_elements=[User.email])
+        .returning(User)
     )
-    existing_user = result.scalar_one_or_none()
+    user = result.scalar_one_or_none()
 
-    if existing_user:
+    if user is None:
         raise ConflictException("Email already registered")
 
-    # Create new user
-    user = User(
-        email=user_data.email,
-        password_hash=get_password_hash(user_data.password),
-        full_name=user_data.full_name,
-        status=UserStatus.TRIAL,
-        trial_ends_at=datetime.utcnow() + timedelta(days=14)
-    )
-
-    db.add(user)
     await db.commit()
-    await db.refresh(user)
 
     return user
 
@@ -63,12 +64,14 @@ async def login(
     Login and get JWT tokens
     """
     # Find user
-    result = await db.execute(
-        select(User).where(User.email == credentials.email)
-    )
+    result = await db.execute(USER_BY_EMAIL, {"email": credentials.email})
     user = result.scalar_one_or_none()
 
-    if not user or not verify_password(credentials.password, user.password_hash):
+    if not user:
+        raise UnauthorizedException("Incorrect email or password")
+
+    valid, new_hash = await verify_and_update_password_async(credentials.password, user.password_hash)
+    if not valid:
         raise UnauthorizedException("Incorrect email or password")
 
     # Check if account is suspended
@@ -78,6 +81,11 @@ async def login(
             detail="Account suspended"
         )
 
+    # Migrate legacy bcrypt hashes to argon2id
+    if new_hash:
+        user.password_hash = new_hash
+        await db.commit()
+
     # Create tokens
     access_token = create_access_token(data={"sub": str(user.id)})
     refresh_token = create_refresh_token(data={"sub": str(user.id)})
@@ -103,12 +111,8 @@ async def refresh_token(
     if not payload:
         raise UnauthorizedException("Invalid refresh token")
 
-    user_id = payload.get("sub")
-
     # Verify user exists
-    result = await db.execute(
-        select(User).where(User.id == user_id)
-    )
+    result = await db.execute(USER_BY_ID, {"user_id": payload.sub})
     user = result.scalar_one_or_none()
 
     if not user:
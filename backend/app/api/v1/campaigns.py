@@ -1,62 +1,97 @@
 """
 Campaign endpoints
 """
-from typing import List
-from fastapi import APIRouter, Depends
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update, delete, func, tuple_
+from sqlalchemy.dialects.postgresql import insert
 
-from app.db.session import get_db
+from app.db.session import SessionFactory, get_db, get_session_factory, stream_json_page
 from app.models.campaign import Campaign
-from app.models.user import User
-from app.schemas.campaign import CampaignCreate, CampaignUpdate, CampaignResponse
-from app.dependencies import get_current_user
-from app.core.exceptions import NotFoundException
-import uuid
+from app.schemas.campaign import CampaignCreate, CampaignUpdate, CampaignResponse, CampaignPage
+from app.dependencies import CurrentUser, get_current_user
+from app.core.pagination import decode_cursor
+from app.core.exceptions import NotFoundException, ConflictException
+from app.core.cache import invalidate_dashboard
+import base64
+import os
 
 router = APIRouter()
 
+# Attempts at a fresh tracking_id before giving up on a collision
+TRACKING_ID_ATTEMPTS = 3
 
-@router.get("", response_model=List[CampaignResponse])
+
+def generate_tracking_id() -> str:
+    """
+    Generate a 64-bit random tracking ID as unpadded lowercase Base32
+    """
+    return base64.b32encode(os.urandom(8)).rstrip(b"=").decode().lower()
+
+
+@router.get("", response_model=CampaignPage)
 async def list_campaigns(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    current_user: CurrentUser = Depends(get_current_user),
+    session_factory: SessionFactory = Depends(get_session_factory)
 ):
     """
     List user's campaigns
     """
-    result = await db.execute(
-        select(Campaign).where(Campaign.user_id == current_user.id)
-        .order_by(Campaign.created_at.desc())
-    )
-    campaigns = result.scalars().all()
+    stmt = select(Campaign).where(Campaign.user_id == current_user.id)
 
-    return campaigns
+    # Keyset pagination walks ix_campaigns_user_created_id
+    if cursor is not None:
+        cursor_created_at, cursor_id = decode_cursor(cursor)
+        stmt = stmt.where(
+            tuple_(Campaign.created_at, Campaign.id) < tuple_(cursor_created_at, cursor_id)
+        )
+
+    stmt = stmt.order_by(Campaign.created_at.desc(), Campaign.id.desc())
+
+    return StreamingResponse(
+        stream_json_page(stmt, CampaignResponse, limit, session_factory=session_factory),
+        media_type="application/json"
+    )
 
 
 @router.post("", response_model=CampaignResponse)
 async def create_campaign(
     campaign_data: CampaignCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Create new campaign
     """
-    # Create campaign
-    campaign = Campaign(
-        user_id=current_user.id,
-        product_id=campaign_data.product_id,
-        name=campaign_data.name,
-        funnel_type=campaign_data.funnel_type,
-        affiliate_link=campaign_data.affiliate_link,
-        tracking_id=str(uuid.uuid4())[:8],
-        settings=campaign_data.settings
-    )
+    # Create campaign; RETURNING hydrates server defaults without a refresh.
+    # A tracking_id collision returns no row instead of raising, so retry
+    for _ in range(TRACKING_ID_ATTEMPTS):
+        result = await db.execute(
+            insert(Campaign)
+            .values(
+                user_id=current_user.id,
+                product_id=campaign_data.product_id,
+                name=campaign_data.name,
+                funnel_type=campaign_data.funnel_type,
+                affiliate_link=campaign_data.affiliate_link,
+                tracking_id=generate_tracking_id(),
+                settings=campaign_data.settings
+            )
+            .on_conflict_do_nothing(index_elements=[Campaign.tracking_id])
+            .returning(Campaign)
+        )
+        campaign = result.scalar_one_or_none()
+        if campaign is not None:
+            break
+    else:
+        raise ConflictException("Could not allocate a unique tracking ID")
 
-    db.add(campaign)
     await db.commit()
-    await db.refresh(campaign)
+    await invalidate_dashboard([current_user.id])
 
     return campaign
 
@@ -64,7 +99,7 @@ async def create_campaign(
 @router.get("/{campaign_id}", response_model=CampaignResponse)
 async def get_campaign(
     campaign_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -88,37 +123,31 @@ async def get_campaign(
 async def update_campaign(
     campaign_id: str,
     campaign_update: CampaignUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Update campaign
     """
+    # Single UPDATE ... RETURNING; no row means missing or not owned
+    values = campaign_update.model_dump(exclude_none=True)
     result = await db.execute(
-        select(Campaign).where(
+        update(Campaign)
+        .where(
             Campaign.id == campaign_id,
             Campaign.user_id == current_user.id
         )
+        .values(**values, updated_at=func.now())
+        .returning(Campaign)
     )
     campaign = result.scalar_one_or_none()
 
     if not campaign:
         raise NotFoundException("Campaign not found")
 
-    # Update fields
-    if campaign_update.name is not None:
-        campaign.name = campaign_update.name
-    if campaign_update.status is not None:
-        campaign.status = campaign_update.status
-    if campaign_update.funnel_type is not None:
-        campaign.funnel_type = campaign_update.funnel_type
-    if campaign_update.affiliate_link is not None:
-        campaign.affiliate_link = campaign_update.affiliate_link
-    if campaign_update.settings is not None:
-        campaign.settings = campaign_update.settings
-
     await db.commit()
-    await db.refresh(campaign)
+    # Status changes move the active campaigns count
+    await invalidate_dashboard([current_user.id])
 
     return campaign
 
@@ -126,24 +155,26 @@ async def update_campaign(
 @router.delete("/{campaign_id}")
 async def delete_campaign(
     campaign_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Delete campaign
     """
     result = await db.execute(
-        select(Campaign).where(
+        delete(Campaign)
+        .where(
             Campaign.id == campaign_id,
             Campaign.user_id == current_user.id
         )
+        .returning(Campaign.id)
     )
-    campaign = result.scalar_one_or_none()
 
-    if not campaign:
+    if result.scalar_one_or_none() is None:
         raise NotFoundException("Campaign not found")
 
-    await db.delete(campaign)
     await db.commit()
+    # Deleting a campaign also cascades its analytics events
+    await invalidate_dashboard([current_user.id])
 
     return {"message": "Campaign deleted successfully"}
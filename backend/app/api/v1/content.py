@@ -1,59 +1,79 @@
 """
 Content endpoints
 """
-from typing import List
-from fastapi import APIRouter, Depends
+from datetime import datetime
+from typing import AsyncGenerator, List, Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert, update, delete, func, tuple_, cast
+from sqlalchemy.dialects.postgresql import JSONB
 
-from app.db.session import get_db
-from app.models.content import Content
-from app.models.user import User
-from app.schemas.content import ContentCreate, ContentUpdate, ContentResponse, ContentGenerateRequest
-from app.dependencies import get_current_user
-from app.core.exceptions import NotFoundException
+from app.db.session import SessionFactory, get_db, get_session_factory, stream_json_page
+from app.models.content import Content, ContentType
+from app.models.product import Product
+from app.schemas.content import ContentCreate, ContentUpdate, ContentResponse, ContentPage, ContentGenerateRequest
+from app.dependencies import CurrentUser, get_current_user
+from app.core.pagination import decode_cursor
+from app.core.exceptions import NotFoundException, BadRequestException, TierLimitException
+from app.services.ai import get_ai_service
+from app.core.logging import logger
+from app.config import settings
 
 router = APIRouter()
 
 
-@router.get("", response_model=List[ContentResponse])
+@router.get("", response_model=ContentPage)
 async def list_content(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    current_user: CurrentUser = Depends(get_current_user),
+    session_factory: SessionFactory = Depends(get_session_factory)
 ):
     """
     List user's content
     """
-    result = await db.execute(
-        select(Content).where(Content.user_id == current_user.id)
-        .order_by(Content.created_at.desc())
-    )
-    content_items = result.scalars().all()
+    stmt = select(Content).where(Content.user_id == current_user.id)
+
+    # Keyset pagination walks ix_content_user_created_id
+    if cursor is not None:
+        cursor_created_at, cursor_id = decode_cursor(cursor)
+        stmt = stmt.where(
+            tuple_(Content.created_at, Content.id) < tuple_(cursor_created_at, cursor_id)
+        )
+
+    stmt = stmt.order_by(Content.created_at.desc(), Content.id.desc())
 
-    return content_items
+    return StreamingResponse(
+        stream_json_page(stmt, ContentResponse, limit, session_factory=session_factory),
+        media_type="application/json"
+    )
 
 
 @router.post("", response_model=ContentResponse)
 async def create_content(
     content_data: ContentCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Create new content
     """
-    content = Content(
-        user_id=current_user.id,
-        campaign_id=content_data.campaign_id,
-        type=content_data.type,
-        title=content_data.title,
-        body=content_data.body,
-        metadata=content_data.metadata
+    result = await db.execute(
+        insert(Content)
+        .values(
+            user_id=current_user.id,
+            campaign_id=content_data.campaign_id,
+            type=content_data.type,
+            title=content_data.title,
+            body=content_data.body,
+            metadata=content_data.metadata
+        )
+        .returning(Content)
     )
-
-    db.add(content)
+    content = result.scalar_one()
     await db.commit()
-    await db.refresh(content)
 
     return content
 
@@ -61,7 +81,7 @@ async def create_content(
 @router.post("/generate")
 async def generate_content(
     request: ContentGenerateRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -75,10 +95,128 @@ async def generate_content(
     }
 
 
+async def _save_generated(
+    content_id: UUID,
+    body: str,
+    error: Optional[str],
+    session_factory: SessionFactory
+) -> None:
+    """
+    Store generated text on the content row, merging any error into metadata
+    """
+    values = {Content.body: body, Content.updated_at: func.now()}
+    if error is not None:
+        metadata_column = Content.__table__.c.metadata
+        values[metadata_column] = func.coalesce(
+            metadata_column, cast({}, JSONB)
+        ).op("||")(func.jsonb_build_object("error", error))
+
+    async with session_factory() as session:
+        await session.execute(
+            update(Content).where(Content.id == content_id).values(values)
+        )
+        await session.commit()
+
+
+async def _stream_and_save(
+    chunks: AsyncGenerator[str, None],
+    content_id: UUID,
+    session_factory: SessionFactory
+) -> AsyncGenerator[str, None]:
+    """
+    Relay generated text to the client, then store it on the content row
+
+    Whatever was generated is saved even when the provider fails or the
+    client disconnects, so the row never stays empty.
+    """
+    parts: List[str] = []
+    error: Optional[str] = None
+    try:
+        async for chunk in chunks:
+            parts.append(chunk)
+            yield chunk
+    except Exception as e:
+        logger.error(f"Error streaming content {content_id}: {str(e)}")
+        error = str(e)
+        raise
+    finally:
+        await _save_generated(content_id, "".join(parts), error, session_factory)
+
+
+@router.post("/generate/stream")
+async def stream_generated_content(
+    request: ContentGenerateRequest,
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    session_factory: SessionFactory = Depends(get_session_factory)
+):
+    """
+    Stream a generated product review as plain text while the model writes it
+    """
+    if request.content_type != "review":
+        raise BadRequestException("Only reviews can be streamed")
+
+    # Same monthly window the /users/me/usage endpoint reports against
+    now = datetime.utcnow()
+    start_of_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    content_count = await db.scalar(
+        select(func.count(Content.id)).where(
+            Content.user_id == current_user.id,
+            Content.created_at >= start_of_month
+        )
+    )
+    if content_count >= settings.tier_limits[current_user.tier]["content"]:
+        raise TierLimitException("Monthly content limit reached")
+
+    result = await db.execute(
+        select(Product.title, Product.description).where(Product.id == request.product_id)
+    )
+    product = result.one_or_none()
+
+    if not product:
+        raise NotFoundException("Product not found")
+
+    # Created before streaming so the generation counts toward the limit
+    # even if the client disconnects part way through. ContentType has no
+    # review member, so reviews are stored as blog posts and the requested
+    # type is kept in metadata
+    result = await db.execute(
+        insert(Content)
+        .values(
+            user_id=current_user.id,
+            type=ContentType.BLOG_POST,
+            title=f"{product.title} Review",
+            body="",
+            metadata={
+                "product_id": str(request.product_id),
+                "requested_type": request.content_type,
+                "tone": request.tone,
+                "length": request.length
+            }
+        )
+        .returning(Content.id)
+    )
+    content_id = result.scalar_one()
+    await db.commit()
+
+    chunks = get_ai_service().generate_product_review_stream(
+        product.title,
+        product.description or "",
+        request.tone,
+        request.length
+    )
+
+    return StreamingResponse(
+        _stream_and_save(chunks, content_id, session_factory),
+        media_type="text/plain; charset=utf-8",
+        headers={"X-Content-Id": str(content_id)}
+    )
+
+
 @router.get("/{content_id}", response_model=ContentResponse)
 async def get_content(
     content_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -102,35 +240,29 @@ async def get_content(
 async def update_content(
     content_id: str,
     content_update: ContentUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Update content
     """
+    # Single UPDATE ... RETURNING; no row means missing or not owned
+    values = content_update.model_dump(exclude_none=True)
     result = await db.execute(
-        select(Content).where(
+        update(Content)
+        .where(
             Content.id == content_id,
             Content.user_id == current_user.id
         )
+        .values(**values, updated_at=func.now())
+        .returning(Content)
     )
     content = result.scalar_one_or_none()
 
     if not content:
         raise NotFoundException("Content not found")
 
-    # Update fields
-    if content_update.title is not None:
-        content.title = content_update.title
-    if content_update.body is not None:
-        content.body = content_update.body
-    if content_update.status is not None:
-        content.status = content_update.status
-    if content_update.metadata is not None:
-        content.metadata = content_update.metadata
-
     await db.commit()
-    await db.refresh(content)
 
     return content
 
@@ -138,24 +270,24 @@ async def update_content(
 @router.delete("/{content_id}")
 async def delete_content(
     content_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Delete content
     """
     result = await db.execute(
-        select(Content).where(
+        delete(Content)
+        .where(
             Content.id == content_id,
             Content.user_id == current_user.id
         )
+        .returning(Content.id)
     )
-    content = result.scalar_one_or_none()
 
-    if not content:
+    if result.scalar_one_or_none() is None:
         raise NotFoundException("Content not found")
 
-    await db.delete(content)
     await db.commit()
 
     return {"message": "Content deleted successfully"}
@@ -1,16 +1,17 @@
 """
 Product endpoints
 """
-from typing import List
+from typing import List, Optional
+from uuid import UUID
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, or_
+from sqlalchemy import select, or_, func, tuple_
 
-from app.db.session import get_db
+from app.db.session import SessionFactory, get_db, get_session_factory, stream_json_array
 from app.models.product import Product
-from app.models.user import User
 from app.schemas.product import ProductResponse, ProductSearch
-from app.dependencies import get_current_user
+from app.dependencies import CurrentUser, get_current_user
 from app.core.exceptions import NotFoundException
 
 router = APIRouter()
@@ -25,22 +26,28 @@ async def search_products(
     min_commission: float = Query(None),
     has_rebill: bool = Query(None),
     limit: int = Query(20, le=100),
-    offset: int = Query(0),
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    cursor_gravity: Optional[float] = Query(None, description="Gravity of the last product on the previous page"),
+    cursor_id: Optional[UUID] = Query(None, description="ID of the last product on the previous page"),
+    current_user: CurrentUser = Depends(get_current_user),
+    session_factory: SessionFactory = Depends(get_session_factory)
 ):
     """
     Search ClickBank products with filters
+
+    Pass the gravity and id of the last product received as cursor_gravity
+    and cursor_id to fetch the next page.
     """
     # Build query
     stmt = select(Product)
 
     # Apply filters
     if query:
+        # Full-text match via the GIN index, with a trigram-indexed title
+        # substring match for partial words
         stmt = stmt.where(
             or_(
-                Product.title.ilike(f"%{query}%"),
-                Product.description.ilike(f"%{query}%")
+                Product.search_tsv.op("@@")(func.plainto_tsquery("english", query)),
+                Product.title.ilike(f"%{query}%")
             )
         )
 
@@ -59,23 +66,27 @@ async def search_products(
     if has_rebill is not None:
         stmt = stmt.where(Product.rebill == has_rebill)
 
-    # Order by gravity (descending)
-    stmt = stmt.order_by(Product.gravity.desc())
+    # Order by gravity (descending), id breaks ties for keyset pagination
+    # (gravity is NOT NULL, so the row comparison never drops rows)
+    stmt = stmt.order_by(Product.gravity.desc(), Product.id.desc())
 
     # Apply pagination
-    stmt = stmt.limit(limit).offset(offset)
+    if cursor_gravity is not None and cursor_id is not None:
+        stmt = stmt.where(tuple_(Product.gravity, Product.id) < tuple_(cursor_gravity, cursor_id))
 
-    # Execute query
-    result = await db.execute(stmt)
-    products = result.scalars().all()
+    stmt = stmt.limit(limit)
 
-    return products
+    # Stream rows straight from a server-side cursor
+    return StreamingResponse(
+        stream_json_array(stmt, ProductResponse, session_factory=session_factory),
+        media_type="application/json"
+    )
 
 
 @router.get("/{product_id}", response_model=ProductResponse)
 async def get_product(
     product_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
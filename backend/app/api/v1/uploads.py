@@ -1,58 +1,77 @@
 """
 File upload endpoints using AWS S3.
 """
-from typing import List
+import asyncio
+from typing import Any, Dict, List, Tuple
 from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import get_db
-from app.models.user import User
-from app.dependencies import get_current_user
-from app.services.storage import S3StorageService
+from app.dependencies import CurrentUser, get_current_user
+from app.services.storage import (
+    S3StorageService,
+    UploadTooLargeError,
+    MAX_UPLOAD_SIZE,
+    get_storage_service
+)
 from app.core.logging import logger
 from app.core.exceptions import ServiceException
 
 
 router = APIRouter()
 
+# Concurrent S3 uploads per multi-file request
+UPLOAD_CONCURRENCY = 5
+
+# Top-level folders users may upload into; keys are "{folder}/{user_id}/..."
+ALLOWED_FOLDERS = ("uploads", "bonuses", "media")
+
+
+def _validate_folder(folder: str) -> None:
+    """
+    Reject folders outside ALLOWED_FOLDERS
+    """
+    if folder not in ALLOWED_FOLDERS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Folder must be one of: {', '.join(ALLOWED_FOLDERS)}"
+        )
+
+
+def _user_prefixes(user: CurrentUser) -> Tuple[str, ...]:
+    """
+    Key prefixes owned by a user, for str.startswith ownership checks
+    """
+    return tuple(f"{folder}/{user.id}/" for folder in ALLOWED_FOLDERS)
+
 
 @router.post("/upload")
 async def upload_file(
     file: UploadFile = File(...),
     folder: str = Query("uploads", description="S3 folder/prefix"),
     public: bool = Query(False, description="Make file publicly accessible"),
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
+    storage: S3StorageService = Depends(get_storage_service),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Upload a file to S3.
 
     - **file**: File to upload
-    - **folder**: S3 folder (uploads, bonuses, media, etc.)
+    - **folder**: S3 folder (uploads, bonuses or media)
     - **public**: Whether to make file publicly accessible
 
     Returns file URL and metadata.
     """
-    try:
-        # Validate file size (max 100MB)
-        max_size = 100 * 1024 * 1024  # 100MB
-        file_content = await file.read()
-
-        if len(file_content) > max_size:
-            raise HTTPException(
-                status_code=413,
-                detail="File too large. Maximum size is 100MB"
-            )
-
-        # Initialize storage service
-        storage = S3StorageService()
+    _validate_folder(folder)
 
+    try:
         # Add user ID to folder path for organization
         user_folder = f"{folder}/{current_user.id}"
 
-        # Upload file
-        result = await storage.upload_file(
-            file_data=file_content,
+        # Stream the upload to S3; the 100MB cap is enforced while reading
+        result = await storage.upload_fileobj(
+            file,
             file_name=file.filename,
             folder=user_folder,
             content_type=file.content_type,
@@ -61,7 +80,8 @@ async def upload_file(
                 "original_filename": file.filename,
                 "uploaded_by": current_user.email
             },
-            public=public
+            public=public,
+            max_size=MAX_UPLOAD_SIZE
         )
 
         logger.info(f"File uploaded by user {current_user.id}: {result['file_key']}")
@@ -72,10 +92,15 @@ async def upload_file(
             "file_key": result["file_key"],
             "bucket": result["bucket_name"],
             "file_name": file.filename,
-            "size": len(file_content),
+            "size": result["size"],
             "content_type": file.content_type
         }
 
+    except UploadTooLargeError:
+        raise HTTPException(
+            status_code=413,
+            detail="File too large. Maximum size is 100MB"
+        )
     except ServiceException as e:
         logger.error(f"File upload failed: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -89,7 +114,8 @@ async def upload_multiple_files(
     files: List[UploadFile] = File(...),
     folder: str = Query("uploads", description="S3 folder/prefix"),
     public: bool = Query(False, description="Make files publicly accessible"),
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
+    storage: S3StorageService = Depends(get_storage_service),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -103,45 +129,39 @@ async def upload_multiple_files(
             detail="Maximum 10 files per upload"
         )
 
-    storage = S3StorageService()
-    results = []
-    failed = []
+    _validate_folder(folder)
 
     user_folder = f"{folder}/{current_user.id}"
+    semaphore = asyncio.Semaphore(UPLOAD_CONCURRENCY)
+
+    async def _one(file: UploadFile) -> Dict[str, Any]:
+        async with semaphore:
+            try:
+                result = await storage.upload_fileobj(
+                    file,
+                    file_name=file.filename,
+                    folder=user_folder,
+                    content_type=file.content_type,
+                    metadata={"user_id": str(current_user.id)},
+                    public=public,
+                    max_size=MAX_UPLOAD_SIZE
+                )
+            except UploadTooLargeError:
+                return {"file_name": file.filename, "error": "File too large (max 100MB)"}
+            except Exception as e:
+                return {"file_name": file.filename, "error": str(e)}
 
-    for file in files:
-        try:
-            file_content = await file.read()
-
-            # Skip files larger than 100MB
-            if len(file_content) > 100 * 1024 * 1024:
-                failed.append({
-                    "file_name": file.filename,
-                    "error": "File too large (max 100MB)"
-                })
-                continue
-
-            result = await storage.upload_file(
-                file_data=file_content,
-                file_name=file.filename,
-                folder=user_folder,
-                content_type=file.content_type,
-                metadata={"user_id": str(current_user.id)},
-                public=public
-            )
-
-            results.append({
-                "file_name": file.filename,
-                "file_url": result["file_url"],
-                "file_key": result["file_key"],
-                "size": len(file_content)
-            })
+        return {
+            "file_name": file.filename,
+            "file_url": result["file_url"],
+            "file_key": result["file_key"],
+            "size": result["size"]
+        }
 
-        except Exception as e:
-            failed.append({
-                "file_name": file.filename,
-                "error": str(e)
-            })
+    # Upload concurrently; total time tracks the slowest file, not the sum
+    outcomes = await asyncio.gather(*(_one(file) for file in files))
+    results = [outcome for outcome in outcomes if "error" not in outcome]
+    failed = [outcome for outcome in outcomes if "error" in outcome]
 
     logger.info(f"Batch upload by user {current_user.id}: {len(results)} succeeded, {len(failed)} failed")
 
@@ -159,7 +179,8 @@ async def get_presigned_upload_url(
     file_name: str = Query(..., description="File name"),
     content_type: str = Query("application/octet-stream", description="Content type"),
     folder: str = Query("uploads", description="S3 folder"),
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser = Depends(get_current_user),
+    storage: S3StorageService = Depends(get_storage_service)
 ):
     """
     Generate a presigned URL for direct client-side upload to S3.
@@ -169,9 +190,9 @@ async def get_presigned_upload_url(
 
     Returns URL and fields for POST upload.
     """
-    try:
-        storage = S3StorageService()
+    _validate_folder(folder)
 
+    try:
         # Generate S3 key
         from datetime import datetime
         timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
@@ -201,7 +222,8 @@ async def get_presigned_upload_url(
 async def get_presigned_download_url(
     file_key: str = Query(..., description="S3 file key"),
     expires_in: int = Query(3600, description="URL expiration in seconds"),
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser = Depends(get_current_user),
+    storage: S3StorageService = Depends(get_storage_service)
 ):
     """
     Generate a presigned URL for downloading a private file from S3.
@@ -210,15 +232,13 @@ async def get_presigned_download_url(
     - **expires_in**: URL expiration time in seconds (default 1 hour)
     """
     try:
-        # Verify user owns this file (file key contains user ID)
-        if str(current_user.id) not in file_key:
+        # Verify user owns this file (key lives under the user's prefix)
+        if not file_key.startswith(_user_prefixes(current_user)):
             raise HTTPException(
                 status_code=403,
                 detail="You don't have permission to access this file"
             )
 
-        storage = S3StorageService()
-
         # Check if file exists
         exists = await storage.file_exists(file_key)
         if not exists:
@@ -247,7 +267,8 @@ async def get_presigned_download_url(
 @router.delete("/delete")
 async def delete_file(
     file_key: str = Query(..., description="S3 file key"),
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser = Depends(get_current_user),
+    storage: S3StorageService = Depends(get_storage_service)
 ):
     """
     Delete a file from S3.
@@ -256,14 +277,12 @@ async def delete_file(
     """
     try:
         # Verify user owns this file
-        if str(current_user.id) not in file_key:
+        if not file_key.startswith(_user_prefixes(current_user)):
             raise HTTPException(
                 status_code=403,
                 detail="You don't have permission to delete this file"
             )
 
-        storage = S3StorageService()
-
         # Delete file
         success = await storage.delete_file(file_key)
 
@@ -288,30 +307,30 @@ async def delete_file(
 @router.delete("/delete-multiple")
 async def delete_multiple_files(
     file_keys: List[str] = Query(..., description="List of S3 file keys"),
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser = Depends(get_current_user),
+    storage: S3StorageService = Depends(get_storage_service)
 ):
     """
     Delete multiple files from S3.
 
-    Maximum 100 files per request.
+    Maximum 1000 files per request.
     """
-    if len(file_keys) > 100:
+    if len(file_keys) > 1000:
         raise HTTPException(
             status_code=400,
-            detail="Maximum 100 files per deletion"
+            detail="Maximum 1000 files per deletion"
         )
 
     # Verify user owns all files
+    user_prefixes = _user_prefixes(current_user)
     for file_key in file_keys:
-        if str(current_user.id) not in file_key:
+        if not file_key.startswith(user_prefixes):
             raise HTTPException(
                 status_code=403,
                 detail=f"You don't have permission to delete file: {file_key}"
             )
 
     try:
-        storage = S3StorageService()
-
         # Delete files
         results = await storage.delete_files(file_keys)
 
@@ -335,20 +354,28 @@ async def delete_multiple_files(
 async def list_user_files(
     folder: str = Query("uploads", description="Folder to list"),
     max_files: int = Query(100, description="Maximum files to return"),
-    current_user: User = Depends(get_current_user)
+    include_metadata: bool = Query(False, description="Include content type and custom metadata"),
+    current_user: CurrentUser = Depends(get_current_user),
+    storage: S3StorageService = Depends(get_storage_service)
 ):
     """
     List files uploaded by the current user.
 
     Returns list of files with metadata.
     """
-    try:
-        storage = S3StorageService()
+    _validate_folder(folder)
 
+    try:
         # List files in user's folder
         prefix = f"{folder}/{current_user.id}/"
         files = await storage.list_files(prefix=prefix, max_keys=max_files)
 
+        # Listing lacks content type and custom metadata; fetch them concurrently
+        if include_metadata and files:
+            metadata = await storage.get_files_metadata([file["key"] for file in files])
+            for file in files:
+                file.update(metadata[file["key"]])
+
         return {
             "success": True,
             "count": len(files),
@@ -364,21 +391,20 @@ async def list_user_files(
 @router.get("/file-info")
 async def get_file_info(
     file_key: str = Query(..., description="S3 file key"),
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser = Depends(get_current_user),
+    storage: S3StorageService = Depends(get_storage_service)
 ):
     """
     Get metadata for a specific file.
     """
     try:
         # Verify user owns this file
-        if str(current_user.id) not in file_key:
+        if not file_key.startswith(_user_prefixes(current_user)):
             raise HTTPException(
                 status_code=403,
                 detail="You don't have permission to access this file"
             )
 
-        storage = S3StorageService()
-
         # Get file metadata
         metadata = await storage.get_file_metadata(file_key)
 
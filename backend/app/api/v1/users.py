@@ -1,97 +1,129 @@
 """
 User endpoints
 """
-from fastapi import APIRouter, Depends
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, update, func
+from sqlalchemy.exc import IntegrityError
 
 from app.db.session import get_db
 from app.models.user import User
 from app.models.content import Content
 from app.models.campaign import Campaign
 from app.schemas.user import UserResponse, UserUpdate, UserUsage
-from app.dependencies import get_current_user
+from app.dependencies import (
+    CurrentUser,
+    get_current_user,
+    get_current_db_user,
+    invalidate_current_user
+)
+from app.core.exceptions import ConflictException
+from app.core.etag import compute_etag, etag_matches
 from app.config import settings
 
 router = APIRouter()
 
+# Per-tier usage response without the counts, built once from settings
+TIER_USAGE_TEMPLATES = {
+    tier: {
+        "content_limit": limits["content"],
+        "campaigns_limit": limits["campaigns"],
+        "storage_used_gb": 0.0,  # TODO: Calculate actual storage
+        "storage_limit_gb": limits["storage_gb"]
+    }
+    for tier, limits in settings.tier_limits.items()
+}
+
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info(
-    current_user: User = Depends(get_current_user)
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    current_user: User = Depends(get_current_db_user)
 ):
     """
     Get current user profile
     """
+    etag = compute_etag(current_user)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
     return current_user
 
 
 @router.patch("/me", response_model=UserResponse)
 async def update_current_user(
     user_update: UserUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Update current user profile
     """
-    # Update fields
-    if user_update.full_name is not None:
-        current_user.full_name = user_update.full_name
+    values = user_update.model_dump(exclude_none=True)
+    if "email" in values:
+        values["is_email_verified"] = False
 
-    if user_update.email is not None:
-        # Check if email is already taken
+    # Single UPDATE ... RETURNING; the unique index on users.email rejects
+    # addresses that belong to someone else
+    try:
         result = await db.execute(
-            select(User).where(User.email == user_update.email, User.id != current_user.id)
+            update(User)
+            .where(User.id == current_user.id)
+            .values(**values, updated_at=func.now())
+            .returning(User)
         )
-        if result.scalar_one_or_none():
-            from app.core.exceptions import ConflictException
-            raise ConflictException("Email already in use")
-
-        current_user.email = user_update.email
-        current_user.is_email_verified = False
+        user = result.scalar_one()
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise ConflictException("Email already in use")
 
-    await db.commit()
-    await db.refresh(current_user)
-
-    return current_user
+    await invalidate_current_user(current_user.id)
+    return user
 
 
 @router.get("/me/usage", response_model=UserUsage)
 async def get_user_usage(
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Get current user's usage statistics
     """
-    # Get tier limits
-    tier_limits = settings.tier_limits[current_user.tier]
+    usage_template = TIER_USAGE_TEMPLATES[current_user.tier]
 
     # Count content generated this month
-    from datetime import datetime
-    start_of_month = datetime.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-
-    content_count = await db.scalar(
-        select(func.count(Content.id)).where(
+    now = datetime.utcnow()
+    start_of_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+    # Both counts in one round-trip; served by ix_content_user_created_id and
+    # the partial ix_campaigns_user_status index
+    content_count_subq = (
+        select(func.count(Content.id))
+        .where(
             Content.user_id == current_user.id,
             Content.created_at >= start_of_month
         )
+        .scalar_subquery()
     )
-
-    # Count active campaigns
-    active_campaigns = await db.scalar(
-        select(func.count(Campaign.id)).where(
+    active_campaigns_subq = (
+        select(func.count(Campaign.id))
+        .where(
             Campaign.user_id == current_user.id,
             Campaign.status == "active"
         )
+        .scalar_subquery()
     )
 
+    result = await db.execute(select(content_count_subq, active_campaigns_subq))
+    content_count, active_campaigns = result.one()
+
     return {
+        **usage_template,
         "content_generated": content_count or 0,
-        "content_limit": tier_limits["content"],
-        "campaigns_active": active_campaigns or 0,
-        "campaigns_limit": tier_limits["campaigns"],
-        "storage_used_gb": 0.0,  # TODO: Calculate actual storage
-        "storage_limit_gb": tier_limits["storage_gb"]
+        "campaigns_active": active_campaigns or 0
     }
@@ -1,13 +1,58 @@
 """
 Webhook endpoints
 """
+import hashlib
+import hmac
+import time
+from typing import Optional
+
+import orjson
 from fastapi import APIRouter, Request, HTTPException
 from app.config import settings
+from app.core.exceptions import BadRequestException
 import logging
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Maximum age of a Stripe signature timestamp
+STRIPE_SIGNATURE_TOLERANCE = 300  # seconds
+
+
+def verify_stripe_signature(payload: bytes, header: Optional[str], secret: str) -> bool:
+    """
+    Verify a Stripe-Signature header against the raw request body
+    """
+    if not header:
+        return False
+
+    timestamp = None
+    signatures = []
+    for item in header.split(","):
+        key, _, value = item.partition("=")
+        if key == "t":
+            timestamp = value
+        elif key == "v1":
+            signatures.append(value)
+
+    if not timestamp or not signatures:
+        return False
+
+    try:
+        if abs(time.time() - int(timestamp)) > STRIPE_SIGNATURE_TOLERANCE:
+            return False
+    except ValueError:
+        return False
+
+    # HMAC-SHA256 over "{timestamp}.{body}", computed by OpenSSL
+    expected = hmac.new(
+        secret.encode(),
+        timestamp.encode() + b"." + payload,
+        hashlib.sha256
+    ).hexdigest()
+
+    return any(hmac.compare_digest(expected, signature) for signature in signatures)
+
 
 @router.post("/clickbank/ipn")
 async def clickbank_ipn(request: Request):
@@ -15,7 +60,14 @@ async def clickbank_ipn(request: Request):
     ClickBank Instant Payment Notification webhook
     """
     # TODO: Implement ClickBank IPN verification and processing
-    data = await request.form()
+    # JSON IPNs skip Starlette's form parser
+    if request.headers.get("content-type", "").startswith("application/json"):
+        try:
+            data = orjson.loads(await request.body())
+        except orjson.JSONDecodeError:
+            raise BadRequestException("Invalid JSON body")
+    else:
+        data = await request.form()
     logger.info(f"Received ClickBank IPN: {data}")
 
     return {"status": "received"}
@@ -26,8 +78,16 @@ async def stripe_webhook(request: Request):
     """
     Stripe webhook for subscription events
     """
-    # TODO: Implement Stripe webhook verification and processing
+    # TODO: Implement Stripe webhook processing
     payload = await request.body()
+
+    if settings.STRIPE_WEBHOOK_SECRET and not verify_stripe_signature(
+        payload,
+        request.headers.get("stripe-signature"),
+        settings.STRIPE_WEBHOOK_SECRET
+    ):
+        raise HTTPException(status_code=400, detail="Invalid signature")
+
     logger.info("Received Stripe webhook")
 
     return {"status": "received"}
@@ -1,15 +1,19 @@
 """WebSocket endpoints for real-time AI content streaming."""
-from typing import Dict, Set
+import asyncio
+from collections import deque
+from typing import Deque, Dict, List, Optional, Set
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends, Query, status
+from sqlalchemy import update, func, cast
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
+import itertools
 import json
-import uuid
+import orjson
 
 from app.database import get_db
-from app.models.user import User
 from app.models.content import Content
-from app.core.security import decode_access_token
-from app.services.claude import ClaudeService
+from app.dependencies import CurrentUser, get_current_user
+from app.services.claude import ClaudeService, claude_service
 from app.core.logging import logger
 
 router = APIRouter()
@@ -19,66 +23,165 @@ class ConnectionManager:
     """Manages WebSocket connections for real-time streaming."""
 
     def __init__(self):
-        self.active_connections: Dict[str, WebSocket] = {}
+        self.active_connections: Dict[int, WebSocket] = {}
 
-    async def connect(self, websocket: WebSocket, client_id: str):
+    async def connect(self, websocket: WebSocket, client_id: int) -> WebSocket:
         """Accept and store a new WebSocket connection."""
         await websocket.accept()
         self.active_connections[client_id] = websocket
-        logger.info(f"WebSocket connected: {client_id}")
+        logger.info(f"WebSocket connected: ws-{client_id}")
+        return websocket
 
-    def disconnect(self, client_id: str):
+    def disconnect(self, client_id: int):
         """Remove a WebSocket connection."""
-        if client_id in self.active_connections:
-            del self.active_connections[client_id]
-            logger.info(f"WebSocket disconnected: {client_id}")
+        if self.active_connections.pop(client_id, None) is not None:
+            logger.info(f"WebSocket disconnected: ws-{client_id}")
 
-    async def send_message(self, message: dict, client_id: str):
+    # Senders take the WebSocket itself so the streaming loop skips the
+    # registry lookup; the dict is only needed for connect/disconnect.
+    # Messages are encoded with orjson and sent as binary UTF-8 JSON frames
+
+    async def send_message(self, message: dict, websocket: WebSocket):
         """Send a message to a specific client."""
-        if client_id in self.active_connections:
-            websocket = self.active_connections[client_id]
-            await websocket.send_json(message)
+        await websocket.send_bytes(orjson.dumps(message))
 
-    async def send_text_chunk(self, text: str, client_id: str):
+    async def send_text_chunk(self, text: str, websocket: WebSocket):
         """Send a text chunk to a specific client."""
-        await self.send_message({"type": "chunk", "content": text}, client_id)
+        await self.send_message({"type": "chunk", "content": text}, websocket)
 
-    async def send_error(self, error: str, client_id: str):
+    async def send_error(self, error: str, websocket: WebSocket):
         """Send an error message to a specific client."""
-        await self.send_message({"type": "error", "message": error}, client_id)
+        await self.send_message({"type": "error", "message": error}, websocket)
 
-    async def send_complete(self, content_id: str, client_id: str):
+    async def send_complete(self, content_id: str, websocket: WebSocket):
         """Send completion message to a specific client."""
-        await self.send_message(
-            {"type": "complete", "content_id": content_id}, client_id
-        )
+        await self.send_message({"type": "complete", "content_id": content_id}, websocket)
 
 
 manager = ConnectionManager()
 
+# Connection ids only need to be unique within this process
+_client_ids = itertools.count()
+
+
+class ChunkCoalescer:
+    """
+    Buffers streamed text and sends it as one chunk message once
+    max_chars characters have accumulated or max_delay has passed since
+    the first buffered piece, instead of one WebSocket frame per token.
+    """
+
+    def __init__(self, websocket: WebSocket, max_chars: int = 4096, max_delay: float = 0.02):
+        self.websocket = websocket
+        self.max_chars = max_chars
+        self.max_delay = max_delay
+        self._parts: List[str] = []
+        self._size = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._timer_tasks: Set[asyncio.Task] = set()
+        # First failure of a timer-driven flush, raised by the next flush()
+        self._error: Optional[BaseException] = None
+        # Serializes sends so timer and size flushes keep chunk order
+        self._lock = asyncio.Lock()
+
+    async def add(self, text: str):
+        """Buffer a piece of text, flushing when the size threshold is hit."""
+        self._parts.append(text)
+        self._size += len(text)
+
+        if self._size >= self.max_chars:
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                self.max_delay, self._on_timer
+            )
+
+    def _on_timer(self):
+        self._timer = None
+        task = asyncio.ensure_future(self.flush())
+        self._timer_tasks.add(task)
+        task.add_done_callback(self._on_timer_done)
+
+    def _on_timer_done(self, task: asyncio.Task):
+        self._timer_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None and self._error is None:
+            self._error = task.exception()
+
+    async def flush(self):
+        """Send everything buffered so far as a single chunk."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        # Let timer-driven flushes finish first so every chunk is sent before
+        # the caller moves on and their failures surface here
+        if asyncio.current_task() not in self._timer_tasks:
+            if self._timer_tasks:
+                await asyncio.gather(*self._timer_tasks, return_exceptions=True)
+            if self._error is not None:
+                raise self._error
+
+        async with self._lock:
+            if not self._parts:
+                return
+            text = "".join(self._parts)
+            self._parts = []
+            self._size = 0
+            await manager.send_text_chunk(text, self.websocket)
+
+    def cancel(self):
+        """Drop pending timer flushes without sending."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        for task in list(self._timer_tasks):
+            task.cancel()
+
 
 async def get_websocket_user(
     token: str = Query(...), db: AsyncSession = Depends(get_db)
-) -> User:
+) -> CurrentUser:
     """Authenticate WebSocket connection via token query parameter."""
     try:
-        payload = decode_access_token(token)
-        user_id = payload.get("sub")
-        if not user_id:
-            raise ValueError("Invalid token")
+        # Shares the Redis-cached projection used by the HTTP endpoints
+        return await get_current_user(token, db)
+    except Exception as e:
+        logger.error(f"WebSocket authentication failed: {str(e)}")
+        raise
 
-        from sqlalchemy import select
 
-        result = await db.execute(select(User).where(User.id == user_id))
-        user = result.scalar_one_or_none()
+async def _watch_disconnect(websocket: WebSocket, pending: Deque[str]):
+    """Raise WebSocketDisconnect on disconnect, queueing other client frames."""
+    while True:
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            raise WebSocketDisconnect(message.get("code", 1000))
+        if message.get("text") is not None:
+            pending.append(message["text"])
 
-        if not user:
-            raise ValueError("User not found")
 
-        return user
-    except Exception as e:
-        logger.error(f"WebSocket authentication failed: {str(e)}")
-        raise
+async def _stream_generation(
+    claude_service: ClaudeService,
+    prompt: str,
+    websocket: WebSocket,
+    parts: List[str],
+    watcher: asyncio.Task,
+):
+    """Stream generated text to the client, coalescing tokens into larger frames."""
+    coalescer = ChunkCoalescer(websocket)
+    try:
+        async for chunk in claude_service.generate_content_stream(
+            prompt=prompt, max_tokens=3000
+        ):
+            parts.append(chunk)
+            await coalescer.add(chunk)
+
+        # Send the tail before the completion message
+        await coalescer.flush()
+    finally:
+        # Generation is over; stop listening for disconnects
+        coalescer.cancel()
+        watcher.cancel()
 
 
 @router.websocket("/ws/content/generate")
@@ -99,40 +202,42 @@ async def websocket_generate_content(
         "metadata": {}
     }
     """
-    client_id = str(uuid.uuid4())
+    client_id = next(_client_ids)
 
     try:
         # Authenticate user
         user = await get_websocket_user(token, db)
 
         # Connect WebSocket
-        await manager.connect(websocket, client_id)
+        ws = await manager.connect(websocket, client_id)
 
         # Send connection confirmation
         await manager.send_message(
-            {"type": "connected", "message": "Ready to generate content"}, client_id
+            {"type": "connected", "message": "Ready to generate content"}, ws
         )
 
-        claude_service = ClaudeService()
+        # Client frames that arrive while a generation is streaming
+        pending: Deque[str] = deque()
 
         while True:
             # Receive message from client
-            data = await websocket.receive_text()
+            data = pending.popleft() if pending else await websocket.receive_text()
             message = json.loads(data)
 
-            try:
-                content_type = message.get("type")
-                campaign_id = message.get("campaign_id")
-                prompt = message.get("prompt")
-                title = message.get("title")
-                metadata = message.get("metadata", {})
-
-                if not content_type or not prompt:
-                    await manager.send_error(
-                        "Missing required fields: type and prompt", client_id
-                    )
-                    continue
+            content_type = message.get("type")
+            campaign_id = message.get("campaign_id")
+            prompt = message.get("prompt")
+            title = message.get("title")
+            metadata = message.get("metadata", {})
+
+            if not content_type or not prompt:
+                await manager.send_error(
+                    "Missing required fields: type and prompt", ws
+                )
+                continue
 
+            content = None
+            try:
                 # Create content record
                 content = Content(
                     user_id=user.id,
@@ -149,45 +254,57 @@ async def websocket_generate_content(
 
                 # Send content ID to client
                 await manager.send_message(
-                    {"type": "started", "content_id": str(content.id)}, client_id
+                    {"type": "started", "content_id": str(content.id)}, ws
                 )
 
-                # Stream content generation
-                generated_text = ""
-                async for chunk in claude_service.generate_content_stream(
-                    prompt=prompt, max_tokens=3000
-                ):
-                    generated_text += chunk
-                    await manager.send_text_chunk(chunk, client_id)
+                # Stream alongside a disconnect watcher; a client disconnect
+                # cancels the Claude stream instead of letting it run out
+                parts: List[str] = []
+                async with asyncio.TaskGroup() as tg:
+                    watcher = tg.create_task(_watch_disconnect(websocket, pending))
+                    tg.create_task(
+                        _stream_generation(claude_service, prompt, ws, parts, watcher)
+                    )
 
                 # Update content with final generated text
-                content.body = generated_text
+                content.body = "".join(parts)
                 content.status = "draft"
                 await db.commit()
 
                 # Send completion message
-                await manager.send_complete(str(content.id), client_id)
+                await manager.send_complete(str(content.id), ws)
 
                 logger.info(
                     f"Content generated successfully: {content.id} for user {user.id}"
                 )
 
-            except Exception as e:
+            except* WebSocketDisconnect:
+                raise WebSocketDisconnect()
+            except* Exception as group:
+                e = group.exceptions[0]
                 logger.error(f"Error generating content: {str(e)}")
-                await manager.send_error(f"Generation failed: {str(e)}", client_id)
+                await manager.send_error(f"Generation failed: {str(e)}", ws)
 
                 # Update content status to failed if it exists
-                if "content" in locals():
-                    content.status = "failed"
-                    content.metadata = {
-                        **(content.metadata or {}),
-                        "error": str(e),
-                    }
+                if content is not None:
+                    # Merge the error into metadata inside the database
+                    await db.rollback()
+                    metadata_column = Content.__table__.c.metadata
+                    await db.execute(
+                        update(Content)
+                        .where(Content.id == content.id)
+                        .values({
+                            Content.status: "failed",
+                            metadata_column: func.coalesce(
+                                metadata_column, cast({}, JSONB)
+                            ).op("||")(func.jsonb_build_object("error", str(e))),
+                        })
+                    )
                     await db.commit()
 
     except WebSocketDisconnect:
         manager.disconnect(client_id)
-        logger.info(f"WebSocket disconnected normally: {client_id}")
+        logger.info(f"WebSocket disconnected normally: ws-{client_id}")
     except Exception as e:
         logger.error(f"WebSocket error: {str(e)}")
         manager.disconnect(client_id)
@@ -204,18 +321,18 @@ async def websocket_analytics(
 
     Streams analytics events as they happen for the authenticated user.
     """
-    client_id = str(uuid.uuid4())
+    client_id = next(_client_ids)
 
     try:
         # Authenticate user
         user = await get_websocket_user(token, db)
 
         # Connect WebSocket
-        await manager.connect(websocket, client_id)
+        ws = await manager.connect(websocket, client_id)
 
         # Send connection confirmation
         await manager.send_message(
-            {"type": "connected", "message": "Analytics stream ready"}, client_id
+            {"type": "connected", "message": "Analytics stream ready"}, ws
         )
 
         # Keep connection alive and send periodic updates
@@ -226,14 +343,14 @@ async def websocket_analytics(
                 message = json.loads(data)
 
                 if message.get("type") == "ping":
-                    await manager.send_message({"type": "pong"}, client_id)
+                    await manager.send_message({"type": "pong"}, ws)
 
             except WebSocketDisconnect:
                 break
 
     except WebSocketDisconnect:
         manager.disconnect(client_id)
-        logger.info(f"Analytics WebSocket disconnected: {client_id}")
+        logger.info(f"Analytics WebSocket disconnected: ws-{client_id}")
     except Exception as e:
         logger.error(f"Analytics WebSocket error: {str(e)}")
         manager.disconnect(client_id)
@@ -1,42 +1,65 @@
 """
 Workflow endpoints
 """
-from typing import List
-from fastapi import APIRouter, Depends
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update, delete, func, tuple_
 
 from app.db.session import get_db
 from app.models.workflow import Workflow
-from app.models.user import User
-from app.schemas.workflow import WorkflowCreate, WorkflowUpdate, WorkflowResponse
-from app.dependencies import get_current_user
+from app.schemas.workflow import WorkflowCreate, WorkflowUpdate, WorkflowResponse, WorkflowPage
+from app.dependencies import CurrentUser, get_current_user
 from app.core.exceptions import NotFoundException
+from app.core.etag import compute_etag, etag_matches
+from app.core.pagination import encode_cursor, decode_cursor
 
 router = APIRouter()
 
 
-@router.get("", response_model=List[WorkflowResponse])
+@router.get("", response_model=WorkflowPage)
 async def list_workflows(
-    current_user: User = Depends(get_current_user),
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
     List user's workflows
     """
-    result = await db.execute(
-        select(Workflow).where(Workflow.user_id == current_user.id)
-        .order_by(Workflow.created_at.desc())
-    )
-    workflows = result.scalars().all()
+    # Core select of the list columns only; rows come back as plain mappings
+    workflows = Workflow.__table__
+    stmt = select(
+        workflows.c.id,
+        workflows.c.name,
+        workflows.c.status,
+        workflows.c.trigger_type,
+        workflows.c.created_at
+    ).where(workflows.c.user_id == current_user.id)
+
+    # Keyset pagination walks ix_workflows_user_created_id
+    if cursor is not None:
+        cursor_created_at, cursor_id = decode_cursor(cursor)
+        stmt = stmt.where(
+            tuple_(workflows.c.created_at, workflows.c.id) < tuple_(cursor_created_at, cursor_id)
+        )
+
+    stmt = stmt.order_by(workflows.c.created_at.desc(), workflows.c.id.desc()).limit(limit)
 
-    return workflows
+    result = await db.execute(stmt)
+    items = result.mappings().all()
+
+    next_cursor = None
+    if len(items) == limit:
+        next_cursor = encode_cursor(items[-1]["created_at"], items[-1]["id"])
+
+    return {"items": items, "next_cursor": next_cursor}
 
 
 @router.post("", response_model=WorkflowResponse)
 async def create_workflow(
     workflow_data: WorkflowCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -61,7 +84,9 @@ async def create_workflow(
 @router.get("/{workflow_id}", response_model=WorkflowResponse)
 async def get_workflow(
     workflow_id: str,
-    current_user: User = Depends(get_current_user),
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -78,6 +103,11 @@ async def get_workflow(
     if not workflow:
         raise NotFoundException("Workflow not found")
 
+    etag = compute_etag(workflow)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
     return workflow
 
 
@@ -85,37 +115,29 @@ async def get_workflow(
 async def update_workflow(
     workflow_id: str,
     workflow_update: WorkflowUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Update workflow
     """
+    # Single UPDATE ... RETURNING; no row means missing or not owned
+    values = workflow_update.model_dump(exclude_none=True)
     result = await db.execute(
-        select(Workflow).where(
+        update(Workflow)
+        .where(
             Workflow.id == workflow_id,
             Workflow.user_id == current_user.id
         )
+        .values(**values, updated_at=func.now())
+        .returning(Workflow)
     )
     workflow = result.scalar_one_or_none()
 
     if not workflow:
         raise NotFoundException("Workflow not found")
 
-    # Update fields
-    if workflow_update.name is not None:
-        workflow.name = workflow_update.name
-    if workflow_update.status is not None:
-        workflow.status = workflow_update.status
-    if workflow_update.trigger_config is not None:
-        workflow.trigger_config = workflow_update.trigger_config
-    if workflow_update.actions is not None:
-        workflow.actions = workflow_update.actions
-    if workflow_update.conditions is not None:
-        workflow.conditions = workflow_update.conditions
-
     await db.commit()
-    await db.refresh(workflow)
 
     return workflow
 
@@ -123,24 +145,24 @@ async def update_workflow(
 @router.delete("/{workflow_id}")
 async def delete_workflow(
     workflow_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Delete workflow
     """
     result = await db.execute(
-        select(Workflow).where(
+        delete(Workflow)
+        .where(
             Workflow.id == workflow_id,
             Workflow.user_id == current_user.id
         )
+        .returning(Workflow.id)
     )
-    workflow = result.scalar_one_or_none()
 
-    if not workflow:
+    if result.scalar_one_or_none() is None:
         raise NotFoundException("Workflow not found")
 
-    await db.delete(workflow)
     await db.commit()
 
     return {"message": "Workflow deleted successfully"}
@@ -1,9 +1,10 @@
 """
 Application configuration
 """
+from functools import cached_property
 from typing import List
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from pydantic import AnyHttpUrl, field_validator
+from pydantic import AnyHttpUrl, ValidationInfo, field_validator
 
 
 class Settings(BaseSettings):
@@ -12,7 +13,9 @@ class Settings(BaseSettings):
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
-        case_sensitive=True
+        case_sensitive=True,
+        # Loaded once at import; modules snapshot hot-path values into constants
+        frozen=True
     )
 
     # Application
@@ -24,7 +27,12 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str
+    # Logs every statement through the logging pipeline; forced off in production
     DATABASE_ECHO: bool = False
+    # "async" runs Alembic in the background on startup; "off" leaves it to the deploy
+    MIGRATION_MODE: str = "off"
+    # Monthly analytics_events partitions older than this are detached and dropped
+    ANALYTICS_RETENTION_MONTHS: int = 24
 
     # Redis
     REDIS_URL: str
@@ -40,6 +48,18 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
 
+    # Password hashing - argon2id for new hashes; bcrypt hashes still verify
+    # and are upgraded on the next successful login
+    ARGON2_TIME_COST: int = 2
+    ARGON2_MEMORY_COST: int = 19456
+    ARGON2_PARALLELISM: int = 1
+    BCRYPT_ROUNDS: int = 12
+
+    # AI provider: "deepseek", "openai" or "anthropic"
+    AI_PROVIDER: str = "deepseek"
+    DEEPSEEK_API_KEY: str = ""
+    OPENAI_API_KEY: str = ""
+
     # Anthropic (Claude AI)
     ANTHROPIC_API_KEY: str
 
@@ -80,6 +100,8 @@ class Settings(BaseSettings):
     # Monitoring
     SENTRY_DSN: str = ""
     SENTRY_ENVIRONMENT: str = "development"
+    SENTRY_TRACES_SAMPLE_RATE: float = 0.1
+    SENTRY_PROFILES_SAMPLE_RATE: float = 0.0
 
     # Logging
     LOG_LEVEL: str = "INFO"
@@ -113,15 +135,23 @@ class Settings(BaseSettings):
     AGENCY_CAMPAIGNS_LIMIT: int = 999999
     AGENCY_STORAGE_GB: int = 500
 
-    @property
+    @field_validator("DATABASE_ECHO", mode="after")
+    @classmethod
+    def disable_echo_in_production(cls, v: bool, info: ValidationInfo) -> bool:
+        """Never echo SQL in production"""
+        if info.data.get("APP_ENV") == "production":
+            return False
+        return v
+
+    @cached_property
     def cors_origins_list(self) -> List[str]:
-        """Parse CORS origins from JSON string"""
+        """Parse CORS origins from JSON string (once per process)"""
         import json
         return json.loads(self.CORS_ORIGINS)
 
-    @property
+    @cached_property
     def tier_limits(self) -> dict:
-        """Get tier limits as dictionary"""
+        """Get tier limits as dictionary (built once per process)"""
         return {
             "starter": {
                 "content": self.STARTER_CONTENT_LIMIT,
@@ -1,28 +1,67 @@
 """
 Redis caching utilities
 """
-import json
-from typing import Optional, Any
+import os
+from typing import Optional, Any, Dict, Iterable, Tuple
+import msgspec
 import redis.asyncio as redis
 
 from app.config import settings
 
-# Create Redis client
+# Shared client over a bounded, process-wide connection pool
+redis_pool: Optional[redis.BlockingConnectionPool] = None
 redis_client: Optional[redis.Redis] = None
 
+# Concurrent Redis connections per process; callers wait for a free one
+REDIS_MAX_CONNECTIONS = min(32, (os.cpu_count() or 1) * 4)
+REDIS_POOL_TIMEOUT = 5
+
+# Default TTL for cache_set, read from the frozen settings once
+DEFAULT_CACHE_TTL = settings.REDIS_CACHE_TTL
+
+# Cached values are stored as a format version byte followed by MessagePack
+CACHE_FORMAT_VERSION = b"\x01"
+_encoder = msgspec.msgpack.Encoder()
+_decoder = msgspec.msgpack.Decoder()
+
+
+def init_redis() -> redis.Redis:
+    """
+    Create the connection pool and the client that shares it
+    """
+    global redis_pool, redis_client
+
+    # Cache payloads are binary, so responses are left undecoded
+    redis_pool = redis.BlockingConnectionPool.from_url(
+        settings.REDIS_URL,
+        max_connections=REDIS_MAX_CONNECTIONS,
+        timeout=REDIS_POOL_TIMEOUT
+    )
+    redis_client = redis.Redis(connection_pool=redis_pool)
+    return redis_client
+
+
+async def close_redis() -> None:
+    """
+    Close the shared client and disconnect every pooled connection
+    """
+    global redis_pool, redis_client
+
+    if redis_client is not None:
+        await redis_client.aclose()
+        redis_client = None
+    if redis_pool is not None:
+        await redis_pool.disconnect()
+        redis_pool = None
+
 
 async def get_redis() -> redis.Redis:
     """
     Get Redis client instance
     """
-    global redis_client
-
+    # The API creates the client in its lifespan; workers create it on first use
     if redis_client is None:
-        redis_client = redis.from_url(
-            settings.REDIS_URL,
-            encoding="utf-8",
-            decode_responses=True
-        )
+        return init_redis()
 
     return redis_client
 
@@ -34,11 +73,12 @@ async def cache_get(key: str) -> Optional[Any]:
     client = await get_redis()
     value = await client.get(key)
 
-    if value:
+    # Entries written in another format are treated as a miss
+    if value and value[:1] == CACHE_FORMAT_VERSION:
         try:
-            return json.loads(value)
-        except json.JSONDecodeError:
-            return value
+            return _decoder.decode(value[1:])
+        except msgspec.DecodeError:
+            return None
 
     return None
 
@@ -50,13 +90,9 @@ async def cache_set(key: str, value: Any, ttl: int = None) -> bool:
     client = await get_redis()
 
     if ttl is None:
-        ttl = settings.REDIS_CACHE_TTL
+        ttl = DEFAULT_CACHE_TTL
 
-    # Serialize value
-    if isinstance(value, (dict, list)):
-        value = json.dumps(value)
-
-    await client.setex(key, ttl, value)
+    await client.setex(key, ttl, CACHE_FORMAT_VERSION + _encoder.encode(value))
     return True
 
 
@@ -69,14 +105,125 @@ async def cache_delete(key: str) -> bool:
     return True
 
 
+# Keys per SCAN page and per UNLINK command
+CLEAR_BATCH_SIZE = 500
+
+
 async def cache_clear_pattern(pattern: str) -> int:
     """
     Delete all keys matching pattern
     """
     client = await get_redis()
-    keys = await client.keys(pattern)
+    deleted = 0
+    batch = []
+
+    # SCAN walks the keyspace incrementally instead of blocking Redis like
+    # KEYS; each full batch is deleted before scanning on, so memory stays
+    # bounded by CLEAR_BATCH_SIZE. UNLINK reclaims memory in a background thread
+    async for key in client.scan_iter(match=pattern, count=CLEAR_BATCH_SIZE):
+        batch.append(key)
+        if len(batch) >= CLEAR_BATCH_SIZE:
+            deleted += await client.unlink(*batch)
+            batch = []
+
+    if batch:
+        deleted += await client.unlink(*batch)
+
+    return deleted
+
 
-    if keys:
-        return await client.delete(*keys)
+# Dashboard metrics cache
+DASHBOARD_CACHE_TTL = 30
 
+# Generation counters outlive any dashboard recompute in flight
+DASHBOARD_GENERATION_TTL = 3600
+
+# Store recomputed counters only if no write invalidated the dashboard while
+# they were being computed; otherwise they may already be stale
+_DASHBOARD_SET_SCRIPT = """
+if (redis.call('GET', KEYS[2]) or '0') ~= ARGV[1] then
     return 0
+end
+redis.call('DEL', KEYS[1])
+for i = 3, #ARGV, 2 do
+    redis.call('HSET', KEYS[1], ARGV[i], ARGV[i + 1])
+end
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return 1
+"""
+
+
+def dashboard_cache_key(user_id: Any) -> str:
+    """
+    Build the dashboard metrics cache key for a user
+    """
+    return f"dash:{user_id}"
+
+
+def dashboard_generation_key(user_id: Any) -> str:
+    """
+    Build the dashboard invalidation counter key for a user
+    """
+    return f"dash:gen:{user_id}"
+
+
+async def get_dashboard(user_id: Any) -> Tuple[Optional[Dict[str, str]], str]:
+    """
+    Get cached dashboard counters for a user
+
+    Returns the counters (None on a miss) and the generation to pass to
+    set_dashboard when the counters are recomputed.
+    """
+    client = await get_redis()
+
+    async with client.pipeline(transaction=True) as pipe:
+        pipe.hgetall(dashboard_cache_key(user_id))
+        pipe.get(dashboard_generation_key(user_id))
+        value, generation = await pipe.execute()
+
+    generation = generation.decode() if generation else "0"
+    if not value:
+        return None, generation
+
+    return {field.decode(): count.decode() for field, count in value.items()}, generation
+
+
+async def set_dashboard(
+    user_id: Any,
+    counters: Dict[str, Any],
+    generation: str,
+    ttl: int = DASHBOARD_CACHE_TTL
+) -> bool:
+    """
+    Cache recomputed dashboard counters unless the dashboard was invalidated
+    after generation was read
+    """
+    client = await get_redis()
+
+    args = [generation, ttl]
+    for field, value in counters.items():
+        args.extend((field, str(value)))
+
+    stored = await client.eval(
+        _DASHBOARD_SET_SCRIPT,
+        2,
+        dashboard_cache_key(user_id),
+        dashboard_generation_key(user_id),
+        *args
+    )
+    return bool(stored)
+
+
+async def invalidate_dashboard(user_ids: Iterable[Any]) -> None:
+    """
+    Drop cached dashboard counters after campaign or analytics writes
+    """
+    client = await get_redis()
+
+    async with client.pipeline(transaction=False) as pipe:
+        for user_id in set(user_ids):
+            generation_key = dashboard_generation_key(user_id)
+            pipe.incr(generation_key)
+            pipe.expire(generation_key, DASHBOARD_GENERATION_TTL)
+            pipe.unlink(dashboard_cache_key(user_id))
+        await pipe.execute()
@@ -0,0 +1,22 @@
+"""
+ETag helpers for conditional GET responses
+"""
+from typing import Any, Optional
+
+
+def compute_etag(obj: Any) -> str:
+    """
+    Weak ETag derived from a row's id and updated_at
+    """
+    return f'W/"{obj.id}-{obj.updated_at.timestamp()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header value against an ETag
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (tag.strip() for tag in if_none_match.split(","))
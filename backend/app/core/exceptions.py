@@ -48,3 +48,9 @@ class TierLimitException(HTTPException):
     """Tier limit exceeded exception"""
     def __init__(self, detail: str = "Tier limit exceeded"):
         super().__init__(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
+
+
+class ServiceUnavailableException(HTTPException):
+    """Service temporarily unavailable exception"""
+    def __init__(self, detail: str = "Service temporarily unavailable"):
+        super().__init__(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=detail)
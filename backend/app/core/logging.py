@@ -1,12 +1,36 @@
 """
 Logging configuration
 """
+import atexit
 import logging
+import queue
 import sys
-from pythonjsonlogger import jsonlogger
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+import orjson
 
 from app.config import settings
 
+# Formats and writes queued records on a background thread
+_listener: Optional[QueueListener] = None
+
+
+class OrjsonFormatter(logging.Formatter):
+    """
+    One JSON object per record, encoded with orjson
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "asctime": self.formatTime(record),
+            "name": record.name,
+            "levelname": record.levelname,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return orjson.dumps(payload, default=str).decode()
+
 
 def setup_logging() -> None:
     """
@@ -25,17 +49,34 @@ def setup_logging() -> None:
 
     # Use JSON formatter in production
     if settings.APP_ENV == "production":
-        formatter = jsonlogger.JsonFormatter(
-            '%(asctime)s %(name)s %(levelname)s %(message)s'
-        )
+        formatter = OrjsonFormatter()
     else:
         formatter = logging.Formatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         )
 
     handler.setFormatter(formatter)
-    logger.addHandler(handler)
+
+    # Request code only enqueues records; formatting and the stdout write
+    # happen on the listener thread
+    global _listener
+    if _listener is None:
+        log_queue: queue.Queue = queue.Queue(-1)
+        logger.addHandler(QueueHandler(log_queue))
+        _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(stop_logging)
 
     # Disable propagation for some noisy loggers
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
     logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+
+
+def stop_logging() -> None:
+    """
+    Flush queued log records and stop the listener thread
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -0,0 +1,42 @@
+"""
+ASGI middleware
+"""
+from typing import Dict
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class UploadSizeLimitMiddleware:
+    """
+    Reject requests whose Content-Length exceeds the limit for their path
+    with 413, before any of the body is read.
+
+    Route handlers only run after FastAPI has parsed (and spooled) a
+    multipart body, so the check has to happen here. Requests without a
+    Content-Length are left to the streaming size check.
+    """
+
+    def __init__(self, app: ASGIApp, limits: Dict[str, int]):
+        self.app = app
+        self.limits = limits
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "http":
+            limit = self.limits.get(scope["path"])
+            if limit is not None:
+                content_length = None
+                for name, value in scope["headers"]:
+                    if name == b"content-length":
+                        content_length = value
+                        break
+
+                if content_length is not None and content_length.isdigit() and int(content_length) > limit:
+                    response = JSONResponse(
+                        status_code=413,
+                        content={"detail": "Request body too large"}
+                    )
+                    await response(scope, receive, send)
+                    return
+
+        await self.app(scope, receive, send)
@@ -0,0 +1,32 @@
+"""
+Keyset pagination cursors
+"""
+import base64
+from datetime import datetime
+from typing import Tuple
+from uuid import UUID
+
+from app.core.exceptions import BadRequestException
+
+
+def encode_cursor(created_at: datetime, row_id: UUID) -> str:
+    """
+    Opaque cursor for the (created_at, id) of the last row on a page
+
+    Base64url without padding, so it can go into a query string as is;
+    the raw isoformat offset "+00:00" would otherwise decode as a space
+    """
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Parse a cursor produced by encode_cursor
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, row_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), UUID(row_id)
+    except ValueError:
+        raise BadRequestException("Invalid cursor")
@@ -1,15 +1,45 @@
 """
 Security utilities for authentication and password hashing
 """
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
-from jose import JWTError, jwt
+import asyncio
+import time
+from typing import Optional, Dict, Any, Tuple
+import jwt
+import msgspec
 from passlib.context import CryptContext
 
 from app.config import settings
 
 # Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__time_cost=settings.ARGON2_TIME_COST,
+    argon2__memory_cost=settings.ARGON2_MEMORY_COST,
+    argon2__parallelism=settings.ARGON2_PARALLELISM,
+    bcrypt__rounds=settings.BCRYPT_ROUNDS
+)
+
+# JWT key material and decode options resolved once at import
+_JWT_KEY = settings.JWT_SECRET_KEY.encode()
+_JWT_ALGORITHM = settings.JWT_ALGORITHM
+_JWT_ALGORITHMS = [_JWT_ALGORITHM]
+_JWT_DECODE_OPTIONS = {"require": ["exp", "type"]}
+
+
+class TokenPayload(msgspec.Struct, frozen=True):
+    """
+    Validated JWT claims
+    """
+    sub: str
+    exp: int
+    type: str
+
+
+# Token lifetimes in seconds
+_ACCESS_TTL = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+_REFRESH_TTL = settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -19,6 +49,13 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password and return a replacement hash if the stored one is outdated
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
 def get_password_hash(password: str) -> str:
     """
     Hash a password for storing
@@ -26,23 +63,47 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
-def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
     """
-    Create a JWT access token
+    Verify a password on the default thread pool so hashing doesn't block the event loop
     """
-    to_encode = data.copy()
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, verify_password, plain_password, hashed_password)
+
+
+async def verify_and_update_password_async(
+    plain_password: str,
+    hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """
+    Verify and rehash-check a password on the default thread pool
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        None, verify_and_update_password, plain_password, hashed_password
+    )
+
+
+async def get_password_hash_async(password: str) -> str:
+    """
+    Hash a password on the default thread pool so hashing doesn't block the event loop
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, get_password_hash, password)
 
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
 
-    to_encode.update({"exp": expire, "type": "access"})
+def create_access_token(data: Dict[str, Any], expires_in: Optional[int] = None) -> str:
+    """
+    Create a JWT access token, optionally expiring after expires_in seconds
+    """
+    to_encode = data.copy()
+    to_encode["exp"] = int(time.time()) + (expires_in or _ACCESS_TTL)
+    to_encode["type"] = "access"
 
     encoded_jwt = jwt.encode(
         to_encode,
-        settings.JWT_SECRET_KEY,
-        algorithm=settings.JWT_ALGORITHM
+        _JWT_KEY,
+        algorithm=_JWT_ALGORITHM
     )
 
     return encoded_jwt
@@ -53,54 +114,50 @@ def create_refresh_token(data: Dict[str, Any]) -> str:
     Create a JWT refresh token
     """
     to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
-
-    to_encode.update({"exp": expire, "type": "refresh"})
+    to_encode["exp"] = int(time.time()) + _REFRESH_TTL
+    to_encode["type"] = "refresh"
 
     encoded_jwt = jwt.encode(
         to_encode,
-        settings.JWT_SECRET_KEY,
-        algorithm=settings.JWT_ALGORITHM
+        _JWT_KEY,
+        algorithm=_JWT_ALGORITHM
     )
 
     return encoded_jwt
 
 
-def decode_access_token(token: str) -> Optional[Dict[str, Any]]:
+def _decode_token(token: str, token_type: str) -> Optional[TokenPayload]:
     """
-    Decode and validate a JWT access token
+    Verify a JWT's signature and expiry and check its token type
     """
     try:
-        payload = jwt.decode(
-            token,
-            settings.JWT_SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM]
+        payload = msgspec.convert(
+            jwt.decode(
+                token,
+                _JWT_KEY,
+                algorithms=_JWT_ALGORITHMS,
+                options=_JWT_DECODE_OPTIONS
+            ),
+            TokenPayload
         )
+    except (jwt.PyJWTError, msgspec.ValidationError):
+        return None
 
-        # Verify it's an access token
-        if payload.get("type") != "access":
-            return None
-
-        return payload
-    except JWTError:
+    if payload.type != token_type:
         return None
 
+    return payload
+
 
-def decode_refresh_token(token: str) -> Optional[Dict[str, Any]]:
+def decode_access_token(token: str) -> Optional[TokenPayload]:
     """
-    Decode and validate a JWT refresh token
+    Decode and validate a JWT access token
     """
-    try:
-        payload = jwt.decode(
-            token,
-            settings.JWT_SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM]
-        )
+    return _decode_token(token, "access")
 
-        # Verify it's a refresh token
-        if payload.get("type") != "refresh":
-            return None
 
-        return payload
-    except JWTError:
-        return None
+def decode_refresh_token(token: str) -> Optional[TokenPayload]:
+    """
+    Decode and validate a JWT refresh token
+    """
+    return _decode_token(token, "refresh")
@@ -0,0 +1,78 @@
+"""
+Bulk analytics event ingest via COPY
+"""
+import logging
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Dict, Sequence, Tuple
+
+from app.db.session import engine, json_dumps
+from app.models.analytics import EventType
+
+logger = logging.getLogger(__name__)
+
+ANALYTICS_COPY_COLUMNS = [
+    "user_id",
+    "campaign_id",
+    "event_type",
+    "source",
+    "metadata",
+    "revenue",
+    "created_at",
+]
+
+
+async def bulk_insert_events(conn, records: Sequence[Tuple]) -> None:
+    """
+    COPY pre-built records into analytics_events on a raw asyncpg connection
+    """
+    await conn.copy_records_to_table(
+        "analytics_events",
+        records=records,
+        columns=ANALYTICS_COPY_COLUMNS,
+    )
+
+
+def _to_record(event: Dict[str, Any]) -> Tuple:
+    """
+    Convert an event dict into a COPY record in ANALYTICS_COPY_COLUMNS order
+    """
+    metadata = event.get("metadata")
+    revenue = event.get("revenue")
+
+    return (
+        event["user_id"],
+        event.get("campaign_id"),
+        # Stored the same way the ORM Enum column writes it
+        EventType(event["event_type"]).name,
+        event.get("source"),
+        json_dumps(metadata) if metadata is not None else None,
+        Decimal(str(revenue)) if revenue is not None else None,
+        # COPY does not apply column defaults for listed columns
+        event.get("created_at") or datetime.now(timezone.utc),
+    )
+
+
+async def copy_events(events: Sequence[Dict[str, Any]]) -> int:
+    """
+    Insert analytics events with a single COPY and invalidate dashboard caches
+    """
+    if not events:
+        return 0
+
+    records = [_to_record(event) for event in events]
+
+    # The ORM cannot issue COPY, so drop down to the asyncpg connection
+    async with engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        await bulk_insert_events(raw.driver_connection, records)
+
+    # Cached dashboards for these users no longer match the table
+    from app.core.cache import invalidate_dashboard
+
+    try:
+        await invalidate_dashboard(event["user_id"] for event in events)
+    except Exception as e:
+        logger.warning(f"Failed to invalidate dashboard cache: {e}")
+
+    return len(records)
@@ -2,6 +2,7 @@
 Initialize database with default data
 """
 import asyncio
+import logging
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import async_session_maker
@@ -9,6 +10,8 @@ from app.db.base import Base
 from app.models.user import User
 from app.core.security import get_password_hash
 
+logger = logging.getLogger(__name__)
+
 
 async def init_db() -> None:
     """
@@ -36,7 +39,7 @@ async def init_db() -> None:
                 )
                 session.add(test_user)
                 await session.commit()
-                print("Test user created: admin@test.com / admin123")
+                logger.info("Test user created: admin@test.com / admin123")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,85 @@
+"""
+Background database migrations
+"""
+import asyncio
+import logging
+import os
+from typing import Dict, Optional
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.config import settings
+from app.core.exceptions import ServiceUnavailableException
+from app.db.session import MIGRATION_CONNECT_ARGS
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Migration state exposed through /health/migration
+migration_state: Dict[str, Optional[str]] = {
+    "status": "done",
+    "current_revision": None,
+    "target_revision": None,
+}
+
+
+def get_alembic_config() -> Config:
+    """
+    Build Alembic config for running migrations from inside the app
+    """
+    config = Config(os.path.join(BACKEND_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(BACKEND_DIR, "alembic"))
+    # Keep the application's logging configuration intact
+    config.attributes["configure_logger"] = False
+    return config
+
+
+async def get_current_revision() -> Optional[str]:
+    """
+    Read the revision currently stamped in the database
+    """
+    engine = create_async_engine(
+        settings.DATABASE_URL,
+        poolclass=NullPool,
+        connect_args=MIGRATION_CONNECT_ARGS
+    )
+    try:
+        async with engine.connect() as connection:
+            return await connection.run_sync(
+                lambda sync_conn: MigrationContext.configure(sync_conn).get_current_revision()
+            )
+    finally:
+        await engine.dispose()
+
+
+async def run_migrations_async() -> None:
+    """
+    Upgrade the database to head while the app keeps serving requests
+    """
+    config = get_alembic_config()
+    migration_state["status"] = "running"
+    migration_state["target_revision"] = ScriptDirectory.from_config(config).get_current_head()
+
+    try:
+        # env.py drives its own event loop, so run Alembic on a worker thread
+        await asyncio.to_thread(command.upgrade, config, "head")
+        migration_state["current_revision"] = await get_current_revision()
+        migration_state["status"] = "done"
+        logger.info(f"Database migrated to {migration_state['current_revision']}")
+    except Exception as e:
+        migration_state["status"] = "failed"
+        logger.error(f"Database migration failed: {e}")
+
+
+async def require_migrations_complete() -> None:
+    """
+    Reject requests with 503 until background migrations have finished
+    """
+    if migration_state["status"] != "done":
+        raise ServiceUnavailableException("Database migration in progress")
@@ -1,18 +1,50 @@
 """
 Database session management
 """
-from typing import AsyncGenerator
+import json
+from functools import lru_cache
+from typing import AsyncContextManager, AsyncGenerator, Callable, List, Type
+from uuid import uuid4
+import orjson
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import Select
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.pool import NullPool
 
 from app.config import settings
+from app.core.pagination import encode_cursor
+
+# Connection arguments for migration engines: DDL invalidates asyncpg's
+# cached statement plans, so caching is disabled while schema changes run
+MIGRATION_CONNECT_ARGS = {
+    "statement_cache_size": 0,
+    "prepared_statement_cache_size": 0,
+}
+
+
+def json_dumps(value) -> str:
+    """
+    Serialize a JSONB value with orjson
+    """
+    # Non-string keys are stringified the way the json module does
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
 
 # Create async engine
+# Prepared statements keep their cache but get unique names so plans from
+# different deployed pods never collide behind a pooler
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DATABASE_ECHO,
     poolclass=NullPool,
-    future=True
+    future=True,
+    # Room for every statement shape the app builds, so none get recompiled
+    query_cache_size=1200,
+    json_serializer=json_dumps,
+    json_deserializer=orjson.loads,
+    connect_args={
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+    }
 )
 
 # Create async session maker
@@ -38,3 +70,85 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             raise
         finally:
             await session.close()
+
+
+SessionFactory = Callable[[], AsyncContextManager[AsyncSession]]
+
+
+def get_session_factory() -> SessionFactory:
+    """
+    Dependency for the session factory used by streaming responses
+    """
+    return async_session_maker
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(schema: Type[BaseModel]) -> TypeAdapter:
+    """
+    Compiled List[schema] validator/serializer, built once per schema
+    """
+    return TypeAdapter(List[schema])
+
+
+def _encode_partition(adapter: TypeAdapter, rows) -> bytes:
+    """
+    Validate and serialize a batch of ORM rows in one call, without the
+    surrounding brackets
+    """
+    items = adapter.validate_python(rows, from_attributes=True)
+    return adapter.dump_json(items)[1:-1]
+
+
+async def stream_json_array(
+    stmt: Select,
+    schema: Type[BaseModel],
+    yield_per: int = 200,
+    session_factory: SessionFactory = async_session_maker
+) -> AsyncGenerator[bytes, None]:
+    """
+    Stream query results as a JSON array using a server-side cursor
+
+    Opens its own session because request-scoped sessions are closed before
+    a streaming response body is sent.
+    """
+    async with session_factory() as session:
+        result = await session.stream(stmt.execution_options(yield_per=yield_per))
+
+        adapter = _list_adapter(schema)
+        yield b"["
+        separator = b""
+        async for rows in result.scalars().partitions():
+            yield separator + _encode_partition(adapter, rows)
+            separator = b","
+        yield b"]"
+
+
+async def stream_json_page(
+    stmt: Select,
+    schema: Type[BaseModel],
+    limit: int,
+    yield_per: int = 200,
+    session_factory: SessionFactory = async_session_maker
+) -> AsyncGenerator[bytes, None]:
+    """
+    Stream one keyset page as {"items": [...], "next_cursor": ...}
+
+    Rows must be ordered by (created_at DESC, id DESC). next_cursor encodes
+    the last row's (created_at, id) when the page is full, otherwise null.
+    """
+    async with session_factory() as session:
+        result = await session.stream(stmt.limit(limit).execution_options(yield_per=yield_per))
+
+        adapter = _list_adapter(schema)
+        yield b'{"items":['
+        separator = b""
+        count = 0
+        last = None
+        async for rows in result.scalars().partitions():
+            yield separator + _encode_partition(adapter, rows)
+            separator = b","
+            count += len(rows)
+            last = rows[-1]
+
+        next_cursor = encode_cursor(last.created_at, last.id) if count == limit else None
+        yield b'],"next_cursor":' + json.dumps(next_cursor).encode() + b"}"
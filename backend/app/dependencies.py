@@ -1,30 +1,75 @@
 """
 FastAPI dependencies
 """
+import logging
+from dataclasses import dataclass
 from typing import AsyncGenerator
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from uuid import UUID
+from fastapi import Depends, HTTPException, Request, status
+from sqlalchemy import select, bindparam
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import get_db
 from app.core.security import decode_access_token
+from app.core.cache import cache_get, cache_set, cache_delete
 from app.models.user import User
 from app.config import settings
 
-# Security scheme
-security = HTTPBearer()
+logger = logging.getLogger(__name__)
 
+# Authorization header prefix for bearer tokens
+BEARER_PREFIX = "bearer "
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db)
-) -> User:
+# Built once so every request reuses the same compiled-cache entry
+USER_BY_ID = select(User).where(User.id == bindparam("user_id"))
+
+# Tier ranks for access checks; UserTier is a str enum, so it hashes and
+# compares like its value
+_TIER_RANK: dict[str, int] = {"starter": 1, "professional": 2, "agency": 3}
+
+
+# Authenticated user projection cached per user id, so one delete covers
+# every session of that user
+USER_CACHE_TTL = 60
+
+
+@dataclass(frozen=True)
+class CurrentUser:
+    """
+    Slim user record for dependencies that only read identity and access fields
+    """
+    id: UUID
+    email: str
+    tier: str
+    status: str
+
+
+def user_cache_key(user_id: UUID) -> str:
+    """
+    Build the cache key for a user's authenticated projection
+    """
+    return f"u:{user_id}"
+
+
+async def get_token(request: Request) -> str:
     """
-    Get current authenticated user from JWT token
+    Extract the bearer token from the Authorization header
     """
-    token = credentials.credentials
+    authorization = request.headers.get("authorization")
+    if not authorization or authorization[:7].lower() != BEARER_PREFIX or not authorization[7:]:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    return authorization[7:]
 
-    # Decode and validate token
+
+def _token_user_id(token: str) -> UUID:
+    """
+    Validate an access token and return the user id it was issued for
+    """
     payload = decode_access_token(token)
     if not payload:
         raise HTTPException(
@@ -33,17 +78,29 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user_id = payload.get("sub")
-    if not user_id:
+    try:
+        return UUID(payload.sub)
+    except (TypeError, ValueError):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token payload"
         )
 
-    # Get user from database
-    from sqlalchemy import select
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+
+def _check_suspended(user_status: str) -> None:
+    if user_status == "suspended":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Account suspended"
+        )
+
+
+async def _load_user(db: AsyncSession, user_id: UUID) -> User:
+    """
+    Load an authenticated user row, rejecting unknown or suspended users
+    """
+    # Primary-key lookup goes through the session identity map first
+    user = await db.get(User, user_id)
 
     if not user:
         raise HTTPException(
@@ -51,18 +108,78 @@ async def get_current_user(
             detail="User not found"
         )
 
-    if user.status == "suspended":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Account suspended"
+    _check_suspended(user.status)
+    return user
+
+
+async def get_current_db_user(
+    token: str = Depends(get_token),
+    db: AsyncSession = Depends(get_db)
+) -> User:
+    """
+    Get the full authenticated user row from the database
+    """
+    return await _load_user(db, _token_user_id(token))
+
+
+async def get_current_user(
+    token: str = Depends(get_token),
+    db: AsyncSession = Depends(get_db)
+) -> CurrentUser:
+    """
+    Get current authenticated user from JWT token, served from Redis when cached
+    """
+    user_id = _token_user_id(token)
+    cache_key = user_cache_key(user_id)
+
+    try:
+        cached = await cache_get(cache_key)
+    except Exception as e:
+        logger.warning(f"User cache read failed: {e}")
+        cached = None
+
+    if cached:
+        _check_suspended(cached["status"])
+        return CurrentUser(
+            id=user_id,
+            email=cached["email"],
+            tier=cached["tier"],
+            status=cached["status"]
         )
 
-    return user
+    user = await _load_user(db, user_id)
+    current_user = CurrentUser(
+        id=user.id,
+        email=user.email,
+        tier=user.tier.value,
+        status=user.status.value
+    )
+
+    try:
+        await cache_set(cache_key, {
+            "email": current_user.email,
+            "tier": current_user.tier,
+            "status": current_user.status
+        }, ttl=USER_CACHE_TTL)
+    except Exception as e:
+        logger.warning(f"User cache write failed: {e}")
+
+    return current_user
+
+
+async def invalidate_current_user(user_id: UUID) -> None:
+    """
+    Drop the cached user projection after the user row changes
+    """
+    try:
+        await cache_delete(user_cache_key(user_id))
+    except Exception as e:
+        logger.warning(f"User cache delete failed: {e}")
 
 
 async def get_active_user(
-    current_user: User = Depends(get_current_user)
-) -> User:
+    current_user: CurrentUser = Depends(get_current_user)
+) -> CurrentUser:
     """
     Get current active user (not on trial or canceled)
     """
@@ -76,17 +193,12 @@ async def get_active_user(
 
 async def check_tier_access(
     required_tier: str,
-    current_user: User = Depends(get_current_user)
-) -> User:
+    current_user: CurrentUser = Depends(get_current_user)
+) -> CurrentUser:
     """
     Check if user has required tier access
     """
-    tier_hierarchy = {"starter": 1, "professional": 2, "agency": 3}
-
-    user_tier_level = tier_hierarchy.get(current_user.tier, 0)
-    required_tier_level = tier_hierarchy.get(required_tier, 0)
-
-    if user_tier_level < required_tier_level:
+    if _TIER_RANK.get(current_user.tier, 0) < _TIER_RANK.get(required_tier, 0):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail=f"This feature requires {required_tier} tier or higher"
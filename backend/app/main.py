@@ -1,30 +1,80 @@
 """
 Main FastAPI application
 """
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 import sentry_sdk
 from sentry_sdk.integrations.fastapi import FastApiIntegration
 
 from app.config import settings
 from app.api.v1.router import api_router
 from app.core.logging import setup_logging
+from app.db.migrations import migration_state, run_migrations_async, require_migrations_complete
+from app.core.middleware import UploadSizeLimitMiddleware
+from app.core.cache import init_redis, close_redis
+from app.services.clickbank import clickbank_service
+from app.services.storage import MAX_UPLOAD_SIZE, get_storage_service
 
 # Setup logging
 setup_logging()
 
+# Polled by load balancers; never worth a trace
+UNTRACED_PATHS = frozenset({"/", "/health", "/health/migration"})
+
+
+def traces_sampler(sampling_context: dict) -> float:
+    """Sample request traces, skipping health checks"""
+    path = sampling_context.get("asgi_scope", {}).get("path")
+    if path in UNTRACED_PATHS:
+        return 0.0
+    return settings.SENTRY_TRACES_SAMPLE_RATE
+
+
 # Initialize Sentry if DSN is provided
 if settings.SENTRY_DSN:
     sentry_sdk.init(
         dsn=settings.SENTRY_DSN,
         environment=settings.SENTRY_ENVIRONMENT,
         integrations=[FastApiIntegration()],
-        traces_sample_rate=1.0 if settings.DEBUG else 0.1,
+        traces_sampler=traces_sampler,
+        profiles_sample_rate=settings.SENTRY_PROFILES_SAMPLE_RATE,
     )
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup and shutdown"""
+    app.state.redis = init_redis()
+
+    # Build and cache the OpenAPI document (every schema's JSON schema)
+    # before serving, instead of on the first /openapi.json request
+    app.openapi()
+
+    migration_task = None
+    if settings.MIGRATION_MODE == "async":
+        migration_task = asyncio.create_task(run_migrations_async())
+
+    yield
+
+    if migration_task is not None and not migration_task.done():
+        migration_task.cancel()
+
+    await close_redis()
+
+    await clickbank_service.aclose()
+
+    if get_storage_service.cache_info().currsize:
+        await get_storage_service().aclose()
+
+
 # Create FastAPI app
 app = FastAPI(
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     title=settings.APP_NAME,
     version=settings.API_VERSION,
     debug=settings.DEBUG,
@@ -32,6 +82,17 @@ app = FastAPI(
     redoc_url="/redoc" if settings.DEBUG else None,
 )
 
+# Reject oversized uploads from Content-Length before the body is read;
+# the slack covers multipart framing around the file data
+UPLOAD_BODY_SLACK = 1024 * 1024
+app.add_middleware(
+    UploadSizeLimitMiddleware,
+    limits={
+        f"/api/{settings.API_VERSION}/uploads/upload": MAX_UPLOAD_SIZE + UPLOAD_BODY_SLACK,
+        f"/api/{settings.API_VERSION}/uploads/upload-multiple": 10 * MAX_UPLOAD_SIZE + UPLOAD_BODY_SLACK,
+    }
+)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -41,14 +102,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress JSON responses; small bodies like /health aren't worth the CPU
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return JSONResponse(
-        status_code=200,
+    ready = migration_state["status"] == "done"
+    return ORJSONResponse(
+        status_code=200 if ready else 503,
         content={
-            "status": "healthy",
+            "status": "healthy" if ready else "migrating",
             "app": settings.APP_NAME,
             "version": settings.API_VERSION,
             "environment": settings.APP_ENV
@@ -56,6 +121,15 @@ async def health_check():
     )
 
 
+@app.get("/health/migration")
+async def migration_health_check():
+    """Background migration status"""
+    return ORJSONResponse(
+        status_code=200 if migration_state["status"] == "done" else 503,
+        content=migration_state
+    )
+
+
 @app.get("/")
 async def root():
     """Root endpoint"""
@@ -67,7 +141,11 @@ async def root():
 
 
 # Include API router
-app.include_router(api_router, prefix=f"/api/{settings.API_VERSION}")
+app.include_router(
+    api_router,
+    prefix=f"/api/{settings.API_VERSION}",
+    dependencies=[Depends(require_migrations_complete)]
+)
 
 
 if __name__ == "__main__":
@@ -76,5 +154,8 @@ if __name__ == "__main__":
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=settings.DEBUG
+        reload=settings.DEBUG,
+        # uvloop and httptools ship with uvicorn[standard]
+        loop="uvloop",
+        http="httptools"
     )
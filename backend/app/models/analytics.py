@@ -3,7 +3,7 @@ Analytics event model
 """
 import uuid
 import enum
-from sqlalchemy import Column, String, Enum, Numeric, BigInteger, DateTime, ForeignKey, Index
+from sqlalchemy import Column, String, Enum, Numeric, BigInteger, DateTime, ForeignKey, Index, DDL, event, func
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 
@@ -24,13 +24,15 @@ class AnalyticsEvent(Base):
     __tablename__ = "analytics_events"
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    # Served by the leading column of ix_analytics_user_event_rev
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     campaign_id = Column(UUID(as_uuid=True), ForeignKey("campaigns.id", ondelete="CASCADE"), nullable=True, index=True)
     event_type = Column(Enum(EventType), nullable=False, index=True)
     source = Column(String, nullable=True)  # traffic source
     metadata = Column(JSONB, nullable=True)  # Additional event data
     revenue = Column(Numeric(10, 2), nullable=True)
-    created_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    # Partition key, so part of the primary key
+    created_at = Column(DateTime(timezone=True), primary_key=True, server_default=func.now(), nullable=False)
 
     # Relationships
     campaign = relationship("Campaign", back_populates="analytics")
@@ -38,7 +40,21 @@ class AnalyticsEvent(Base):
     # Composite index for common queries
     __table_args__ = (
         Index('idx_analytics_user_campaign_type_date', 'user_id', 'campaign_id', 'event_type', 'created_at'),
+        # Covering index for dashboard aggregates
+        Index('ix_analytics_user_event_rev', 'user_id', 'event_type', postgresql_include=['revenue']),
+        # Append-only, time-ordered rows: BRIN instead of a B-tree
+        Index('ix_analytics_created_at', 'created_at', postgresql_using='brin', postgresql_with={'pages_per_range': 64}),
+        # Monthly partitions are created by the create_analytics_partitions() SQL function
+        {'postgresql_partition_by': 'RANGE (created_at)'},
     )
 
     def __repr__(self):
         return f"<AnalyticsEvent {self.event_type}>"
+
+
+# A partitioned table needs at least one partition to accept rows
+event.listen(
+    AnalyticsEvent.__table__,
+    "after_create",
+    DDL("CREATE TABLE IF NOT EXISTS analytics_events_default PARTITION OF analytics_events DEFAULT")
+)
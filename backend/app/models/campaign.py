@@ -3,7 +3,7 @@ Campaign model
 """
 import uuid
 import enum
-from sqlalchemy import Column, String, Enum, Text, ForeignKey
+from sqlalchemy import Column, String, Enum, Text, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 
@@ -39,5 +39,12 @@ class Campaign(Base, TimestampMixin):
     content = relationship("Content", back_populates="campaign", cascade="all, delete-orphan")
     analytics = relationship("AnalyticsEvent", back_populates="campaign", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # Partial index for active campaign counts (Enum stores member names)
+        Index('ix_campaigns_user_status', 'user_id', 'status', postgresql_where=text("status = 'ACTIVE'")),
+        # Keyset pagination for campaign lists
+        Index('ix_campaigns_user_created_id', 'user_id', text('created_at DESC'), text('id DESC')),
+    )
+
     def __repr__(self):
         return f"<Campaign {self.name}>"
@@ -3,7 +3,7 @@ Content model
 """
 import uuid
 import enum
-from sqlalchemy import Column, String, Enum, Text, DateTime, ForeignKey
+from sqlalchemy import Column, String, Enum, Text, DateTime, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 
@@ -47,5 +47,10 @@ class Content(Base, TimestampMixin):
     user = relationship("User", back_populates="content")
     campaign = relationship("Campaign", back_populates="content")
 
+    # Keyset pagination for content lists
+    __table_args__ = (
+        Index('ix_content_user_created_id', 'user_id', text('created_at DESC'), text('id DESC')),
+    )
+
     def __repr__(self):
         return f"<Content {self.type}: {self.title}>"
@@ -2,9 +2,9 @@
 Product model for ClickBank products
 """
 import uuid
-from sqlalchemy import Column, String, Numeric, Integer, Boolean, Text, DateTime
-from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Numeric, Integer, Boolean, Text, DateTime, Computed, Index, text
+from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 
 from app.db.base import Base, TimestampMixin
 
@@ -23,15 +23,27 @@ class Product(Base, TimestampMixin):
     commission_rate = Column(Numeric(5, 2), nullable=True)  # Percentage
     commission_amount = Column(Numeric(10, 2), nullable=True)  # Dollar amount
     initial_sale_amount = Column(Numeric(10, 2), nullable=True)
-    gravity = Column(Numeric(10, 2), nullable=True, index=True)
+    gravity = Column(Numeric(10, 2), nullable=False, default=0, server_default=text('0'), index=True)
     refund_rate = Column(Numeric(5, 2), nullable=True)
     rebill = Column(Boolean, default=False)
     popularity_rank = Column(Integer, nullable=True)
     data_snapshot = Column(JSONB, nullable=True)  # Store full API response
     last_updated = Column(DateTime(timezone=True), nullable=True)
 
+    # Full-text search document, maintained by Postgres (GIN indexed)
+    search_tsv = deferred(Column(
+        TSVECTOR,
+        Computed("to_tsvector('english', coalesce(title, '') || ' ' || coalesce(description, ''))", persisted=True)
+    ))
+
     # Relationships
     campaigns = relationship("Campaign", back_populates="product")
 
+    # Filter + gravity sort indexes for product search
+    __table_args__ = (
+        Index('ix_products_cat_gravity', 'category', text('gravity DESC'), text('id DESC')),
+        Index('ix_products_rebill_gravity', 'rebill', text('gravity DESC'), text('id DESC')),
+    )
+
     def __repr__(self):
         return f"<Product {self.clickbank_id}: {self.title}>"
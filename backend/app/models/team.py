@@ -3,7 +3,7 @@ Team and team member models
 """
 import uuid
 import enum
-from sqlalchemy import Column, String, Enum, Boolean, ForeignKey
+from sqlalchemy import Column, String, Enum, Boolean, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 
@@ -51,5 +51,10 @@ class TeamMember(Base, TimestampMixin):
     # Relationships
     team = relationship("Team", back_populates="members")
 
+    # One active membership per user and team; inactive rows allow re-joining
+    __table_args__ = (
+        Index('uq_team_user_active', 'team_id', 'user_id', unique=True, postgresql_where=text('is_active')),
+    )
+
     def __repr__(self):
         return f"<TeamMember {self.role}>"
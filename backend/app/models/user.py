@@ -2,7 +2,7 @@
 User model
 """
 import uuid
-from sqlalchemy import Column, String, Enum, DateTime, Boolean
+from sqlalchemy import Column, String, Enum, DateTime, Boolean, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import enum
@@ -38,7 +38,8 @@ class User(Base, TimestampMixin):
     stripe_customer_id = Column(String, nullable=True)
     stripe_subscription_id = Column(String, nullable=True)
     status = Column(Enum(UserStatus), default=UserStatus.TRIAL, nullable=False)
-    trial_ends_at = Column(DateTime(timezone=True), nullable=True)
+    # 14-day trial computed from the database clock
+    trial_ends_at = Column(DateTime(timezone=True), server_default=text("now() + interval '14 days'"), nullable=True)
     is_email_verified = Column(Boolean, default=False)
 
     # Relationships
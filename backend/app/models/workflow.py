@@ -3,7 +3,7 @@ Workflow model for automation
 """
 import uuid
 import enum
-from sqlalchemy import Column, String, Enum, DateTime, ForeignKey
+from sqlalchemy import Column, String, Enum, DateTime, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 
@@ -36,5 +36,10 @@ class Workflow(Base, TimestampMixin):
     # Relationships
     user = relationship("User", back_populates="workflows")
 
+    # Keyset pagination for workflow lists
+    __table_args__ = (
+        Index('ix_workflows_user_created_id', 'user_id', text('created_at DESC'), text('id DESC')),
+    )
+
     def __repr__(self):
         return f"<Workflow {self.name}>"
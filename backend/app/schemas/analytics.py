@@ -3,16 +3,18 @@ Analytics schemas
 """
 from typing import Optional, List
 from datetime import datetime
-from pydantic import BaseModel, UUID4
+from pydantic import BaseModel, ConfigDict, UUID4
 from decimal import Decimal
 
+from app.schemas.json_types import JSONObject
+
 
 class AnalyticsEventCreate(BaseModel):
     """Analytics event creation"""
     campaign_id: Optional[UUID4] = None
     event_type: str
     source: Optional[str] = None
-    metadata: Optional[dict] = None
+    metadata: Optional[JSONObject] = None
     revenue: Optional[Decimal] = None
 
 
@@ -25,6 +27,8 @@ class DashboardMetrics(BaseModel):
     average_commission: Decimal
     active_campaigns: int
 
+    model_config = ConfigDict(frozen=True)
+
 
 class CampaignAnalytics(BaseModel):
     """Campaign analytics response"""
@@ -34,7 +38,7 @@ class CampaignAnalytics(BaseModel):
     conversions: int
     revenue: Decimal
     conversion_rate: float
-    epc: Decimal  # Earnings per click
+    epc: float  # Earnings per click
 
 
 class RevenueDataPoint(BaseModel):
@@ -49,4 +53,4 @@ class TrafficSource(BaseModel):
     source: str
     clicks: int
     conversions: int
-    revenue: Decimal
+    revenue: float  # Reporting breakdown; billed amounts stay Decimal
@@ -1,9 +1,11 @@
 """
 Campaign schemas
 """
-from typing import Optional, Dict, Any
+from typing import Optional, List
 from datetime import datetime
-from pydantic import BaseModel, UUID4
+from pydantic import BaseModel, ConfigDict, UUID4
+
+from app.schemas.json_types import JSONObject
 
 
 class CampaignBase(BaseModel):
@@ -16,7 +18,7 @@ class CampaignBase(BaseModel):
 class CampaignCreate(CampaignBase):
     """Campaign creation schema"""
     product_id: Optional[UUID4] = None
-    settings: Optional[Dict[str, Any]] = None
+    settings: Optional[JSONObject] = None
 
 
 class CampaignUpdate(BaseModel):
@@ -25,7 +27,7 @@ class CampaignUpdate(BaseModel):
     status: Optional[str] = None
     funnel_type: Optional[str] = None
     affiliate_link: Optional[str] = None
-    settings: Optional[Dict[str, Any]] = None
+    settings: Optional[JSONObject] = None
 
 
 class CampaignResponse(CampaignBase):
@@ -35,9 +37,14 @@ class CampaignResponse(CampaignBase):
     product_id: Optional[UUID4] = None
     status: str
     tracking_id: Optional[str] = None
-    settings: Optional[Dict[str, Any]] = None
+    settings: Optional[JSONObject] = None
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+class CampaignPage(BaseModel):
+    """Keyset-paginated campaign list"""
+    items: List[CampaignResponse]
+    next_cursor: Optional[str] = None
@@ -1,9 +1,11 @@
 """
 Content schemas
 """
-from typing import Optional, Dict, Any
+from typing import Optional, List
 from datetime import datetime
-from pydantic import BaseModel, UUID4
+from pydantic import BaseModel, ConfigDict, UUID4
+
+from app.schemas.json_types import JSONObject
 
 
 class ContentBase(BaseModel):
@@ -16,7 +18,7 @@ class ContentBase(BaseModel):
 class ContentCreate(ContentBase):
     """Content creation schema"""
     campaign_id: Optional[UUID4] = None
-    metadata: Optional[Dict[str, Any]] = None
+    metadata: Optional[JSONObject] = None
 
 
 class ContentUpdate(BaseModel):
@@ -24,7 +26,7 @@ class ContentUpdate(BaseModel):
     title: Optional[str] = None
     body: Optional[str] = None
     status: Optional[str] = None
-    metadata: Optional[Dict[str, Any]] = None
+    metadata: Optional[JSONObject] = None
 
 
 class ContentResponse(ContentBase):
@@ -33,14 +35,19 @@ class ContentResponse(ContentBase):
     user_id: UUID4
     campaign_id: Optional[UUID4] = None
     status: str
-    metadata: Optional[Dict[str, Any]] = None
+    metadata: Optional[JSONObject] = None
     published_at: Optional[datetime] = None
     scheduled_for: Optional[datetime] = None
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+class ContentPage(BaseModel):
+    """Keyset-paginated content list"""
+    items: List[ContentResponse]
+    next_cursor: Optional[str] = None
 
 
 class ContentGenerateRequest(BaseModel):
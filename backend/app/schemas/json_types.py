@@ -0,0 +1,32 @@
+"""
+Opaque JSON field types
+"""
+from typing import Annotated, Any, Dict, List
+
+from pydantic import PlainValidator, WithJsonSchema
+
+
+def _require_object(value: Any) -> Dict[str, Any]:
+    if not isinstance(value, dict):
+        raise ValueError("Input should be a JSON object")
+    return value
+
+
+def _require_object_list(value: Any) -> List[Dict[str, Any]]:
+    if not isinstance(value, list) or not all(isinstance(item, dict) for item in value):
+        raise ValueError("Input should be a list of JSON objects")
+    return value
+
+
+# Stored as-is in JSON columns, so only the top-level shape is checked;
+# nested keys and values are not walked or copied
+JSONObject = Annotated[
+    Dict[str, Any],
+    PlainValidator(_require_object),
+    WithJsonSchema({"type": "object"}),
+]
+JSONObjectList = Annotated[
+    List[Dict[str, Any]],
+    PlainValidator(_require_object_list),
+    WithJsonSchema({"type": "array", "items": {"type": "object"}}),
+]
@@ -3,7 +3,7 @@ Product schemas
 """
 from typing import Optional, Dict, Any
 from datetime import datetime
-from pydantic import BaseModel, UUID4
+from pydantic import BaseModel, ConfigDict, UUID4
 from decimal import Decimal
 
 
@@ -19,18 +19,18 @@ class ProductBase(BaseModel):
 class ProductResponse(ProductBase):
     """Product response schema"""
     id: UUID4
-    commission_rate: Optional[Decimal] = None
+    # Rates and marketplace scores are informational; only money stays Decimal
+    commission_rate: Optional[float] = None
     commission_amount: Optional[Decimal] = None
     initial_sale_amount: Optional[Decimal] = None
-    gravity: Optional[Decimal] = None
-    refund_rate: Optional[Decimal] = None
+    gravity: Optional[float] = None
+    refund_rate: Optional[float] = None
     rebill: bool = False
     popularity_rank: Optional[int] = None
     last_updated: Optional[datetime] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class ProductSearch(BaseModel):
@@ -42,4 +42,5 @@ class ProductSearch(BaseModel):
     min_commission: Optional[float] = None
     has_rebill: Optional[bool] = None
     limit: int = 20
-    offset: int = 0
+    cursor_gravity: Optional[float] = None
+    cursor_id: Optional[UUID4] = None
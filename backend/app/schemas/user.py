@@ -3,7 +3,7 @@ User schemas
 """
 from typing import Optional
 from datetime import datetime
-from pydantic import BaseModel, EmailStr, UUID4, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, UUID4, Field
 
 
 class UserBase(BaseModel):
@@ -32,8 +32,7 @@ class UserResponse(UserBase):
     created_at: datetime
     trial_ends_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class UserLogin(BaseModel):
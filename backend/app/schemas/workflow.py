@@ -1,31 +1,33 @@
 """
 Workflow schemas
 """
-from typing import Optional, Dict, Any, List
+from typing import Optional, List
 from datetime import datetime
-from pydantic import BaseModel, UUID4
+from pydantic import BaseModel, ConfigDict, UUID4
+
+from app.schemas.json_types import JSONObject, JSONObjectList
 
 
 class WorkflowBase(BaseModel):
     """Base workflow schema"""
     name: str
     trigger_type: str
-    actions: List[Dict[str, Any]]
+    actions: JSONObjectList
 
 
 class WorkflowCreate(WorkflowBase):
     """Workflow creation schema"""
-    trigger_config: Optional[Dict[str, Any]] = None
-    conditions: Optional[Dict[str, Any]] = None
+    trigger_config: Optional[JSONObject] = None
+    conditions: Optional[JSONObject] = None
 
 
 class WorkflowUpdate(BaseModel):
     """Workflow update schema"""
     name: Optional[str] = None
     status: Optional[str] = None
-    trigger_config: Optional[Dict[str, Any]] = None
-    actions: Optional[List[Dict[str, Any]]] = None
-    conditions: Optional[Dict[str, Any]] = None
+    trigger_config: Optional[JSONObject] = None
+    actions: Optional[JSONObjectList] = None
+    conditions: Optional[JSONObject] = None
 
 
 class WorkflowResponse(WorkflowBase):
@@ -33,12 +35,26 @@ class WorkflowResponse(WorkflowBase):
     id: UUID4
     user_id: UUID4
     status: str
-    trigger_config: Optional[Dict[str, Any]] = None
-    conditions: Optional[Dict[str, Any]] = None
+    trigger_config: Optional[JSONObject] = None
+    conditions: Optional[JSONObject] = None
     last_run_at: Optional[datetime] = None
     next_run_at: Optional[datetime] = None
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+class WorkflowSummary(BaseModel):
+    """Workflow list item"""
+    id: UUID4
+    name: str
+    status: str
+    trigger_type: str
+    created_at: datetime
+
+
+class WorkflowPage(BaseModel):
+    """Keyset-paginated workflow list"""
+    items: List[WorkflowSummary]
+    next_cursor: Optional[str] = None
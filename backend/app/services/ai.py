@@ -1,11 +1,32 @@
 """
 AI service supporting multiple providers (Anthropic Claude, DeepSeek, OpenAI)
 """
-import os
-from typing import AsyncGenerator
+from functools import lru_cache
+from typing import Any, AsyncGenerator, Dict, List
+import httpx
+import orjson
 from openai import AsyncOpenAI
 from app.config import settings
 from app.core.logging import logger
+from app.services.prompts import (
+    PRODUCT_REVIEW_PROMPT,
+    PRODUCT_REVIEWS_PROMPT,
+    COMPARISON_PROMPT
+)
+
+# Output budget per product when reviews are generated in one call
+REVIEW_MAX_TOKENS_PER_PRODUCT = 800
+
+# Long generations stream for minutes; connecting should not
+AI_HTTP_TIMEOUT = httpx.Timeout(600.0, connect=5.0)
+AI_HTTP_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=100)
+
+
+def _build_http_client() -> httpx.AsyncClient:
+    """
+    Pooled HTTP/2 client so concurrent streams share connections to the provider
+    """
+    return httpx.AsyncClient(http2=True, timeout=AI_HTTP_TIMEOUT, limits=AI_HTTP_LIMITS)
 
 
 class AIService:
@@ -17,7 +38,7 @@ class AIService:
     - DeepSeek (via OpenAI-compatible API)
     - OpenAI (via openai library)
 
-    Configuration via environment variables:
+    Configuration via settings (environment variables):
     - AI_PROVIDER: "anthropic", "deepseek", or "openai" (default: "deepseek")
     - DEEPSEEK_API_KEY: API key for DeepSeek
     - ANTHROPIC_API_KEY: API key for Anthropic
@@ -25,27 +46,28 @@ class AIService:
     """
 
     def __init__(self):
-        self.provider = os.getenv("AI_PROVIDER", "deepseek").lower()
+        self.provider = settings.AI_PROVIDER.lower()
 
         if self.provider == "deepseek":
             # DeepSeek uses OpenAI-compatible API
-            api_key = os.getenv("DEEPSEEK_API_KEY") or os.getenv("ANTHROPIC_API_KEY")
+            api_key = settings.DEEPSEEK_API_KEY or settings.ANTHROPIC_API_KEY
             if not api_key:
                 raise ValueError("DEEPSEEK_API_KEY or ANTHROPIC_API_KEY must be set")
 
             self.client = AsyncOpenAI(
                 api_key=api_key,
-                base_url="https://api.deepseek.com"
+                base_url="https://api.deepseek.com",
+                http_client=_build_http_client()
             )
             self.model = "deepseek-chat"
             logger.info("AI Service initialized with DeepSeek provider")
 
         elif self.provider == "openai":
-            api_key = os.getenv("OPENAI_API_KEY")
+            api_key = settings.OPENAI_API_KEY
             if not api_key:
                 raise ValueError("OPENAI_API_KEY must be set")
 
-            self.client = AsyncOpenAI(api_key=api_key)
+            self.client = AsyncOpenAI(api_key=api_key, http_client=_build_http_client())
             self.model = "gpt-4-turbo-preview"
             logger.info("AI Service initialized with OpenAI provider")
 
@@ -55,7 +77,10 @@ class AIService:
             if not api_key:
                 raise ValueError("ANTHROPIC_API_KEY must be set")
 
-            self.client = anthropic.AsyncAnthropic(api_key=api_key)
+            self.client = anthropic.AsyncAnthropic(
+                api_key=api_key,
+                http_client=_build_http_client()
+            )
             self.model = "claude-sonnet-4-20250514"
             logger.info("AI Service initialized with Anthropic provider")
 
@@ -140,6 +165,71 @@ class AIService:
             )
             return response.choices[0].message.content
 
+    async def generate_json(
+        self,
+        prompt: str,
+        max_tokens: int = 2500,
+        temperature: float = 0.7
+    ) -> Dict[str, Any]:
+        """
+        Generate a JSON object response.
+
+        Args:
+            prompt: The prompt, which must ask for a JSON object
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+
+        Returns:
+            Parsed JSON object
+        """
+        if self.provider == "anthropic":
+            # Prefill the reply so the model continues straight into the object
+            response = await self.client.messages.create(
+                model=self.model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                messages=[
+                    {"role": "user", "content": prompt},
+                    {"role": "assistant", "content": "{"}
+                ]
+            )
+            return orjson.loads("{" + response.content[0].text)
+
+        else:
+            # OpenAI-compatible JSON mode (DeepSeek, OpenAI)
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=max_tokens,
+                temperature=temperature,
+                response_format={"type": "json_object"}
+            )
+            return orjson.loads(response.choices[0].message.content)
+
+    @staticmethod
+    def _review_prompt(
+        product_title: str,
+        product_description: str,
+        tone: str,
+        length: str
+    ) -> str:
+        return PRODUCT_REVIEW_PROMPT.format_map({
+            "title": product_title,
+            "description": product_description,
+            "tone": tone,
+            "length": length
+        })
+
+    @staticmethod
+    def _comparison_prompt(products: list, tone: str) -> str:
+        product_list = "\n".join(
+            f"- {p['title']}: {p['description']}" for p in products
+        )
+        return COMPARISON_PROMPT.format_map({
+            "product_list": product_list,
+            "tone": tone
+        })
+
     async def generate_product_review(
         self,
         product_title: str,
@@ -148,24 +238,51 @@ class AIService:
         length: str = "medium"
     ) -> str:
         """Generate a product review."""
-        prompt = f"""Write a compelling product review for the following ClickBank product:
+        prompt = self._review_prompt(product_title, product_description, tone, length)
 
-Product: {product_title}
-Description: {product_description}
-
-Tone: {tone}
-Length: {length}
+        return await self.generate_content(prompt)
 
-The review should:
-- Highlight key features and benefits
-- Be honest and balanced
-- Include a clear call-to-action
-- Be optimized for conversions
-- Sound natural and authentic
+    async def generate_product_review_stream(
+        self,
+        product_title: str,
+        product_description: str,
+        tone: str = "professional",
+        length: str = "medium"
+    ) -> AsyncGenerator[str, None]:
+        """Stream a product review as it is generated."""
+        prompt = self._review_prompt(product_title, product_description, tone, length)
 
-Write the review now:"""
+        async for chunk in self.generate_content_stream(prompt):
+            yield chunk
 
-        return await self.generate_content(prompt)
+    async def generate_product_reviews(
+        self,
+        products: List[Dict[str, Any]],
+        tone: str = "professional",
+        length: str = "medium"
+    ) -> List[str]:
+        """Generate reviews for several products in a single request."""
+        if not products:
+            return []
+
+        product_list = "\n".join(
+            f"{i}. {p['title']}: {p['description']}" for i, p in enumerate(products, 1)
+        )
+        prompt = PRODUCT_REVIEWS_PROMPT.format_map({
+            "product_list": product_list,
+            "tone": tone,
+            "length": length,
+            "count": len(products)
+        })
+
+        data = await self.generate_json(
+            prompt, max_tokens=REVIEW_MAX_TOKENS_PER_PRODUCT * len(products)
+        )
+        reviews = data.get("reviews")
+        if not isinstance(reviews, list) or len(reviews) != len(products):
+            raise ValueError("Model returned a malformed review batch")
+
+        return [str(review) for review in reviews]
 
     async def generate_comparison(
         self,
@@ -173,27 +290,15 @@ Write the review now:"""
         tone: str = "professional"
     ) -> str:
         """Generate a product comparison."""
-        product_list = "\n".join([
-            f"- {p['title']}: {p['description']}" for p in products
-        ])
-
-        prompt = f"""Write a detailed comparison of these ClickBank products:
-
-{product_list}
-
-Create a comprehensive comparison that:
-- Compares features, pricing, and value
-- Highlights pros and cons of each
-- Provides a clear recommendation
-- Includes a comparison table
-- Ends with a strong call-to-action
-
-Tone: {tone}
-
-Write the comparison now:"""
+        prompt = self._comparison_prompt(products, tone)
 
         return await self.generate_content(prompt, max_tokens=3000)
 
 
-# Create singleton instance
-ai_service = AIService()
+@lru_cache(maxsize=1)
+def get_ai_service() -> AIService:
+    """
+    Shared AIService, created on first use so importing this module
+    doesn't build a provider client or require an API key
+    """
+    return AIService()
@@ -5,7 +5,7 @@ DEPRECATED: Use app.services.ai.AIService instead
 This file maintained for backward compatibility
 """
 from typing import AsyncGenerator
-from app.services.ai import ai_service
+from app.services.ai import get_ai_service
 
 
 class ClaudeService:
@@ -13,7 +13,7 @@ class ClaudeService:
     Claude AI service wrapper (delegates to AIService)
 
     This class is maintained for backward compatibility.
-    New code should use app.services.ai.ai_service directly.
+    New code should use app.services.ai.get_ai_service() directly.
     """
 
     async def generate_content_stream(
@@ -22,7 +22,7 @@ class ClaudeService:
         max_tokens: int = 2500
     ) -> AsyncGenerator[str, None]:
         """Generate content with streaming (delegates to AIService)"""
-        async for chunk in ai_service.generate_content_stream(prompt, max_tokens):
+        async for chunk in get_ai_service().generate_content_stream(prompt, max_tokens):
             yield chunk
 
     async def generate_product_review(
@@ -33,17 +33,26 @@ class ClaudeService:
         length: str = "medium"
     ) -> str:
         """Generate a product review (delegates to AIService)"""
-        return await ai_service.generate_product_review(
+        return await get_ai_service().generate_product_review(
             product_title, product_description, tone, length
         )
 
+    async def generate_product_reviews(
+        self,
+        products: list,
+        tone: str = "professional",
+        length: str = "medium"
+    ) -> list:
+        """Generate reviews for several products in one call (delegates to AIService)"""
+        return await get_ai_service().generate_product_reviews(products, tone, length)
+
     async def generate_comparison(
         self,
         products: list,
         tone: str = "professional"
     ) -> str:
         """Generate a product comparison (delegates to AIService)"""
-        return await ai_service.generate_comparison(products, tone)
+        return await get_ai_service().generate_comparison(products, tone)
 
 
 # Create singleton instance
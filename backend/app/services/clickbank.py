@@ -1,13 +1,19 @@
 """
 ClickBank API service
 """
+import asyncio
 import httpx
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Awaitable, Callable, Hashable
+from cachetools import TTLCache
 from app.config import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Marketplace listings change slowly; statistics for closed date ranges don't
+PRODUCTS_CACHE_TTL = 300
+STATISTICS_CACHE_TTL = 900
+
 
 class ClickBankService:
     """ClickBank API service"""
@@ -17,6 +23,75 @@ class ClickBankService:
     def __init__(self):
         self.api_key = settings.CLICKBANK_API_KEY
         self.developer_key = settings.CLICKBANK_DEVELOPER_KEY
+        # One pooled client so calls reuse keep-alive connections; opened on
+        # first use so it belongs to the event loop that actually runs the calls
+        self._http: Optional[httpx.AsyncClient] = None
+        self._http_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._products_cache: TTLCache = TTLCache(maxsize=256, ttl=PRODUCTS_CACHE_TTL)
+        self._statistics_cache: TTLCache = TTLCache(maxsize=64, ttl=STATISTICS_CACHE_TTL)
+        # Upstream requests in flight, shared by concurrent callers of the same key
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+    @property
+    def _client(self) -> httpx.AsyncClient:
+        """
+        Pooled HTTP client for the running event loop
+        """
+        loop = asyncio.get_running_loop()
+        if self._http is None or self._http_loop is not loop:
+            # A client opened on another loop cannot be reused here
+            self._http = httpx.AsyncClient(
+                base_url=self.BASE_URL,
+                http2=True,
+                timeout=30.0,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+            )
+            self._http_loop = loop
+        return self._http
+
+    async def aclose(self) -> None:
+        """
+        Close pooled connections
+        """
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+            self._http_loop = None
+
+    async def __aenter__(self) -> "ClickBankService":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def _cached(
+        self,
+        cache: TTLCache,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Serve key from cache, or run fetch once for all concurrent callers
+        """
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._store(cache, key, t))
+
+        # A cancelled caller must not cancel the fetch other callers wait on
+        return await asyncio.shield(task)
+
+    def _store(self, cache: TTLCache, key: Hashable, task: asyncio.Task) -> None:
+        self._inflight.pop(key, None)
+        # Failures are not cached so the next call retries
+        if not task.cancelled() and task.exception() is None:
+            cache[key] = task.result()
 
     async def get_products(
         self,
@@ -31,35 +106,44 @@ class ClickBankService:
             logger.warning("ClickBank Developer Key not configured")
             return []
 
-        async with httpx.AsyncClient() as client:
-            try:
-                headers = {
-                    "Authorization": f"Bearer {self.developer_key}"
-                }
+        try:
+            return await self._cached(
+                self._products_cache,
+                ("products", category, page, results_per_page),
+                lambda: self._fetch_products(category, page, results_per_page)
+            )
+        except Exception as e:
+            logger.error(f"Error fetching ClickBank products: {e}")
+            return []
 
-                params = {
-                    "page": page,
-                    "resultsPerPage": results_per_page
-                }
+    async def _fetch_products(
+        self,
+        category: Optional[str],
+        page: int,
+        results_per_page: int
+    ) -> List[Dict[str, Any]]:
+        headers = {
+            "Authorization": f"Bearer {self.developer_key}"
+        }
 
-                if category:
-                    params["category"] = category
+        params = {
+            "page": page,
+            "resultsPerPage": results_per_page
+        }
 
-                response = await client.get(
-                    f"{self.BASE_URL}/products",
-                    headers=headers,
-                    params=params,
-                    timeout=30.0
-                )
+        if category:
+            params["category"] = category
 
-                response.raise_for_status()
-                data = response.json()
+        response = await self._client.get(
+            "/products",
+            headers=headers,
+            params=params
+        )
 
-                return data.get("products", [])
+        response.raise_for_status()
+        data = response.json()
 
-            except Exception as e:
-                logger.error(f"Error fetching ClickBank products: {e}")
-                return []
+        return data.get("products", [])
 
     async def get_account_statistics(
         self,
@@ -73,30 +157,38 @@ class ClickBankService:
             logger.warning("ClickBank API Key not configured")
             return {}
 
-        async with httpx.AsyncClient() as client:
-            try:
-                headers = {
-                    "Authorization": f"Bearer {self.api_key}"
-                }
-
-                params = {
-                    "startDate": start_date,
-                    "endDate": end_date
-                }
-
-                response = await client.get(
-                    f"{self.BASE_URL}/accounts/statistics",
-                    headers=headers,
-                    params=params,
-                    timeout=30.0
-                )
-
-                response.raise_for_status()
-                return response.json()
-
-            except Exception as e:
-                logger.error(f"Error fetching ClickBank statistics: {e}")
-                return {}
+        try:
+            return await self._cached(
+                self._statistics_cache,
+                ("statistics", start_date, end_date),
+                lambda: self._fetch_account_statistics(start_date, end_date)
+            )
+        except Exception as e:
+            logger.error(f"Error fetching ClickBank statistics: {e}")
+            return {}
+
+    async def _fetch_account_statistics(
+        self,
+        start_date: str,
+        end_date: str
+    ) -> Dict[str, Any]:
+        headers = {
+            "Authorization": f"Bearer {self.api_key}"
+        }
+
+        params = {
+            "startDate": start_date,
+            "endDate": end_date
+        }
+
+        response = await self._client.get(
+            "/accounts/statistics",
+            headers=headers,
+            params=params
+        )
+
+        response.raise_for_status()
+        return response.json()
 
 
 # Create singleton instance
@@ -1,12 +1,33 @@
 """
 Email service using Postmark
 """
+import asyncio
+from typing import List, Tuple
+
 from postmarker.core import PostmarkClient
 from app.config import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Postmark accepts at most 500 messages per batch request
+POSTMARK_BATCH_SIZE = 500
+
+# Email bodies, filled in with format_map
+_WELCOME_HTML_TMPL = """
+<h1>Welcome {full_name}!</h1>
+<p>Thank you for signing up for {app_name}.</p>
+<p>Your 14-day free trial has started. Start exploring the platform and create your first campaign!</p>
+<p>If you have any questions, feel free to reach out to our support team.</p>
+<p>Best regards,<br>The {app_name} Team</p>
+"""
+
+_CONTENT_READY_HTML_TMPL = """
+<h1>Your content is ready!</h1>
+<p>The AI has finished generating: <strong>{content_title}</strong></p>
+<p><a href="{frontend_url}/content/{content_id}">View your content</a></p>
+"""
+
 
 class EmailService:
     """Email service"""
@@ -25,17 +46,12 @@ class EmailService:
             return
 
         try:
-            self.client.emails.send(
+            await asyncio.to_thread(
+                self.client.emails.send,
                 From=settings.POSTMARK_FROM_EMAIL,
                 To=to_email,
                 Subject=f"Welcome to {settings.APP_NAME}!",
-                HtmlBody=f"""
-                <h1>Welcome {full_name}!</h1>
-                <p>Thank you for signing up for {settings.APP_NAME}.</p>
-                <p>Your 14-day free trial has started. Start exploring the platform and create your first campaign!</p>
-                <p>If you have any questions, feel free to reach out to our support team.</p>
-                <p>Best regards,<br>The {settings.APP_NAME} Team</p>
-                """,
+                HtmlBody=_WELCOME_HTML_TMPL.format_map({"full_name": full_name, "app_name": settings.APP_NAME}),
                 MessageStream='outbound'
             )
 
@@ -44,6 +60,32 @@ class EmailService:
         except Exception as e:
             logger.error(f"Error sending welcome email: {e}")
 
+    async def send_welcome_emails_batch(self, recipients: List[Tuple[str, str]]):
+        """Send welcome emails to (email, full_name) pairs in batch requests"""
+        if not self.client:
+            logger.info(f"Would send {len(recipients)} welcome emails")
+            return
+
+        messages = [
+            {
+                "From": settings.POSTMARK_FROM_EMAIL,
+                "To": to_email,
+                "Subject": f"Welcome to {settings.APP_NAME}!",
+                "HtmlBody": _WELCOME_HTML_TMPL.format_map({"full_name": full_name, "app_name": settings.APP_NAME}),
+                "MessageStream": "outbound",
+            }
+            for to_email, full_name in recipients
+        ]
+
+        for start in range(0, len(messages), POSTMARK_BATCH_SIZE):
+            batch = messages[start:start + POSTMARK_BATCH_SIZE]
+            try:
+                # postmarker is synchronous, keep it off the event loop
+                await asyncio.to_thread(self.client.emails.send_batch, *batch)
+                logger.info(f"Welcome email batch of {len(batch)} sent")
+            except Exception as e:
+                logger.error(f"Error sending welcome email batch: {e}")
+
     async def send_content_ready_notification(
         self,
         to_email: str,
@@ -56,15 +98,16 @@ class EmailService:
             return
 
         try:
-            self.client.emails.send(
+            await asyncio.to_thread(
+                self.client.emails.send,
                 From=settings.POSTMARK_FROM_EMAIL,
                 To=to_email,
                 Subject="Your content is ready!",
-                HtmlBody=f"""
-                <h1>Your content is ready!</h1>
-                <p>The AI has finished generating: <strong>{content_title}</strong></p>
-                <p><a href="{settings.FRONTEND_URL}/content/{content_id}">View your content</a></p>
-                """,
+                HtmlBody=_CONTENT_READY_HTML_TMPL.format_map({
+                    "content_title": content_title,
+                    "frontend_url": settings.FRONTEND_URL,
+                    "content_id": content_id
+                }),
                 MessageStream='outbound'
             )
 
@@ -0,0 +1,148 @@
+"""
+Prompt templates for AI content generation
+"""
+
+PRODUCT_REVIEW_PROMPT = """Write a compelling product review for the following ClickBank product:
+
+Product: {title}
+Description: {description}
+
+Tone: {tone}
+Length: {length}
+
+The review should:
+- Highlight key features and benefits
+- Be honest and balanced
+- Include a clear call-to-action
+- Be optimized for conversions
+- Sound natural and authentic
+
+Write the review now:"""
+
+PRODUCT_REVIEWS_PROMPT = """Write a compelling product review for each of the following ClickBank products:
+
+{product_list}
+
+Tone: {tone}
+Length: {length} (per review)
+
+Each review should:
+- Highlight key features and benefits
+- Be honest and balanced
+- Include a clear call-to-action
+- Be optimized for conversions
+- Sound natural and authentic
+
+Respond with only a JSON object of the form {{"reviews": ["...", "..."]}} containing
+exactly {count} reviews, in the same order as the products above."""
+
+COMPARISON_PROMPT = """Write a detailed comparison of these ClickBank products:
+
+{product_list}
+
+Create a comprehensive comparison that:
+- Compares features, pricing, and value
+- Highlights pros and cons of each
+- Provides a clear recommendation
+- Includes a comparison table
+- Ends with a strong call-to-action
+
+Tone: {tone}
+
+Write the comparison now:"""
+
+# Product details that open every campaign content prompt
+PRODUCT_CONTEXT_PROMPT = """
+Product: {title}
+Vendor: {vendor}
+Category: {category}
+Description: {description}
+Commission: ${commission_amount} ({commission_rate}%)
+"""
+
+# Per content type; {base_context} is PRODUCT_CONTEXT_PROMPT filled in
+CONTENT_TYPE_PROMPTS = {
+    "blog_post": """
+{base_context}
+
+Write a comprehensive, SEO-optimized blog post (800-1200 words) reviewing this product.
+
+Include:
+- Engaging introduction with hook
+- What the product offers
+- Key benefits and features
+- Who it's perfect for
+- Pros and cons (be balanced)
+- Personal recommendation
+- Strong call-to-action
+
+Tone: Helpful, authentic, persuasive but not pushy.
+Format: Use headers, bullet points, short paragraphs.
+""",
+
+    "email": """
+{base_context}
+
+Write a compelling email (300-400 words) promoting this product.
+
+Include:
+- Attention-grabbing subject line
+- Personal greeting
+- Problem/pain point
+- How product solves it
+- Social proof or results
+- Clear call-to-action
+- P.S. with urgency
+
+Tone: Conversational, friendly, benefit-focused.
+""",
+
+    "social_post": """
+{base_context}
+
+Write 3 engaging social media posts (each 100-150 words) for Twitter/LinkedIn.
+
+Each should:
+- Hook in first line
+- Highlight one key benefit
+- Include call-to-action
+- Use relevant hashtags (2-3)
+
+Tone: Casual, engaging, value-driven.
+""",
+
+    "video_script": """
+{base_context}
+
+Write a video script (2-3 minutes, ~300 words) for a product review.
+
+Structure:
+- Hook (first 5 seconds)
+- Introduction
+- Product overview
+- Demonstration/walkthrough
+- Results/benefits
+- Who should buy
+- Call-to-action
+- Outro
+
+Tone: Energetic, authentic, helpful.
+Include visual cues in [brackets].
+"""
+}
+
+SEO_OPTIMIZATION_PROMPT = """
+Analyze this content and provide SEO optimization suggestions:
+
+Title: {title}
+Content: {body}...
+
+Provide:
+1. Improved title (with keyword)
+2. Meta description (155 characters)
+3. 5-10 relevant keywords
+4. H2/H3 heading suggestions
+5. Internal linking opportunities
+
+Format as JSON.
+"""
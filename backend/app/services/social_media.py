@@ -1,13 +1,38 @@
 """Social media integration service for posting content."""
-from typing import Optional, Dict, Any, List
-from datetime import datetime
+from typing import Optional, Dict, Any, List, Set
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from enum import Enum
 import asyncio
 import httpx
+from authlib.integrations.httpx_client import OAuth1Auth
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 
 from app.core.logging import logger
 from app.core.exceptions import ServiceException
 
+# Connection pool shared by every platform service on a manager; idle
+# sockets are kept long enough to survive the gaps between posting bursts
+SOCIAL_HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=100, max_connections=1000, keepalive_expiry=60.0
+)
+SOCIAL_HTTP_TIMEOUT = httpx.Timeout(10.0, connect=3.0)
+
+# Rate-limited and server-error responses are retried with backoff. Only
+# idempotent requests retry every 5xx: a 500/502/504 on a POST may mean the
+# post was created, so POSTs retry only when the platform refused the work
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+NON_IDEMPOTENT_RETRYABLE_STATUS_CODES = {429, 503}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+RETRY_MAX_ATTEMPTS = 5
+RETRY_MAX_WAIT = 60.0
+
 
 class SocialPlatform(str, Enum):
     """Supported social media platforms."""
@@ -18,10 +43,95 @@ class SocialPlatform(str, Enum):
     INSTAGRAM = "instagram"
 
 
-class TwitterService:
+class RetryableStatusError(Exception):
+    """Raised inside the retry loop for a retryable HTTP status."""
+
+    def __init__(self, response: httpx.Response):
+        super().__init__(f"HTTP {response.status_code}")
+        self.response = response
+
+
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    """Parse a Retry-After header given as seconds or as an HTTP date."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+_backoff = wait_exponential_jitter(initial=1, max=RETRY_MAX_WAIT)
+
+
+def retryable_status_codes(method: str) -> Set[int]:
+    """Status codes that are safe to retry for an HTTP method."""
+    if method.upper() in IDEMPOTENT_METHODS:
+        return RETRYABLE_STATUS_CODES
+    return NON_IDEMPOTENT_RETRYABLE_STATUS_CODES
+
+
+def _retry_wait(retry_state: RetryCallState) -> float:
+    """Honor Retry-After when the platform sends one, else back off with jitter."""
+    delay = _retry_after_seconds(retry_state.outcome.exception().response)
+    if delay is None:
+        return _backoff(retry_state)
+    return min(delay, RETRY_MAX_WAIT)
+
+
+class SocialPlatformService:
+    """Base for platform services sharing a manager's HTTP client."""
+
+    def __init__(self, client: httpx.AsyncClient):
+        self._client = client
+
+    async def _request_with_retry(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Send a request, retrying rate limits and server errors that are
+        safe to repeat for the method.
+
+        Returns:
+            The first non-retryable response, or the last response once
+            attempts run out
+        """
+        retry_on = retryable_status_codes(method)
+
+        async def send() -> httpx.Response:
+            response = await self._client.request(method, url, **kwargs)
+            if response.status_code in retry_on:
+                raise RetryableStatusError(response)
+            return response
+
+        retrying = AsyncRetrying(
+            retry=retry_if_exception_type(RetryableStatusError),
+            wait=_retry_wait,
+            stop=stop_after_attempt(RETRY_MAX_ATTEMPTS),
+            retry_error_callback=lambda state: state.outcome.exception().response,
+        )
+        return await retrying(send)
+
+
+class TwitterService(SocialPlatformService):
     """Service for posting to Twitter/X using v2 API."""
 
-    def __init__(self, api_key: str, api_secret: str, access_token: str, access_secret: str):
+    def __init__(
+        self,
+        api_key: str,
+        api_secret: str,
+        access_token: str,
+        access_secret: str,
+        client: httpx.AsyncClient,
+    ):
         """
         Initialize Twitter API client.
 
@@ -30,13 +140,23 @@ class TwitterService:
             api_secret: Twitter API secret
             access_token: User access token
             access_secret: User access token secret
+            client: Shared HTTP client
         """
+        super().__init__(client)
         self.api_key = api_key
         self.api_secret = api_secret
         self.access_token = access_token
         self.access_secret = access_secret
         self.base_url = "https://api.twitter.com/2"
 
+        # OAuth 1.0a request signing
+        self._auth = OAuth1Auth(
+            api_key,
+            client_secret=api_secret,
+            token=access_token,
+            token_secret=access_secret,
+        )
+
     async def post_tweet(
         self, text: str, media_ids: Optional[List[str]] = None
     ) -> Dict[str, Any]:
@@ -51,22 +171,14 @@ class TwitterService:
             Dictionary with tweet_id and tweet_url
         """
         try:
-            # OAuth 1.0a authentication headers
-            from requests_oauthlib import OAuth1Session
-
-            oauth = OAuth1Session(
-                self.api_key,
-                client_secret=self.api_secret,
-                resource_owner_key=self.access_token,
-                resource_owner_secret=self.access_secret,
-            )
-
             payload = {"text": text[:280]}  # Truncate to 280 chars
 
             if media_ids:
                 payload["media"] = {"media_ids": media_ids}
 
-            response = oauth.post(f"{self.base_url}/tweets", json=payload)
+            response = await self._request_with_retry(
+                "POST", f"{self.base_url}/tweets", json=payload, auth=self._auth
+            )
 
             if response.status_code == 201:
                 data = response.json()
@@ -94,17 +206,10 @@ class TwitterService:
             True if successful
         """
         try:
-            from requests_oauthlib import OAuth1Session
-
-            oauth = OAuth1Session(
-                self.api_key,
-                client_secret=self.api_secret,
-                resource_owner_key=self.access_token,
-                resource_owner_secret=self.access_secret,
+            response = await self._request_with_retry(
+                "DELETE", f"{self.base_url}/tweets/{tweet_id}", auth=self._auth
             )
 
-            response = oauth.delete(f"{self.base_url}/tweets/{tweet_id}")
-
             if response.status_code == 200:
                 logger.info(f"Tweet deleted: {tweet_id}")
                 return True
@@ -116,17 +221,19 @@ class TwitterService:
             raise ServiceException(f"Twitter delete failed: {str(e)}")
 
 
-class FacebookService:
+class FacebookService(SocialPlatformService):
     """Service for posting to Facebook pages using Graph API."""
 
-    def __init__(self, access_token: str, page_id: str):
+    def __init__(self, access_token: str, page_id: str, client: httpx.AsyncClient):
         """
         Initialize Facebook Graph API client.
 
         Args:
             access_token: Page access token
             page_id: Facebook page ID
+            client: Shared HTTP client
         """
+        super().__init__(client)
         self.access_token = access_token
         self.page_id = page_id
         self.base_url = "https://graph.facebook.com/v18.0"
@@ -146,30 +253,29 @@ class FacebookService:
             Dictionary with post_id
         """
         try:
-            async with httpx.AsyncClient() as client:
-                endpoint = f"{self.base_url}/{self.page_id}/feed"
+            endpoint = f"{self.base_url}/{self.page_id}/feed"
 
-                data = {
-                    "message": message,
-                    "access_token": self.access_token,
-                }
+            data = {
+                "message": message,
+                "access_token": self.access_token,
+            }
 
-                if link:
-                    data["link"] = link
+            if link:
+                data["link"] = link
 
-                if image_url:
-                    # For images, use photos endpoint instead
-                    endpoint = f"{self.base_url}/{self.page_id}/photos"
-                    data["url"] = image_url
+            if image_url:
+                # For images, use photos endpoint instead
+                endpoint = f"{self.base_url}/{self.page_id}/photos"
+                data["url"] = image_url
 
-                response = await client.post(endpoint, data=data)
-                response.raise_for_status()
+            response = await self._request_with_retry("POST", endpoint, data=data)
+            response.raise_for_status()
 
-                result = response.json()
-                post_id = result.get("id", "")
+            result = response.json()
+            post_id = result.get("id", "")
 
-                logger.info(f"Facebook post created: {post_id}")
-                return {"post_id": post_id}
+            logger.info(f"Facebook post created: {post_id}")
+            return {"post_id": post_id}
 
         except httpx.HTTPStatusError as e:
             logger.error(f"Facebook API error: {e.response.text}")
@@ -189,33 +295,34 @@ class FacebookService:
             True if successful
         """
         try:
-            async with httpx.AsyncClient() as client:
-                endpoint = f"{self.base_url}/{post_id}"
+            endpoint = f"{self.base_url}/{post_id}"
 
-                params = {"access_token": self.access_token}
+            params = {"access_token": self.access_token}
 
-                response = await client.delete(endpoint, params=params)
-                response.raise_for_status()
+            response = await self._request_with_retry("DELETE", endpoint, params=params)
+            response.raise_for_status()
 
-                logger.info(f"Facebook post deleted: {post_id}")
-                return True
+            logger.info(f"Facebook post deleted: {post_id}")
+            return True
 
         except Exception as e:
             logger.error(f"Failed to delete Facebook post: {str(e)}")
             raise ServiceException(f"Facebook delete failed: {str(e)}")
 
 
-class LinkedInService:
+class LinkedInService(SocialPlatformService):
     """Service for posting to LinkedIn using v2 API."""
 
-    def __init__(self, access_token: str, person_urn: str):
+    def __init__(self, access_token: str, person_urn: str, client: httpx.AsyncClient):
         """
         Initialize LinkedIn API client.
 
         Args:
             access_token: LinkedIn access token
             person_urn: LinkedIn person URN (e.g., urn:li:person:ABC123)
+            client: Shared HTTP client
         """
+        super().__init__(client)
         self.access_token = access_token
         self.person_urn = person_urn
         self.base_url = "https://api.linkedin.com/v2"
@@ -234,47 +341,46 @@ class LinkedInService:
             Dictionary with post_id
         """
         try:
-            async with httpx.AsyncClient() as client:
-                endpoint = f"{self.base_url}/ugcPosts"
-
-                headers = {
-                    "Authorization": f"Bearer {self.access_token}",
-                    "Content-Type": "application/json",
-                    "X-Restli-Protocol-Version": "2.0.0",
-                }
-
-                payload = {
-                    "author": self.person_urn,
-                    "lifecycleState": "PUBLISHED",
-                    "specificContent": {
-                        "com.linkedin.ugc.ShareContent": {
-                            "shareCommentary": {"text": text},
-                            "shareMediaCategory": "NONE",
-                        }
-                    },
-                    "visibility": {"com.linkedin.ugc.MemberNetworkVisibility": "PUBLIC"},
-                }
-
-                # Add article if URL provided
-                if article_url:
-                    payload["specificContent"]["com.linkedin.ugc.ShareContent"][
-                        "shareMediaCategory"
-                    ] = "ARTICLE"
-                    payload["specificContent"]["com.linkedin.ugc.ShareContent"]["media"] = [
-                        {
-                            "status": "READY",
-                            "originalUrl": article_url,
-                        }
-                    ]
-
-                response = await client.post(endpoint, headers=headers, json=payload)
-                response.raise_for_status()
-
-                result = response.json()
-                post_id = result.get("id", "")
-
-                logger.info(f"LinkedIn post created: {post_id}")
-                return {"post_id": post_id}
+            endpoint = f"{self.base_url}/ugcPosts"
+
+            headers = {
+                "Authorization": f"Bearer {self.access_token}",
+                "Content-Type": "application/json",
+                "X-Restli-Protocol-Version": "2.0.0",
+            }
+
+            payload = {
+                "author": self.person_urn,
+                "lifecycleState": "PUBLISHED",
+                "specificContent": {
+                    "com.linkedin.ugc.ShareContent": {
+                        "shareCommentary": {"text": text},
+                        "shareMediaCategory": "NONE",
+                    }
+                },
+                "visibility": {"com.linkedin.ugc.MemberNetworkVisibility": "PUBLIC"},
+            }
+
+            # Add article if URL provided
+            if article_url:
+                payload["specificContent"]["com.linkedin.ugc.ShareContent"][
+                    "shareMediaCategory"
+                ] = "ARTICLE"
+                payload["specificContent"]["com.linkedin.ugc.ShareContent"]["media"] = [
+                    {
+                        "status": "READY",
+                        "originalUrl": article_url,
+                    }
+                ]
+
+            response = await self._request_with_retry("POST", endpoint, headers=headers, json=payload)
+            response.raise_for_status()
+
+            result = response.json()
+            post_id = result.get("id", "")
+
+            logger.info(f"LinkedIn post created: {post_id}")
+            return {"post_id": post_id}
 
         except httpx.HTTPStatusError as e:
             logger.error(f"LinkedIn API error: {e.response.text}")
@@ -294,18 +400,17 @@ class LinkedInService:
             True if successful
         """
         try:
-            async with httpx.AsyncClient() as client:
-                endpoint = f"{self.base_url}/ugcPosts/{post_urn}"
+            endpoint = f"{self.base_url}/ugcPosts/{post_urn}"
 
-                headers = {
-                    "Authorization": f"Bearer {self.access_token}",
-                }
+            headers = {
+                "Authorization": f"Bearer {self.access_token}",
+            }
 
-                response = await client.delete(endpoint, headers=headers)
-                response.raise_for_status()
+            response = await self._request_with_retry("DELETE", endpoint, headers=headers)
+            response.raise_for_status()
 
-                logger.info(f"LinkedIn post deleted: {post_urn}")
-                return True
+            logger.info(f"LinkedIn post deleted: {post_urn}")
+            return True
 
         except Exception as e:
             logger.error(f"Failed to delete LinkedIn post: {str(e)}")
@@ -318,23 +423,30 @@ class SocialMediaManager:
     def __init__(self):
         """Initialize social media manager."""
         self.services: Dict[str, Any] = {}
+        self._client = httpx.AsyncClient(limits=SOCIAL_HTTP_LIMITS, timeout=SOCIAL_HTTP_TIMEOUT)
+
+    async def aclose(self):
+        """Close the shared HTTP client."""
+        await self._client.aclose()
 
     def add_twitter(
         self, api_key: str, api_secret: str, access_token: str, access_secret: str
     ):
         """Add Twitter service."""
         self.services[SocialPlatform.TWITTER] = TwitterService(
-            api_key, api_secret, access_token, access_secret
+            api_key, api_secret, access_token, access_secret, self._client
         )
 
     def add_facebook(self, access_token: str, page_id: str):
         """Add Facebook service."""
-        self.services[SocialPlatform.FACEBOOK] = FacebookService(access_token, page_id)
+        self.services[SocialPlatform.FACEBOOK] = FacebookService(
+            access_token, page_id, self._client
+        )
 
     def add_linkedin(self, access_token: str, person_urn: str):
         """Add LinkedIn service."""
         self.services[SocialPlatform.LINKEDIN] = LinkedInService(
-            access_token, person_urn
+            access_token, person_urn, self._client
         )
 
     async def post_to_platform(
@@ -395,21 +507,20 @@ class SocialMediaManager:
             Dictionary mapping platform to result
         """
         results = {}
-        tasks = []
-
-        for platform in platforms:
-            if platform in self.services:
-                task = self.post_to_platform(platform, text, link, media_url)
-                tasks.append((platform, task))
+        targets = [platform for platform in platforms if platform in self.services]
 
         # Execute all posts concurrently
-        for platform, task in tasks:
-            try:
-                result = await task
+        done = await asyncio.gather(
+            *(self.post_to_platform(platform, text, link, media_url) for platform in targets),
+            return_exceptions=True,
+        )
+
+        for platform, result in zip(targets, done):
+            if isinstance(result, Exception):
+                results[platform] = {"success": False, "error": str(result)}
+                logger.error(f"Failed to post to {platform}: {str(result)}")
+            else:
                 results[platform] = {"success": True, "data": result}
-            except Exception as e:
-                results[platform] = {"success": False, "error": str(e)}
-                logger.error(f"Failed to post to {platform}: {str(e)}")
 
         return results
 
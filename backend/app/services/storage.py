@@ -1,16 +1,154 @@
 """AWS S3 storage service for file uploads and management."""
-from typing import Optional, Dict, Any, List, BinaryIO
+from typing import Optional, Dict, Any, List, BinaryIO, Tuple, Union
+from contextlib import AsyncExitStack
+from functools import lru_cache
+import asyncio
+import base64
+import hmac
+import inspect
+import io
+import json
 from datetime import datetime, timedelta
 import os
 import mimetypes
+import re
 from pathlib import Path
 import aioboto3
+from cachetools import TTLCache
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from app.core.logging import logger
 from app.core.exceptions import ServiceException
 from app.config import settings
 
+# Largest object accepted through the upload endpoints
+MAX_UPLOAD_SIZE = 100 * 1024 * 1024  # 100MB
+
+# DeleteObjects accepts at most 1000 keys per request
+DELETE_BATCH_SIZE = 1000
+
+# Concurrent HeadObject requests when enriching listings
+HEAD_CONCURRENCY = 32
+
+# Multipart settings for streamed uploads: parts go out while the client is
+# still sending, and at most max_concurrency parts are buffered at once
+UPLOAD_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=10,
+    use_threads=True,
+)
+
+# Client settings for the shared S3 client: TCP keepalive on pooled sockets
+# and room for the concurrent HeadObject and multipart requests
+S3_CLIENT_CONFIG = Config(tcp_keepalive=True, max_pool_connections=50)
+
+# Presigned GET URLs are reused for this long, so a cached URL has at least
+# expires_in minus this many seconds of validity left
+PRESIGNED_URL_CACHE_TTL = 300
+
+# Characters stripped from uploaded file names
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^a-zA-Z0-9._-]")
+
+
+class UploadTooLargeError(Exception):
+    """Raised when a streamed upload exceeds its size limit."""
+
+
+class SizeLimitedReader:
+    """Async file wrapper that counts bytes read and enforces a size limit."""
+
+    def __init__(self, fileobj: Any, max_size: Optional[int] = None):
+        self.fileobj = fileobj
+        self.max_size = max_size
+        self.bytes_read = 0
+
+    async def read(self, size: int = -1) -> bytes:
+        # Accepts both async readers (UploadFile) and plain file objects
+        chunk = self.fileobj.read(size)
+        if inspect.isawaitable(chunk):
+            chunk = await chunk
+        self.bytes_read += len(chunk)
+
+        if self.max_size is not None and self.bytes_read > self.max_size:
+            raise UploadTooLargeError(f"File exceeds {self.max_size} bytes")
+
+        return chunk
+
+
+class PresignedPostSigner:
+    """
+    SigV4 signer for S3 presigned POST forms using static credentials.
+
+    The per-day signing key is cached, so each form costs one policy
+    serialization and one HMAC-SHA256 instead of a boto client round.
+    """
+
+    def __init__(self, bucket_name: str, region: str, access_key: str, secret_key: str):
+        self.bucket_name = bucket_name
+        self.region = region
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self.url = f"https://{bucket_name}.s3.{region}.amazonaws.com/"
+        self._signing_keys: Dict[str, bytes] = {}
+
+    def _signing_key(self, date_stamp: str) -> bytes:
+        key = self._signing_keys.get(date_stamp)
+        if key is None:
+            key = hmac.digest(("AWS4" + self.secret_key).encode(), date_stamp.encode(), "sha256")
+            for part in (self.region, "s3", "aws4_request"):
+                key = hmac.digest(key, part.encode(), "sha256")
+            # Only today's key is ever needed
+            self._signing_keys = {date_stamp: key}
+        return key
+
+    def sign(
+        self,
+        file_key: str,
+        content_type: str,
+        expires_in: int,
+        max_size: int,
+    ) -> Dict[str, Any]:
+        """
+        Build the url and form fields for a browser POST upload.
+        """
+        now = datetime.utcnow()
+        date_stamp = now.strftime("%Y%m%d")
+        amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+        credential = f"{self.access_key}/{date_stamp}/{self.region}/s3/aws4_request"
+
+        policy = {
+            "expiration": (now + timedelta(seconds=expires_in)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "conditions": [
+                {"bucket": self.bucket_name},
+                {"key": file_key},
+                {"Content-Type": content_type},
+                ["content-length-range", 0, max_size],
+                {"x-amz-algorithm": "AWS4-HMAC-SHA256"},
+                {"x-amz-credential": credential},
+                {"x-amz-date": amz_date},
+            ],
+        }
+        encoded_policy = base64.b64encode(json.dumps(policy).encode()).decode()
+        signature = hmac.digest(
+            self._signing_key(date_stamp), encoded_policy.encode(), "sha256"
+        ).hex()
+
+        return {
+            "url": self.url,
+            "fields": {
+                "key": file_key,
+                "Content-Type": content_type,
+                "x-amz-algorithm": "AWS4-HMAC-SHA256",
+                "x-amz-credential": credential,
+                "x-amz-date": amz_date,
+                "policy": encoded_policy,
+                "x-amz-signature": signature,
+            },
+        }
+
 
 class S3StorageService:
     """Service for managing file uploads and downloads with AWS S3."""
@@ -45,9 +183,45 @@ class S3StorageService:
             region_name=self.region,
         )
 
+        # Presigned POSTs are signed locally when static keys are configured;
+        # other credential sources go through boto
+        self.post_signer = None
+        if self.access_key and self.secret_key:
+            self.post_signer = PresignedPostSigner(
+                self.bucket_name, self.region, self.access_key, self.secret_key
+            )
+
+        # One S3 client for the life of the service, so its connection pool
+        # is reused instead of rebuilt for every call
+        self._s3 = None
+        self._s3_stack: Optional[AsyncExitStack] = None
+        self._s3_lock = asyncio.Lock()
+
+        # (file_key, expires_in) -> presigned GET URL
+        self._presigned_urls: TTLCache = TTLCache(maxsize=4096, ttl=PRESIGNED_URL_CACHE_TTL)
+
+    async def _client(self):
+        """Return the shared S3 client, opening it on first use."""
+        if self._s3 is None:
+            async with self._s3_lock:
+                if self._s3 is None:
+                    stack = AsyncExitStack()
+                    self._s3 = await stack.enter_async_context(
+                        self.session.client("s3", config=S3_CLIENT_CONFIG)
+                    )
+                    self._s3_stack = stack
+        return self._s3
+
+    async def aclose(self):
+        """Close the shared S3 client."""
+        if self._s3_stack is not None:
+            await self._s3_stack.aclose()
+            self._s3_stack = None
+            self._s3 = None
+
     async def upload_file(
         self,
-        file_data: bytes,
+        file_data: Union[bytes, BinaryIO],
         file_name: str,
         folder: str = "uploads",
         content_type: Optional[str] = None,
@@ -58,7 +232,7 @@ class S3StorageService:
         Upload a file to S3.
 
         Args:
-            file_data: File content as bytes
+            file_data: File content as bytes or a binary file object
             file_name: Name of the file
             folder: Folder/prefix in S3 bucket
             content_type: MIME type of the file
@@ -69,48 +243,37 @@ class S3StorageService:
             Dictionary with file_url, file_key, and bucket_name
         """
         try:
-            # Generate S3 key
-            timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-            safe_filename = self._sanitize_filename(file_name)
-            s3_key = f"{folder}/{timestamp}_{safe_filename}"
-
-            # Detect content type if not provided
-            if not content_type:
-                content_type, _ = mimetypes.guess_type(file_name)
-                if not content_type:
-                    content_type = "application/octet-stream"
-
-            # Prepare upload arguments
-            upload_args = {
-                "ContentType": content_type,
-            }
-
-            if metadata:
-                upload_args["Metadata"] = metadata
-
-            if public:
-                upload_args["ACL"] = "public-read"
+            s3_key, upload_args = self._prepare_upload(
+                file_name, folder, content_type, metadata, public
+            )
 
             # Upload to S3
-            async with self.session.client("s3") as s3:
+            s3 = await self._client()
+            if isinstance(file_data, bytes) and (
+                len(file_data) <= UPLOAD_TRANSFER_CONFIG.multipart_threshold
+            ):
                 await s3.put_object(
                     Bucket=self.bucket_name,
                     Key=s3_key,
                     Body=file_data,
                     **upload_args,
                 )
-
-            # Generate URL
-            if public:
-                file_url = f"https://{self.bucket_name}.s3.{self.region}.amazonaws.com/{s3_key}"
             else:
-                # Generate presigned URL for private files (valid for 1 hour)
-                file_url = await self.generate_presigned_url(s3_key, expires_in=3600)
+                # Large bodies go up as concurrent multipart parts
+                if isinstance(file_data, bytes):
+                    file_data = io.BytesIO(file_data)
+                await s3.upload_fileobj(
+                    file_data,
+                    self.bucket_name,
+                    s3_key,
+                    ExtraArgs=upload_args,
+                    Config=UPLOAD_TRANSFER_CONFIG,
+                )
 
             logger.info(f"File uploaded to S3: {s3_key}")
 
             return {
-                "file_url": file_url,
+                "file_url": await self._file_url(s3_key, public),
                 "file_key": s3_key,
                 "bucket_name": self.bucket_name,
             }
@@ -122,6 +285,110 @@ class S3StorageService:
             logger.error(f"File upload error: {str(e)}")
             raise ServiceException(f"File upload failed: {str(e)}")
 
+    async def upload_fileobj(
+        self,
+        fileobj: Any,
+        file_name: str,
+        folder: str = "uploads",
+        content_type: Optional[str] = None,
+        metadata: Optional[Dict[str, str]] = None,
+        public: bool = False,
+        max_size: Optional[int] = MAX_UPLOAD_SIZE,
+    ) -> Dict[str, Any]:
+        """
+        Stream a file-like object to S3 using a multipart upload.
+
+        Args:
+            fileobj: Object with a sync or async read(size) method
+            file_name: Name of the file
+            folder: Folder/prefix in S3 bucket
+            content_type: MIME type of the file
+            metadata: Additional metadata to store with the file
+            public: Whether to make the file publicly accessible
+            max_size: Abort with UploadTooLargeError past this many bytes
+
+        Returns:
+            Dictionary with file_url, file_key, bucket_name and size
+        """
+        reader = SizeLimitedReader(fileobj, max_size)
+
+        try:
+            s3_key, upload_args = self._prepare_upload(
+                file_name, folder, content_type, metadata, public
+            )
+
+            s3 = await self._client()
+            await s3.upload_fileobj(
+                reader,
+                self.bucket_name,
+                s3_key,
+                ExtraArgs=upload_args,
+                Config=UPLOAD_TRANSFER_CONFIG,
+            )
+
+            logger.info(f"File streamed to S3: {s3_key}")
+
+            return {
+                "file_url": await self._file_url(s3_key, public),
+                "file_key": s3_key,
+                "bucket_name": self.bucket_name,
+                "size": reader.bytes_read,
+            }
+
+        except UploadTooLargeError:
+            raise
+        except ClientError as e:
+            logger.error(f"S3 upload error: {str(e)}")
+            raise ServiceException(f"Failed to upload file to S3: {str(e)}")
+        except Exception as e:
+            logger.error(f"File upload error: {str(e)}")
+            raise ServiceException(f"File upload failed: {str(e)}")
+
+    def _prepare_upload(
+        self,
+        file_name: str,
+        folder: str,
+        content_type: Optional[str],
+        metadata: Optional[Dict[str, str]],
+        public: bool,
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Build the S3 key and put arguments for an upload.
+
+        Returns:
+            Tuple of (s3_key, upload_args)
+        """
+        # Generate S3 key
+        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        safe_filename = self._sanitize_filename(file_name)
+        s3_key = f"{folder}/{timestamp}_{safe_filename}"
+
+        # Detect content type if not provided
+        if not content_type:
+            content_type, _ = mimetypes.guess_type(file_name)
+            if not content_type:
+                content_type = "application/octet-stream"
+
+        upload_args = {
+            "ContentType": content_type,
+        }
+
+        if metadata:
+            upload_args["Metadata"] = metadata
+
+        if public:
+            upload_args["ACL"] = "public-read"
+
+        return s3_key, upload_args
+
+    async def _file_url(self, s3_key: str, public: bool) -> str:
+        """
+        Public object URL, or a presigned URL (valid for 1 hour) for private files.
+        """
+        if public:
+            return f"https://{self.bucket_name}.s3.{self.region}.amazonaws.com/{s3_key}"
+        return await self.generate_presigned_url(s3_key, expires_in=3600)
+
     async def download_file(self, file_key: str) -> bytes:
         """
         Download a file from S3.
@@ -133,12 +400,12 @@ class S3StorageService:
             File content as bytes
         """
         try:
-            async with self.session.client("s3") as s3:
-                response = await s3.get_object(Bucket=self.bucket_name, Key=file_key)
+            s3 = await self._client()
+            response = await s3.get_object(Bucket=self.bucket_name, Key=file_key)
 
-                # Read the streaming body
-                async with response["Body"] as stream:
-                    file_data = await stream.read()
+            # Read the streaming body
+            async with response["Body"] as stream:
+                file_data = await stream.read()
 
             logger.info(f"File downloaded from S3: {file_key}")
             return file_data
@@ -161,8 +428,8 @@ class S3StorageService:
             True if successful
         """
         try:
-            async with self.session.client("s3") as s3:
-                await s3.delete_object(Bucket=self.bucket_name, Key=file_key)
+            s3 = await self._client()
+            await s3.delete_object(Bucket=self.bucket_name, Key=file_key)
 
             logger.info(f"File deleted from S3: {file_key}")
             return True
@@ -178,6 +445,8 @@ class S3StorageService:
         """
         Delete multiple files from S3.
 
+        Keys are sent in DeleteObjects batches of up to 1000, concurrently.
+
         Args:
             file_keys: List of S3 object keys
 
@@ -185,23 +454,32 @@ class S3StorageService:
             Dictionary mapping file_key to success status
         """
         try:
-            async with self.session.client("s3") as s3:
-                # Prepare delete objects
-                objects = [{"Key": key} for key in file_keys]
-
-                response = await s3.delete_objects(
-                    Bucket=self.bucket_name, Delete={"Objects": objects}
+            s3 = await self._client()
+            responses = await asyncio.gather(*(
+                s3.delete_objects(
+                    Bucket=self.bucket_name,
+                    Delete={
+                        "Objects": [{"Key": key} for key in batch],
+                        # Only failures are listed in the response
+                        "Quiet": True,
+                    },
+                )
+                for batch in (
+                    file_keys[i:i + DELETE_BATCH_SIZE]
+                    for i in range(0, len(file_keys), DELETE_BATCH_SIZE)
                 )
+            ))
 
-                # Track results
-                results = {key: False for key in file_keys}
+            # Track results
+            results = {key: True for key in file_keys}
 
-                if "Deleted" in response:
-                    for obj in response["Deleted"]:
-                        results[obj["Key"]] = True
+            for response in responses:
+                for error in response.get("Errors", []):
+                    results[error["Key"]] = False
+                    logger.warning(f"S3 delete failed for {error['Key']}: {error.get('Message')}")
 
-                logger.info(f"Deleted {len(response.get('Deleted', []))} files from S3")
-                return results
+            logger.info(f"Deleted {sum(results.values())} files from S3")
+            return results
 
         except Exception as e:
             logger.error(f"Bulk delete error: {str(e)}")
@@ -218,8 +496,8 @@ class S3StorageService:
             True if file exists
         """
         try:
-            async with self.session.client("s3") as s3:
-                await s3.head_object(Bucket=self.bucket_name, Key=file_key)
+            s3 = await self._client()
+            await s3.head_object(Bucket=self.bucket_name, Key=file_key)
             return True
         except ClientError as e:
             if e.response["Error"]["Code"] == "404":
@@ -237,8 +515,8 @@ class S3StorageService:
             Dictionary with file metadata
         """
         try:
-            async with self.session.client("s3") as s3:
-                response = await s3.head_object(Bucket=self.bucket_name, Key=file_key)
+            s3 = await self._client()
+            response = await s3.head_object(Bucket=self.bucket_name, Key=file_key)
 
             return {
                 "content_type": response.get("ContentType"),
@@ -252,6 +530,39 @@ class S3StorageService:
             logger.error(f"Failed to get file metadata: {str(e)}")
             raise ServiceException(f"Failed to get file metadata: {str(e)}")
 
+    async def get_files_metadata(
+        self, file_keys: List[str], concurrency: int = HEAD_CONCURRENCY
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get metadata for many files with concurrent HeadObject calls.
+
+        Args:
+            file_keys: S3 object keys
+            concurrency: Maximum HeadObject requests in flight
+
+        Returns:
+            Dictionary mapping file_key to its metadata
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _head(s3, file_key: str) -> Dict[str, Any]:
+            async with semaphore:
+                response = await s3.head_object(Bucket=self.bucket_name, Key=file_key)
+            return {
+                "content_type": response.get("ContentType"),
+                "metadata": response.get("Metadata", {}),
+            }
+
+        try:
+            s3 = await self._client()
+            results = await asyncio.gather(*(_head(s3, key) for key in file_keys))
+
+            return dict(zip(file_keys, results))
+
+        except ClientError as e:
+            logger.error(f"Failed to get file metadata: {str(e)}")
+            raise ServiceException(f"Failed to get file metadata: {str(e)}")
+
     async def list_files(
         self, prefix: str = "", max_keys: int = 1000
     ) -> List[Dict[str, Any]]:
@@ -266,10 +577,10 @@ class S3StorageService:
             List of file information dictionaries
         """
         try:
-            async with self.session.client("s3") as s3:
-                response = await s3.list_objects_v2(
-                    Bucket=self.bucket_name, Prefix=prefix, MaxKeys=max_keys
-                )
+            s3 = await self._client()
+            response = await s3.list_objects_v2(
+                Bucket=self.bucket_name, Prefix=prefix, MaxKeys=max_keys
+            )
 
             files = []
             for obj in response.get("Contents", []):
@@ -301,14 +612,24 @@ class S3StorageService:
         Returns:
             Presigned URL string
         """
-        try:
-            async with self.session.client("s3") as s3:
-                url = await s3.generate_presigned_url(
-                    "get_object",
-                    Params={"Bucket": self.bucket_name, "Key": file_key},
-                    ExpiresIn=expires_in,
-                )
+        # Short-lived URLs would expire while still cached
+        cacheable = expires_in > PRESIGNED_URL_CACHE_TTL
+        cache_key = (file_key, expires_in)
+        if cacheable:
+            url = self._presigned_urls.get(cache_key)
+            if url is not None:
+                return url
 
+        try:
+            s3 = await self._client()
+            url = await s3.generate_presigned_url(
+                "get_object",
+                Params={"Bucket": self.bucket_name, "Key": file_key},
+                ExpiresIn=expires_in,
+            )
+
+            if cacheable:
+                self._presigned_urls[cache_key] = url
             return url
 
         except ClientError as e:
@@ -332,15 +653,18 @@ class S3StorageService:
         Returns:
             Dictionary with url and fields for the upload
         """
+        if self.post_signer is not None:
+            return self.post_signer.sign(file_key, content_type, expires_in, MAX_UPLOAD_SIZE)
+
         try:
-            async with self.session.client("s3") as s3:
-                response = await s3.generate_presigned_post(
-                    Bucket=self.bucket_name,
-                    Key=file_key,
-                    Fields={"Content-Type": content_type},
-                    Conditions=[["content-length-range", 0, 104857600]],  # Max 100MB
-                    ExpiresIn=expires_in,
-                )
+            s3 = await self._client()
+            response = await s3.generate_presigned_post(
+                Bucket=self.bucket_name,
+                Key=file_key,
+                Fields={"Content-Type": content_type},
+                Conditions=[["content-length-range", 0, MAX_UPLOAD_SIZE]],
+                ExpiresIn=expires_in,
+            )
 
             return response
 
@@ -362,14 +686,14 @@ class S3StorageService:
             Dictionary with new file information
         """
         try:
-            async with self.session.client("s3") as s3:
-                copy_source = {"Bucket": self.bucket_name, "Key": source_key}
+            s3 = await self._client()
+            copy_source = {"Bucket": self.bucket_name, "Key": source_key}
 
-                await s3.copy_object(
-                    CopySource=copy_source,
-                    Bucket=self.bucket_name,
-                    Key=destination_key,
-                )
+            await s3.copy_object(
+                CopySource=copy_source,
+                Bucket=self.bucket_name,
+                Key=destination_key,
+            )
 
             logger.info(f"File copied: {source_key} -> {destination_key}")
 
@@ -399,9 +723,7 @@ class S3StorageService:
         filename = filename.replace(" ", "_")
 
         # Remove any non-alphanumeric characters except dots, dashes, and underscores
-        import re
-
-        filename = re.sub(r"[^a-zA-Z0-9._-]", "", filename)
+        filename = _UNSAFE_FILENAME_CHARS.sub("", filename)
 
         return filename
 
@@ -416,10 +738,23 @@ class S3StorageService:
             Total size in bytes
         """
         try:
-            files = await self.list_files(prefix=prefix)
-            total_size = sum(file["size"] for file in files)
+            # Walk every page; list_files stops at the first 1000 keys
+            s3 = await self._client()
+            paginator = s3.get_paginator("list_objects_v2")
+            total_size = 0
+            async for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+                total_size += sum(obj["Size"] for obj in page.get("Contents", []))
             return total_size
 
         except Exception as e:
             logger.error(f"Failed to calculate folder size: {str(e)}")
             raise ServiceException(f"Failed to calculate folder size: {str(e)}")
+
+
+@lru_cache(maxsize=None)
+def get_storage_service() -> S3StorageService:
+    """
+    Process-wide S3StorageService, built on first use so credential and
+    region resolution happen once. Used as a FastAPI dependency.
+    """
+    return S3StorageService()
@@ -14,6 +14,7 @@ celery_app = Celery(
         "app.tasks.content_tasks",
         "app.tasks.clickbank_tasks",
         "app.tasks.publishing_tasks",
+        "app.tasks.scheduled",
     ]
 )
 
@@ -51,6 +52,14 @@ celery_app.conf.beat_schedule = {
         "task": "app.tasks.clickbank_tasks.cleanup_stale_products",
         "schedule": crontab(hour=3, minute=0, day_of_week=0),  # Sunday at 3 AM
     },
+    "create-analytics-partitions-daily": {
+        "task": "app.tasks.scheduled.create_analytics_partitions",
+        "schedule": crontab(hour=1, minute=0),  # Daily at 1 AM
+    },
+    "drop-old-analytics-partitions-monthly": {
+        "task": "app.tasks.scheduled.drop_old_analytics_partitions",
+        "schedule": crontab(hour=1, minute=30, day_of_month=1),  # 1st of the month at 1:30 AM
+    },
 }
 
 if __name__ == "__main__":
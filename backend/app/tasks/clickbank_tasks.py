@@ -33,14 +33,14 @@ def sync_clickbank_products(self, category: str = None, limit: int = 100):
     """
     try:
         async def _sync():
-            clickbank_service = ClickBankService()
-
-            # Fetch products from ClickBank API
-            products_data = await clickbank_service.search_products(
-                category=category,
-                min_gravity=10.0,  # Only products with some traction
-                limit=limit
-            )
+            # Fetch products from ClickBank API; the service's connection
+            # pool is closed before this task's event loop finishes
+            async with ClickBankService() as clickbank_service:
+                products_data = await clickbank_service.search_products(
+                    category=category,
+                    min_gravity=10.0,  # Only products with some traction
+                    limit=limit
+                )
 
             created_count = 0
             updated_count = 0
@@ -64,7 +64,7 @@ def sync_clickbank_products(self, category: str = None, limit: int = 100):
                         existing_product.commission_rate = product_data.get("percent_per_sale")
                         existing_product.commission_amount = product_data.get("initial_sale_amount")
                         existing_product.initial_sale_amount = product_data.get("initial_sale_amount")
-                        existing_product.gravity = product_data.get("gravity")
+                        existing_product.gravity = product_data.get("gravity") or 0
                         existing_product.refund_rate = product_data.get("refund_rate")
                         existing_product.rebill = product_data.get("has_recurring", False)
                         existing_product.popularity_rank = product_data.get("rank")
@@ -82,7 +82,7 @@ def sync_clickbank_products(self, category: str = None, limit: int = 100):
                             commission_rate=product_data.get("percent_per_sale"),
                             commission_amount=product_data.get("initial_sale_amount"),
                             initial_sale_amount=product_data.get("initial_sale_amount"),
-                            gravity=product_data.get("gravity"),
+                            gravity=product_data.get("gravity") or 0,
                             refund_rate=product_data.get("refund_rate"),
                             rebill=product_data.get("has_recurring", False),
                             popularity_rank=product_data.get("rank"),
@@ -141,31 +141,31 @@ def update_product_metrics(product_id: str = None):
                     )
                     products = result.scalars().all()
 
-                clickbank_service = ClickBankService()
                 updated_count = 0
 
-                for product in products:
-                    if not product:
-                        continue
-
-                    try:
-                        # Fetch fresh data from ClickBank
-                        product_data = await clickbank_service.get_product_details(
-                            product.clickbank_id
-                        )
-
-                        if product_data:
-                            # Update metrics
-                            product.gravity = product_data.get("gravity", product.gravity)
-                            product.refund_rate = product_data.get("refund_rate", product.refund_rate)
-                            product.popularity_rank = product_data.get("rank", product.popularity_rank)
-                            product.data_snapshot = product_data
-                            product.last_updated = datetime.utcnow()
-                            updated_count += 1
-
-                    except Exception as e:
-                        logger.warning(f"Failed to update product {product.clickbank_id}: {str(e)}")
-                        continue
+                async with ClickBankService() as clickbank_service:
+                    for product in products:
+                        if not product:
+                            continue
+
+                        try:
+                            # Fetch fresh data from ClickBank
+                            product_data = await clickbank_service.get_product_details(
+                                product.clickbank_id
+                            )
+
+                            if product_data:
+                                # Update metrics
+                                product.gravity = product_data.get("gravity") or product.gravity
+                                product.refund_rate = product_data.get("refund_rate", product.refund_rate)
+                                product.popularity_rank = product_data.get("rank", product.popularity_rank)
+                                product.data_snapshot = product_data
+                                product.last_updated = datetime.utcnow()
+                                updated_count += 1
+
+                        except Exception as e:
+                            logger.warning(f"Failed to update product {product.clickbank_id}: {str(e)}")
+                            continue
 
                 await session.commit()
 
@@ -10,7 +10,8 @@ from app.database import async_session_maker
 from app.models.content import Content
 from app.models.campaign import Campaign
 from app.models.user import User
-from app.services.claude import ClaudeService
+from app.services.claude import claude_service
+from app.services.prompts import PRODUCT_CONTEXT_PROMPT, CONTENT_TYPE_PROMPTS, SEO_OPTIMIZATION_PROMPT
 from app.core.logging import logger
 
 
@@ -50,7 +51,6 @@ def generate_content_task(self, content_id: str, prompt: str, max_tokens: int =
                 await session.commit()
 
                 # Generate content
-                claude_service = ClaudeService()
                 generated_text = ""
 
                 async for chunk in claude_service.generate_content_stream(
@@ -167,86 +167,17 @@ def batch_generate_content(campaign_id: str, content_count: int = 5):
 
 def _build_prompt(content_type: str, product, campaign) -> str:
     """Build AI prompt based on content type and product."""
+    base_context = PRODUCT_CONTEXT_PROMPT.format_map({
+        "title": product.title,
+        "vendor": product.vendor,
+        "category": product.category,
+        "description": product.description,
+        "commission_amount": product.commission_amount,
+        "commission_rate": product.commission_rate
+    })
 
-    base_context = f"""
-Product: {product.title}
-Vendor: {product.vendor}
-Category: {product.category}
-Description: {product.description}
-Commission: ${product.commission_amount} ({product.commission_rate}%)
-"""
-
-    prompts = {
-        "blog_post": f"""
-{base_context}
-
-Write a comprehensive, SEO-optimized blog post (800-1200 words) reviewing this product.
-
-Include:
-- Engaging introduction with hook
-- What the product offers
-- Key benefits and features
-- Who it's perfect for
-- Pros and cons (be balanced)
-- Personal recommendation
-- Strong call-to-action
-
-Tone: Helpful, authentic, persuasive but not pushy.
-Format: Use headers, bullet points, short paragraphs.
-""",
-
-        "email": f"""
-{base_context}
-
-Write a compelling email (300-400 words) promoting this product.
-
-Include:
-- Attention-grabbing subject line
-- Personal greeting
-- Problem/pain point
-- How product solves it
-- Social proof or results
-- Clear call-to-action
-- P.S. with urgency
-
-Tone: Conversational, friendly, benefit-focused.
-""",
-
-        "social_post": f"""
-{base_context}
-
-Write 3 engaging social media posts (each 100-150 words) for Twitter/LinkedIn.
-
-Each should:
-- Hook in first line
-- Highlight one key benefit
-- Include call-to-action
-- Use relevant hashtags (2-3)
-
-Tone: Casual, engaging, value-driven.
-""",
-
-        "video_script": f"""
-{base_context}
-
-Write a video script (2-3 minutes, ~300 words) for a product review.
-
-Structure:
-- Hook (first 5 seconds)
-- Introduction
-- Product overview
-- Demonstration/walkthrough
-- Results/benefits
-- Who should buy
-- Call-to-action
-- Outro
-
-Tone: Energetic, authentic, helpful.
-Include visual cues in [brackets].
-"""
-    }
-
-    return prompts.get(content_type, prompts["blog_post"])
+    template = CONTENT_TYPE_PROMPTS.get(content_type, CONTENT_TYPE_PROMPTS["blog_post"])
+    return template.format_map({"base_context": base_context})
 
 
 @celery_app.task
@@ -271,24 +202,11 @@ def optimize_content_seo(content_id: str):
                 if not content:
                     raise ValueError(f"Content {content_id} not found")
 
-                claude_service = ClaudeService()
-
                 # Generate SEO improvements
-                prompt = f"""
-Analyze this content and provide SEO optimization suggestions:
-
-Title: {content.title}
-Content: {content.body[:1000]}...
-
-Provide:
-1. Improved title (with keyword)
-2. Meta description (155 characters)
-3. 5-10 relevant keywords
-4. H2/H3 heading suggestions
-5. Internal linking opportunities
-
-Format as JSON.
-"""
+                prompt = SEO_OPTIMIZATION_PROMPT.format_map({
+                    "title": content.title,
+                    "body": content.body[:1000]
+                })
 
                 generated_text = ""
                 async for chunk in claude_service.generate_content_stream(prompt, max_tokens=800):
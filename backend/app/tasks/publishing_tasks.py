@@ -164,11 +164,14 @@ def publish_to_social_media(
 
                 # Publish to platforms
                 platform_enums = [SocialPlatform(p) for p in platforms]
-                results = await social_manager.post_to_multiple(
-                    platforms=platform_enums,
-                    text=social_text,
-                    link=content.metadata.get("link") if content.metadata else None
-                )
+                try:
+                    results = await social_manager.post_to_multiple(
+                        platforms=platform_enums,
+                        text=social_text,
+                        link=content.metadata.get("link") if content.metadata else None
+                    )
+                finally:
+                    await social_manager.aclose()
 
                 # Update content metadata
                 content.metadata = {
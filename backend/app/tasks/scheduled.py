@@ -1,7 +1,14 @@
 """
 Scheduled maintenance tasks
 """
+import asyncio
+import re
+from datetime import date
+from sqlalchemy import text
+
+from app.config import settings
 from app.tasks.celery_app import celery_app
+from app.db.session import async_session_maker
 import logging
 
 logger = logging.getLogger(__name__)
@@ -41,3 +48,75 @@ def backup_database():
     # TODO: Create database backup and upload to S3
 
     return {"status": "completed"}
+
+
+@celery_app.task(name="app.tasks.scheduled.create_analytics_partitions")
+def create_analytics_partitions(months_ahead: int = 3):
+    """
+    Create upcoming monthly analytics_events partitions ahead of time
+    """
+    logger.info(f"Creating analytics partitions {months_ahead} months ahead")
+
+    async def _create():
+        async with async_session_maker() as session:
+            await session.execute(
+                text(
+                    "SELECT create_analytics_partitions("
+                    "now()::date, (now() + make_interval(months => :months))::date)"
+                ),
+                {"months": months_ahead}
+            )
+            await session.commit()
+
+    asyncio.run(_create())
+
+    return {"status": "completed"}
+
+
+# Monthly partitions created by create_analytics_partitions()
+ANALYTICS_PARTITION_NAME = re.compile(r"^analytics_events_(\d{4})_(\d{2})$")
+
+
+@celery_app.task(name="app.tasks.scheduled.drop_old_analytics_partitions")
+def drop_old_analytics_partitions(retention_months: int = None):
+    """
+    Detach and drop monthly analytics_events partitions past the retention window
+    """
+    if retention_months is None:
+        retention_months = settings.ANALYTICS_RETENTION_MONTHS
+
+    # First month that is kept
+    today = date.today()
+    month_index = today.year * 12 + today.month - 1 - retention_months
+    cutoff = (month_index // 12, month_index % 12 + 1)
+
+    logger.info(f"Dropping analytics partitions before {cutoff[0]}-{cutoff[1]:02d}")
+
+    async def _drop():
+        dropped = []
+        async with async_session_maker() as session:
+            result = await session.execute(text(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "JOIN pg_class p ON p.oid = i.inhparent "
+                "WHERE p.relname = 'analytics_events'"
+            ))
+
+            for (name,) in result:
+                match = ANALYTICS_PARTITION_NAME.match(name)
+                if match is None:
+                    continue
+                if (int(match.group(1)), int(match.group(2))) >= cutoff:
+                    continue
+
+                # Dropping a whole partition is a catalog change, not a mass DELETE
+                await session.execute(text(f'ALTER TABLE analytics_events DETACH PARTITION "{name}"'))
+                await session.execute(text(f'DROP TABLE "{name}"'))
+                await session.commit()
+                dropped.append(name)
+
+        return dropped
+
+    dropped = asyncio.run(_drop())
+
+    return {"status": "completed", "dropped": dropped}
@@ -3,13 +3,14 @@ Pytest configuration and fixtures
 """
 import pytest
 import asyncio
+from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from httpx import AsyncClient
 
 from app.main import app
 from app.db.base import Base
-from app.db.session import get_db
+from app.db.session import get_db, get_session_factory
 from app.config import settings
 
 # Test database URL
@@ -53,7 +54,13 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     async def override_get_db():
         yield db_session
 
+    # Streaming list endpoints open their own session through this factory
+    @asynccontextmanager
+    async def override_session():
+        yield db_session
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: override_session
 
     async with AsyncClient(app=app, base_url="http://test") as client:
         yield client
@@ -58,7 +58,72 @@ async def test_list_content(client: AsyncClient, auth_headers, test_user, db_ses
 
     assert response.status_code == 200
     data = response.json()
-    assert len(data) == 2
+    assert len(data["items"]) == 2
+    assert data["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_list_content_pages_across_created_at_ties(
+    client: AsyncClient, auth_headers, test_user, db_session: AsyncSession
+):
+    """Test that rows sharing a created_at are not skipped at a page boundary"""
+    from app.models.content import Content
+
+    # One transaction, so every row gets the same now() created_at
+    db_session.add_all([
+        Content(
+            user_id=test_user.id,
+            type="blog_post",
+            title=f"Post {i}",
+            body="Content",
+            status="draft"
+        )
+        for i in range(5)
+    ])
+    await db_session.commit()
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2}
+        if cursor is not None:
+            params["cursor"] = cursor
+        response = await client.get("/api/v1/content", headers=auth_headers, params=params)
+        assert response.status_code == 200
+        data = response.json()
+        seen.extend(item["id"] for item in data["items"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert len(seen) == 5
+    assert len(set(seen)) == 5
+
+
+@pytest.mark.asyncio
+async def test_list_content_rejects_invalid_cursor(client: AsyncClient, auth_headers, test_user):
+    """Test that a malformed cursor is a client error"""
+    response = await client.get(
+        "/api/v1/content",
+        headers=auth_headers,
+        params={"cursor": "not-a-cursor"}
+    )
+
+    assert response.status_code == 400
+
+
+def test_cursor_is_url_safe():
+    """Test cursors survive a query string without percent-encoding"""
+    from datetime import datetime, timezone
+    from uuid import uuid4
+    from app.core.pagination import decode_cursor, encode_cursor
+
+    created_at = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+    row_id = uuid4()
+    cursor = encode_cursor(created_at, row_id)
+
+    assert not set(cursor) & set("+/=|: ")
+    assert decode_cursor(cursor) == (created_at, row_id)
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,83 @@
+"""
+Tests for webhook endpoints.
+"""
+import hashlib
+import hmac
+import time
+
+import pytest
+from httpx import AsyncClient
+
+from app.api.v1.webhooks import STRIPE_SIGNATURE_TOLERANCE, verify_stripe_signature
+
+SECRET = "whsec_test"
+PAYLOAD = b'{"id": "evt_test", "type": "customer.subscription.updated"}'
+
+
+def sign(payload: bytes, secret: str = SECRET, timestamp: int = None) -> tuple:
+    """Build a v1 signature the way Stripe does"""
+    timestamp = int(time.time()) if timestamp is None else timestamp
+    signature = hmac.new(
+        secret.encode(), f"{timestamp}.".encode() + payload, hashlib.sha256
+    ).hexdigest()
+    return timestamp, signature
+
+
+def test_stripe_signature_valid():
+    """Test a correctly signed payload is accepted"""
+    timestamp, signature = sign(PAYLOAD)
+
+    assert verify_stripe_signature(PAYLOAD, f"t={timestamp},v1={signature}", SECRET)
+
+
+def test_stripe_signature_wrong_secret():
+    """Test a payload signed with another secret is rejected"""
+    timestamp, signature = sign(PAYLOAD, secret="whsec_other")
+
+    assert not verify_stripe_signature(PAYLOAD, f"t={timestamp},v1={signature}", SECRET)
+
+
+def test_stripe_signature_tampered_payload():
+    """Test a signature does not cover a modified body"""
+    timestamp, signature = sign(PAYLOAD)
+
+    assert not verify_stripe_signature(PAYLOAD + b" ", f"t={timestamp},v1={signature}", SECRET)
+
+
+def test_stripe_signature_expired_timestamp():
+    """Test signatures older than the tolerance are rejected"""
+    timestamp, signature = sign(
+        PAYLOAD, timestamp=int(time.time()) - STRIPE_SIGNATURE_TOLERANCE - 10
+    )
+
+    assert not verify_stripe_signature(PAYLOAD, f"t={timestamp},v1={signature}", SECRET)
+
+
+@pytest.mark.parametrize("header", [None, "", "v1=abc", "t=123", "t=,v1=abc", "t=abc,v1=abc"])
+def test_stripe_signature_malformed_header(header):
+    """Test headers missing a t or v1 item are rejected"""
+    assert not verify_stripe_signature(PAYLOAD, header, SECRET)
+
+
+def test_stripe_signature_multiple_v1_values():
+    """Test any matching v1 signature is accepted, as during secret rotation"""
+    timestamp, signature = sign(PAYLOAD)
+    _, old_signature = sign(PAYLOAD, secret="whsec_old", timestamp=timestamp)
+
+    header = f"t={timestamp},v1={old_signature},v1={signature}"
+    assert verify_stripe_signature(PAYLOAD, header, SECRET)
+
+    header = f"t={timestamp},v1={old_signature},v1={'0' * 64}"
+    assert not verify_stripe_signature(PAYLOAD, header, SECRET)
+
+
+@pytest.mark.asyncio
+async def test_clickbank_ipn_rejects_malformed_json(client: AsyncClient):
+    """Test a malformed JSON IPN returns 400 instead of a server error"""
+    response = await client.post(
+        "/api/v1/webhooks/clickbank/ipn",
+        content=b"{not json",
+        headers={"Content-Type": "application/json"}
+    )
+
+    assert response.status_code == 400
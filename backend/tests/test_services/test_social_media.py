@@ -0,0 +1,81 @@
+"""
+Tests for social media request retries.
+"""
+import httpx
+import pytest
+
+from app.services import social_media
+from app.services.social_media import SocialPlatformService, retryable_status_codes
+
+
+@pytest.fixture(autouse=True)
+def no_retry_wait(monkeypatch):
+    """Retry immediately instead of backing off"""
+    monkeypatch.setattr(social_media, "_retry_wait", lambda retry_state: 0)
+
+
+def make_service(statuses):
+    """Service whose client answers with the given status codes in order"""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        return httpx.Response(statuses[min(len(calls), len(statuses)) - 1])
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return SocialPlatformService(client), calls
+
+
+def test_idempotent_methods_retry_server_errors():
+    """Test GET and DELETE retry every retryable 5xx"""
+    for method in ("GET", "delete"):
+        assert retryable_status_codes(method) == {429, 500, 502, 503, 504}
+
+
+def test_post_retries_only_refused_work():
+    """Test POST retries only rate limits and unavailable responses"""
+    assert retryable_status_codes("POST") == {429, 503}
+
+
+@pytest.mark.asyncio
+async def test_post_is_not_retried_on_500():
+    """Test a POST that may have been applied is sent once"""
+    service, calls = make_service([500, 200])
+
+    response = await service._request_with_retry("POST", "https://api.example.com/posts")
+
+    assert response.status_code == 500
+    assert calls == ["POST"]
+
+
+@pytest.mark.asyncio
+async def test_post_is_retried_on_429():
+    """Test a rate-limited POST is sent again"""
+    service, calls = make_service([429, 201])
+
+    response = await service._request_with_retry("POST", "https://api.example.com/posts")
+
+    assert response.status_code == 201
+    assert calls == ["POST", "POST"]
+
+
+@pytest.mark.asyncio
+async def test_get_is_retried_on_502():
+    """Test an idempotent request retries server errors"""
+    service, calls = make_service([502, 200])
+
+    response = await service._request_with_retry("GET", "https://api.example.com/me")
+
+    assert response.status_code == 200
+    assert calls == ["GET", "GET"]
+
+
+@pytest.mark.asyncio
+async def test_last_response_returned_when_attempts_run_out():
+    """Test the final retryable response is returned after the last attempt"""
+    service, calls = make_service([503])
+
+    response = await service._request_with_retry("POST", "https://api.example.com/posts")
+
+    assert response.status_code == 503
+    assert len(calls) == social_media.RETRY_MAX_ATTEMPTS
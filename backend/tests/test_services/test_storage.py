@@ -0,0 +1,57 @@
+"""
+Tests for upload size limiting.
+"""
+import io
+
+import pytest
+
+from app.services.storage import SizeLimitedReader, UploadTooLargeError
+
+
+class AsyncBytesIO:
+    """Minimal async file object over in-memory bytes"""
+
+    def __init__(self, data: bytes):
+        self._buffer = io.BytesIO(data)
+
+    async def read(self, size: int = -1) -> bytes:
+        return self._buffer.read(size)
+
+
+@pytest.mark.asyncio
+async def test_reads_up_to_the_limit():
+    """Test a file exactly at the limit is read in full"""
+    reader = SizeLimitedReader(AsyncBytesIO(b"x" * 10), max_size=10)
+
+    assert await reader.read(4) == b"xxxx"
+    assert await reader.read() == b"x" * 6
+    assert reader.bytes_read == 10
+
+
+@pytest.mark.asyncio
+async def test_rejects_file_over_the_limit():
+    """Test reading past the limit raises UploadTooLargeError"""
+    reader = SizeLimitedReader(AsyncBytesIO(b"x" * 11), max_size=10)
+
+    assert await reader.read(8) == b"x" * 8
+    with pytest.raises(UploadTooLargeError):
+        await reader.read(8)
+
+
+@pytest.mark.asyncio
+async def test_no_limit_reads_everything():
+    """Test a reader without max_size only counts bytes"""
+    reader = SizeLimitedReader(AsyncBytesIO(b"x" * 1024))
+
+    assert await reader.read() == b"x" * 1024
+    assert reader.bytes_read == 1024
+
+
+@pytest.mark.asyncio
+async def test_wraps_sync_file_objects():
+    """Test a plain file object with a sync read() is limited the same way"""
+    reader = SizeLimitedReader(io.BytesIO(b"x" * 11), max_size=10)
+
+    assert await reader.read(10) == b"x" * 10
+    with pytest.raises(UploadTooLargeError):
+        await reader.read()
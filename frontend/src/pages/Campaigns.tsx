@@ -4,15 +4,15 @@ import { Card, CardContent, CardDescription, CardHeader, CardTitle } from '../co
 import { Button } from '../components/ui/button'
 import { Table, TableBody, TableCell, TableHead, TableHeader, TableRow } from '../components/ui/table'
 import { Plus } from 'lucide-react'
-import type { Campaign } from '../services/types'
+import type { Campaign, Page } from '../services/types'
 import { formatDate } from '../lib/utils'
 
 export default function Campaigns() {
   const { data: campaigns, isLoading } = useQuery({
     queryKey: ['campaigns'],
     queryFn: async () => {
-      const response = await api.get<Campaign[]>('/campaigns')
-      return response.data
+      const response = await api.get<Page<Campaign>>('/campaigns')
+      return response.data.items
     },
   })
 
@@ -5,6 +5,7 @@ import { Card } from '@/components/ui/card'
 import { Button } from '@/components/ui/button'
 import { Input } from '@/components/ui/input'
 import { Label } from '@/components/ui/label'
+import type { Page } from '@/services/types'
 
 interface ContentItem {
   id: string
@@ -26,8 +27,8 @@ export default function Content() {
   const { data: contentList, isLoading } = useQuery<ContentItem[]>({
     queryKey: ['content'],
     queryFn: async () => {
-      const response = await api.get('/content')
-      return response.data
+      const response = await api.get<Page<ContentItem>>('/content')
+      return response.data.items
     },
   })
 
@@ -63,7 +63,8 @@ export interface ProductSearchParams {
   min_commission?: number
   has_rebill?: boolean
   limit?: number
-  offset?: number
+  cursor_gravity?: number
+  cursor_id?: string
 }
 
 // Campaign types
@@ -149,6 +150,12 @@ export interface Workflow {
   updated_at: string
 }
 
+// Keyset-paginated list response
+export interface Page<T> {
+  items: T[]
+  next_cursor: string | null
+}
+
 // API Error
 export interface ApiError {
   detail: string